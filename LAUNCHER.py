@@ -2,10 +2,11 @@ import pygame
 import pygame_gui
 import json
 import os
+import platform
 from typing import Dict, Any
 
 class GameLauncher:
-    """Game launcher with resolution, fullscreen, and framerate settings"""
+    """Game launcher with resolution, fullscreen, framerate and physics settings"""
     
     def __init__(self):
         pygame.init()
@@ -32,8 +33,14 @@ class GameLauncher:
             'height': 600,
             'fullscreen': False,
             'framerate': 60,
-            'vsync': False
+            'vsync': False,
+            'physics_threading': 'auto',
+            'threaded_simulation': False
         }
+
+        # Pymunk's threaded solver doesn't exist on Windows
+        self.physics_threading_options = ['auto', 'on', 'off']
+        self.threaded_physics_available = platform.system() != "Windows"
         
         # Load existing settings if they exist
         self.load_settings()
@@ -188,6 +195,34 @@ class GameLauncher:
             manager=self.ui_manager
         )
         
+        # Physics threading toggle
+        pygame_gui.elements.UILabel(
+            relative_rect=pygame.Rect(50, 365, 250, 35),
+            text="Threaded Physics:",
+            manager=self.ui_manager
+        )
+
+        self.physics_threading_button = pygame_gui.elements.UIButton(
+            relative_rect=pygame.Rect(320, 365, 120, 35),
+            text=self.get_physics_threading_text(),
+            manager=self.ui_manager
+        )
+        if not self.threaded_physics_available:
+            self.physics_threading_button.disable()
+
+        # Simulation thread toggle
+        pygame_gui.elements.UILabel(
+            relative_rect=pygame.Rect(460, 365, 180, 35),
+            text="Sim Thread:",
+            manager=self.ui_manager
+        )
+
+        self.threaded_simulation_button = pygame_gui.elements.UIButton(
+            relative_rect=pygame.Rect(640, 365, 110, 35),
+            text="ON" if self.settings['threaded_simulation'] else "OFF",
+            manager=self.ui_manager
+        )
+        
         # Control buttons - increased size and spacing
         self.launch_button = pygame_gui.elements.UIButton(
             relative_rect=pygame.Rect(self.launcher_width//2 - 220, 420, 140, 60),
@@ -249,7 +284,14 @@ class GameLauncher:
         
         return f"""<b>Current Settings:</b><br>
 Resolution: {self.settings['width']}x{self.settings['height']} ({aspect_ratio}) - {fullscreen_text}<br>
-Framerate: {self.settings['framerate']} FPS{vsync_note}"""
+Framerate: {self.settings['framerate']} FPS{vsync_note}<br>
+Threaded Physics: {self.get_physics_threading_text()} - Sim Thread: {"ON" if self.settings['threaded_simulation'] else "OFF"}"""
+
+    def get_physics_threading_text(self) -> str:
+        """Get the label for the physics threading setting"""
+        if not self.threaded_physics_available:
+            return "N/A"
+        return self.settings['physics_threading'].upper()
     
     def load_settings(self):
         """Load settings from file if it exists"""
@@ -303,6 +345,21 @@ Framerate: {self.settings['framerate']} FPS{vsync_note}"""
         self.vsync_button.set_text("ON" if self.settings['vsync'] else "OFF")
         self.update_settings_display()
     
+    def toggle_physics_threading(self):
+        """Cycle the physics threading setting through auto, on and off"""
+        options = self.physics_threading_options
+        current = self.settings['physics_threading']
+        next_index = (options.index(current) + 1) % len(options) if current in options else 0
+        self.settings['physics_threading'] = options[next_index]
+        self.physics_threading_button.set_text(self.get_physics_threading_text())
+        self.update_settings_display()
+    
+    def toggle_threaded_simulation(self):
+        """Toggle stepping levels on their own thread"""
+        self.settings['threaded_simulation'] = not self.settings['threaded_simulation']
+        self.threaded_simulation_button.set_text("ON" if self.settings['threaded_simulation'] else "OFF")
+        self.update_settings_display()
+    
     def update_framerate(self, value: float):
         """Update framerate from slider"""
         framerate = int(value)
@@ -386,6 +443,10 @@ Framerate: {self.settings['framerate']} FPS{vsync_note}"""
                             self.toggle_fullscreen()
                         elif event.ui_element == self.vsync_button:
                             self.toggle_vsync()
+                        elif event.ui_element == self.physics_threading_button:
+                            self.toggle_physics_threading()
+                        elif event.ui_element == self.threaded_simulation_button:
+                            self.toggle_threaded_simulation()
                         elif event.ui_element == self.launch_button:
                             self.launch_game()
                             return  # Exit launcher after launching game
@@ -0,0 +1,229 @@
+import pygame, os, threading, itertools
+
+# Loaded assets shared by the whole game. Images, sounds and fonts are loaded from disk
+# once and handed out to everyone asking for the same path; scaled and flipped images and
+# sounds at other volumes are variants kept next to the asset they come from.
+
+class AssetCache:
+    """
+    Memoises loaded and converted surfaces by path, their scaled and flipped variants by
+    (path, size, flags), decoded sounds and fonts. Assets asked for with a scope belong to it
+    and are dropped when the scope is released, unless something outside the scope still
+    uses them; assets asked for without a scope are kept for the whole game. Cached assets
+    are shared, so they must not be drawn on or have their volume changed.
+    """
+    def __init__(self):
+        self._assets = {}  # Key -> (asset, estimated bytes)
+        self._scopes = {}  # Scope name -> keys of the assets it uses
+        self._pinned = set()  # Keys asked for without a scope
+        self._scope_ids = itertools.count(1)
+        self._memory_used = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()  # Levels are built on the prefetch thread too
+
+    @property
+    def asset_count(self):
+        """Get the number of cached assets"""
+        return len(self._assets)
+
+    @property
+    def memory_used(self):
+        """Get the estimated memory of the cached assets in bytes"""
+        return self._memory_used
+
+    @property
+    def hits(self):
+        """Get the number of lookups that found a cached asset"""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Get the number of lookups that had to load an asset"""
+        return self._misses
+
+    @property
+    def scopes(self):
+        """Get the names of the open scopes"""
+        with self._lock:
+            return list(self._scopes)
+
+    def open_scope(self, label):
+        """
+        Open a scope for assets that only live as long as something like a level.
+
+        Args:
+            label (str): Name the scope starts with, a number is added so every scope is unique
+
+        Returns:
+            str: Scope name to load assets into and to release
+        """
+        name = f"{label} #{next(self._scope_ids)}"
+        with self._lock:
+            self._scopes[name] = set()
+        return name
+
+    def scope_assets(self, name):
+        """
+        Get the assets a scope uses.
+
+        Args:
+            name (str): Scope name from open_scope
+
+        Returns:
+            list: (asset, estimated bytes) of each asset, variants sharing a counted asset have 0 bytes
+        """
+        with self._lock:
+            return [self._assets[key] for key in self._scopes.get(name, ()) if key in self._assets]
+
+    def release_scope(self, name):
+        """Drop the assets of a scope that no other scope uses and that weren't asked for without a scope"""
+        with self._lock:
+            keys = self._scopes.pop(name, None)
+            if not keys:
+                return
+            still_used = self._pinned.union(*self._scopes.values())
+            released = 0
+            freed = 0
+            for key in keys - still_used:
+                asset, size = self._assets.pop(key, (None, 0))
+                if asset is not None:
+                    released += 1
+                    freed += size
+            self._memory_used -= freed
+        print(f"Released {released} assets (~{freed // 1024} KB) of {name}")
+
+    def clear(self):
+        """Drop every cached asset"""
+        with self._lock:
+            self._assets.clear()
+            for keys in self._scopes.values():
+                keys.clear()
+            self._pinned.clear()
+            self._memory_used = 0
+
+    def _get(self, key, load, scope):
+        """Get a cached asset, loading it with load the first time, and note the scope using it"""
+        with self._lock:
+            entry = self._assets.get(key)
+            if entry is not None:
+                self._hits += 1
+                self._claim(key, scope)
+                return entry[0]
+
+        asset = load()
+        with self._lock:
+            self._misses += 1
+            entry = self._assets.get(key)
+            if entry is None:
+                # A variant that needed no transform is the asset it comes from, which is counted already
+                shared = any(cached is asset for cached, size in self._assets.values())
+                size = 0 if shared else self._estimate_size(asset)
+                self._assets[key] = (asset, size)
+                self._memory_used += size
+            else:
+                asset = entry[0]  # Loaded by another thread in the meantime
+            self._claim(key, scope)
+        return asset
+
+    def _claim(self, key, scope):
+        """Note that a scope, or the whole game if scope is None, uses an asset (lock held)"""
+        if scope is None:
+            self._pinned.add(key)
+        elif scope in self._scopes:
+            self._scopes[scope].add(key)
+        else:
+            self._scopes[scope] = {key}
+
+    @staticmethod
+    def _estimate_size(asset):
+        """Estimate the bytes an asset uses"""
+        if isinstance(asset, pygame.Surface):
+            return asset.get_width() * asset.get_height() * asset.get_bytesize()
+        if isinstance(asset, pygame.mixer.Sound):
+            frequency, sample_format, channels = pygame.mixer.get_init() or (44100, -16, 2)
+            return int(asset.get_length() * frequency * channels * abs(sample_format) // 8)
+        return 0
+
+    def image(self, path, size=None, scale=None, smooth=False, flip_x=False, flip_y=False, alpha=True, scope=None):
+        """
+        Get an image, loaded and converted the first time, optionally scaled and flipped.
+
+        Args:
+            path (str): Image file
+            size (tuple): Width and height to scale to
+            scale (float): Factor to scale the image by instead of a size
+            smooth (bool): Use smoothscale instead of scale
+            flip_x, flip_y (bool): Flip the image
+            alpha (bool): Convert with per-pixel alpha, otherwise a plain convert
+            scope (str): Scope from open_scope the image belongs to, None to keep it for the whole game
+
+        Returns:
+            pygame.Surface: The shared image
+        """
+        if size is None and scale is None and not flip_x and not flip_y:
+            return self._get(("image", path, alpha), lambda: self._load_image(path, alpha), scope)
+
+        size = tuple(int(value) for value in size) if size is not None else None
+        key = ("image", path, alpha, size, scale, smooth, flip_x, flip_y)
+        return self._get(key, lambda: self._transform(self.image(path, alpha=alpha, scope=scope),
+                                                      size, scale, smooth, flip_x, flip_y), scope)
+
+    @staticmethod
+    def _load_image(path, alpha):
+        """Load an image and convert it for the display, if there is one yet"""
+        image = pygame.image.load(path)
+        try:
+            return image.convert_alpha() if alpha else image.convert()
+        except pygame.error:
+            return image  # No display mode set yet
+
+    @staticmethod
+    def _transform(image, size, scale, smooth, flip_x, flip_y):
+        """Make a scaled and flipped variant of an image"""
+        if scale is not None:
+            size = (int(image.get_width() * scale), int(image.get_height() * scale))
+        if size is not None and size != image.get_size():
+            image = pygame.transform.smoothscale(image, size) if smooth else pygame.transform.scale(image, size)
+        if flip_x or flip_y:
+            image = pygame.transform.flip(image, flip_x, flip_y)
+        return image
+
+    def sound(self, path, volume=None, scope=None):
+        """
+        Get a sound, decoded the first time.
+
+        Args:
+            path (str): Sound file
+            volume (float): Volume of the sound; other volumes are copies of the decoded sound
+            scope (str): Scope from open_scope the sound belongs to, None to keep it for the whole game
+
+        Returns:
+            pygame.mixer.Sound: The shared sound
+        """
+        if volume is None:
+            return self._get(("sound", path), lambda: pygame.mixer.Sound(path), scope)
+        return self._get(("sound", path, volume), lambda: self._with_volume(self.sound(path, scope=scope), volume), scope)
+
+    @staticmethod
+    def _with_volume(sound, volume):
+        """Copy a sound with its own volume"""
+        sound = sound.copy()
+        sound.set_volume(volume)
+        return sound
+
+    def font(self, path, size, scope=None):
+        """
+        Get a font at a size, loaded the first time.
+
+        Args:
+            path (str): Font file, or None for pygame's default font
+            size (int): Font size
+            scope (str): Scope from open_scope the font belongs to, None to keep it for the whole game
+
+        Returns:
+            pygame.font.Font: The shared font
+        """
+        return self._get(("font", path, int(size)), lambda: pygame.font.Font(path, int(size)), scope)
+
+asset_cache = AssetCache()  # Shared by the whole game
@@ -0,0 +1,28 @@
+import pygame
+import os
+import sys
+
+# Offline bake step: parses every level's TMX once and writes the fast-loading
+# cache that PymunkLevel.load_tmx reads. Run again after editing maps in Tiled,
+# although stale caches are also detected and rebuilt automatically.
+
+# Main entry point
+if __name__ == "__main__":
+    # Everything lives under the guard since the level build pool re-imports this module in its workers
+    pygame.init()
+    # pytmx converts tile images, which needs a display surface
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    from levels import levels, bake_level, level_cache
+
+    # Bake the given TMX files, or every level if none are given
+    tmx_maps = sys.argv[1:] or levels
+
+    for tmx_map in tmx_maps:
+        if not os.path.exists(tmx_map):
+            print(f"Skipping {tmx_map}: file not found")
+            continue
+        bake_level(tmx_map)
+
+    print(f"Baked levels written to {level_cache.cache_dir}")
+    pygame.quit()
@@ -0,0 +1,120 @@
+import os
+import sys
+import time
+
+# Physics benchmark: steps piles of dynamic bodies on a tile floor with a plain
+# and a threaded PhysicsManager space, and prints the body count where the
+# threaded solver starts to win. PHYSICS_THREADED_MIN_BODIES in constants.py
+# should be set from its output on the machines we care about.
+#
+#   python bench_physics.py                 # Default body counts
+#   python bench_physics.py 100 400 1600    # Given body counts
+#   python bench_physics.py --index hash    # Spatial index to use: tree, hash or both
+
+BODY_RADIUS = 20
+TILE_SIZE = 64
+WARMUP_STEPS = 120  # Lets the pile settle so the timed steps are full of contacts
+TIMED_STEPS = 240
+MIN_SPEEDUP = 1.1  # Threading has to beat the plain space by this much to count, run to run noise is about 5%
+
+
+def build_scene(physics_manager, body_count):
+    """Fill a physics space with a walled tile floor and a pile of balls on it"""
+    import pymunk
+
+    columns = max(8, int(body_count ** 0.5) + 2)
+    width = columns * BODY_RADIUS * 2 + TILE_SIZE * 2
+    rows = body_count // columns + 1
+    floor_y = rows * BODY_RADIUS * 2 + TILE_SIZE * 4
+
+    # Level geometry as the game builds it, one static box per tile
+    for x in range(0, width, TILE_SIZE):
+        physics_manager.create_box(x, floor_y, TILE_SIZE, TILE_SIZE)
+    for y in range(0, floor_y, TILE_SIZE):
+        physics_manager.create_box(0, y, TILE_SIZE, TILE_SIZE)
+        physics_manager.create_box(width - TILE_SIZE, y, TILE_SIZE, TILE_SIZE)
+
+    for i in range(body_count):
+        body = pymunk.Body(1.0, pymunk.moment_for_circle(1.0, 0, BODY_RADIUS))
+        body.position = (TILE_SIZE + BODY_RADIUS + (i % columns) * BODY_RADIUS * 2 + (i // columns) % 2,
+                         TILE_SIZE + (i // columns) * BODY_RADIUS * 2)
+        shape = pymunk.Circle(body, BODY_RADIUS)
+        shape.friction = 0.5
+        physics_manager.space.add(body, shape)
+
+    return width, floor_y + TILE_SIZE
+
+
+def time_steps(threading, body_count, spatial_index):
+    """Average step time in milliseconds of a scene with the given threading and spatial index"""
+    from utils import PhysicsManager
+    from constants import PHYSICS_TIMESTEP
+
+    physics_manager = PhysicsManager(threading=threading)
+    width, height = build_scene(physics_manager, body_count)
+    tile_count = (width // TILE_SIZE) * (height // TILE_SIZE)
+    physics_manager.configure_spatial_index(width, height, tile_count, TILE_SIZE, strategy=spatial_index)
+
+    for i in range(WARMUP_STEPS):
+        physics_manager.step(PHYSICS_TIMESTEP)
+
+    start_time = time.perf_counter()
+    for i in range(TIMED_STEPS):
+        physics_manager.step(PHYSICS_TIMESTEP)
+    elapsed = time.perf_counter() - start_time
+
+    contacts = sum(len(arbiter.contact_point_set.points) for arbiter in
+                   _arbiters(physics_manager.space))
+    return elapsed * 1000 / TIMED_STEPS, contacts, physics_manager.threaded
+
+
+def _arbiters(space):
+    """Collect the arbiters of every dynamic body in a space"""
+    arbiters = {}
+    for body in space.bodies:
+        body.each_arbiter(lambda arbiter: arbiters.setdefault(id(arbiter), arbiter))
+    return list(arbiters.values())
+
+
+# Main entry point
+if __name__ == "__main__":
+    import pygame
+
+    # constants.py sets up pygame, which needs no window or sound here
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+    args = sys.argv[1:]
+    indices = ["tree"]
+    if "--index" in args:
+        position = args.index("--index")
+        indices = ["tree", "hash"] if args[position + 1] == "both" else [args[position + 1]]
+        del args[position:position + 2]
+    body_counts = [int(arg) for arg in args] or [25, 50, 100, 200, 400, 800, 1600]
+
+    print(f"{TIMED_STEPS} steps per run, times are per step ({os.cpu_count()} CPUs)")
+    for spatial_index in indices:
+        print(f"\nSpatial index: {spatial_index}")
+        print(f"{'bodies':>8} {'contacts':>9} {'plain ms':>9} {'threaded ms':>12} {'speedup':>8}")
+
+        # The crossover is where threading starts winning clearly and keeps winning
+        crossover = None
+        for body_count in body_counts:
+            plain_time, contacts, threaded = time_steps("off", body_count, spatial_index)
+            threaded_time, contacts, threaded = time_steps("on", body_count, spatial_index)
+            speedup = plain_time / threaded_time
+            print(f"{body_count:>8} {contacts:>9} {plain_time:>9.3f} {threaded_time:>12.3f} {speedup:>7.2f}x")
+            if not threaded or speedup < MIN_SPEEDUP:
+                crossover = None
+            elif crossover is None:
+                crossover = body_count
+
+        if not threaded:
+            print("Threaded physics isn't available on this platform")
+        elif crossover is None:
+            print("The threaded solver never won, keep PHYSICS_THREADING on auto with a high PHYSICS_THREADED_MIN_BODIES")
+        else:
+            print(f"The threaded solver wins from about {crossover} bodies (PHYSICS_THREADED_MIN_BODIES)")
+
+    pygame.quit()
@@ -1,5 +1,7 @@
 import pygame, pymunk, os, math, random
 from enum import Enum
+from utils import sprite_bakes, text_renderer
+from asset_cache import asset_cache
 
 class PurePymunkBall(pygame.sprite.Sprite):
     """Ball character using velocity changes for direct control, with pure Pymunk physics"""
@@ -27,17 +29,12 @@ class PurePymunkBall(pygame.sprite.Sprite):
         
         # Track previous velocity for bounce detection
         self._prev_velocity_y = 0
-        
-        # Add velocity callback to dampen only true bounces
-        self._physics.space.on_collision(
-            self._physics.collision_types["ball"], 
-            self._physics.collision_types["ground"],
-            self._physics.collision_types["switch"]
-        )
+        self._previous_position = self._body.position  # Body position before the last physics step
         
         self._jumped = False
 
         self._physics.space.add(self._body, self._shape)
+        self._physics.follow_active_layer(self._shape)
 
         # Visual properties
         self._radius = radius
@@ -70,17 +67,14 @@ class PurePymunkBall(pygame.sprite.Sprite):
 
     def _load_sounds(self):
         """Load sound effects for the ball"""
-        self._jump_sound = pygame.mixer.Sound(os.path.join("assets", "sounds", "jump.mp3"))
-        self._jump_sound.set_volume(0.5)
+        self._jump_sound = asset_cache.sound(os.path.join("assets", "sounds", "jump.mp3"), volume=0.5)
         self._jump_sound_played = False
         self._death_sound_played = False
-        self._death_sound = pygame.mixer.Sound(os.path.join("assets", "sounds", "explosion.mp3"))
-        self._death_sound.set_volume(0.5)
+        self._death_sound = asset_cache.sound(os.path.join("assets", "sounds", "explosion.mp3"), volume=0.5)
     
     def _setup_explosion_animation(self):
         """Setup explosion animation frames"""
-        og_explosion_images = [pygame.image.load(os.path.join("assets", "sprites", "kaboom", f"frame{i}.png")).convert_alpha() for i in range(1, 8)]
-        self._explosion_images = [pygame.transform.scale(image, (image.width * 2, image.height * 2)) for image in og_explosion_images]
+        self._explosion_images = [asset_cache.image(os.path.join("assets", "sprites", "kaboom", f"frame{i}.png"), scale=2) for i in range(1, 8)]
         self._explosion_frame = 0
 
     def _handle_collision(self, arbiter, space, data):
@@ -209,9 +203,43 @@ class PurePymunkBall(pygame.sprite.Sprite):
     def update_rotation(self):
         """Update sprite rotation to match physics body"""
         angle_degrees = self._body.angle * 57.29578
-        self._image = pygame.transform.rotate(self._original_image, -angle_degrees)
+        self._image = sprite_bakes.rotated(self._original_image, -angle_degrees)
         self._rect = self._image.get_rect(center=self._rect.center)
 
+    def save_position(self):
+        """Remember the body position before a physics step"""
+        self._previous_position = self._body.position
+
+    def interpolate(self, alpha):
+        """Place the sprite between the last two physics states"""
+        self._rect.center = self._previous_position.interpolate_to(self._body.position, alpha)
+
+    def respawn(self, x, y):
+        """Bring the ball back at a position, keeping its body, shape, sounds and explosion frames"""
+        self._body.position = (x, y)
+        self._body.velocity = (0, 0)
+        self._body.angle = 0
+        self._body.angular_velocity = 0
+        self._previous_position = self._body.position
+        if self._body.space is None:
+            self._physics.space.add(self._body, self._shape)
+            self._physics.follow_active_layer(self._shape)
+        else:
+            self._physics.space.reindex_shapes_for_body(self._body)
+
+        # Movement, sound and death state as a new ball has it
+        self._prev_velocity_y = 0
+        self._jumped = False
+        self._jump_sound_played = False
+        self._death_sound_played = False
+        self._is_dead = False
+        self._is_exploding = False
+        self._explosion_frame = 0
+        self._death_timer = 0
+        self._last_angle = 0
+        self._image = self._original_image.copy()
+        self._rect = self._image.get_rect(center=(x, y))
+
     def death(self):
         """Handle death animation and sound"""
         if self._is_exploding:
@@ -291,7 +319,7 @@ class NPCCharacter(pygame.sprite.Sprite):
     def _setup_font(self):
         """Set up font for the interaction indicator"""
         try:
-            self._font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 18)
+            self._font = asset_cache.font(os.path.join("assets", "Daydream.ttf"), 18)
         except:
             self._font = pygame.font.SysFont(None, 24)
     
@@ -343,28 +371,15 @@ class NPCCharacter(pygame.sprite.Sprite):
         # Get NPC's current position
         x, y = self._body.position
         
-        # Check for ground tiles below the NPC
-        ground_found = False
-        test_distance = self._ground_check_distance
-        
-        # Simple raycast downward
-        for check_y in range(int(y), int(y + test_distance), 10):
-            test_point = (x, check_y)
-            
-            # Check if there's any static shape at this point
-            for shape in level.static_shapes:
-                if shape.point_query(test_point).distance < 0:
-                    # Found ground, adjust position to just above it
-                    self._body.position = (x, check_y - self._radius - 2)  # -2 for small clearance
-                    self._rect.center = self._body.position
-                    ground_found = True
-                    break
-                    
-            if ground_found:
-                break
-                
-        if not ground_found:
+        # Look up the ground below the NPC
+        ground_y = level.physics.ground_below(x, y, self._ground_check_distance)
+        if ground_y is None:
             print(f"Warning: No ground found below NPC {self._name} at ({x}, {y})")
+            return
+            
+        # Adjust position to just above it
+        self._body.position = (x, ground_y - self._radius - 2)  # -2 for small clearance
+        self._rect.center = self._body.position
         
     def update(self, player=None, distance_threshold=500):
         """Update NPC state - optimized to only update when near player"""
@@ -416,6 +431,13 @@ class NPCCharacter(pygame.sprite.Sprite):
         else:
             self._is_talking = False
             return None
+
+    def reset_dialogue(self):
+        """Forget the conversation so far, for a level that is played again"""
+        self._current_dialogue_index = 0
+        self._is_talking = False
+        self._player_choices = None
+        self._dialogue_history = []
     
     def get_current_dialogue(self):
         """Get the current dialogue text"""
@@ -527,18 +549,14 @@ class BlueBall(NPCCharacter):
     def _load_sunglasses(self):
         """Load and apply sunglasses to the blue ball"""
         try:
-            self._glasses = pygame.image.load(os.path.join("assets", "sprites", "sunglasses.png")).convert_alpha()
-            
             # Resize glasses to fit the ball
-            glasses_width = int(self._glasses.get_width() * 2)
-            glasses_height = int(self._glasses.get_height() * 2)
-            self._glasses = pygame.transform.scale(self._glasses, (glasses_width, glasses_height))
+            self._glasses = asset_cache.image(os.path.join("assets", "sprites", "sunglasses.png"), scale=2)
             
             # Create a copy of the original image to draw glasses on
             self._image = self._original_image.copy()
             
             # Position the glasses on the upper part of the ball's face
-            glasses_x = self._radius - glasses_width // 2
+            glasses_x = self._radius - self._glasses.get_width() // 2
             glasses_y = self._radius - int(self._radius * 1.3)  # Position slightly above center
             
             # Draw the glasses onto the ball
@@ -663,18 +681,15 @@ class SignNPC(pygame.sprite.Sprite):
     def _load_image(self):
         """Load sign image or create a fallback if image not found"""
         try:
-            self._image = pygame.image.load(os.path.join("assets", "sprites", "sign.png")).convert_alpha()
-            self._original_image = self._image.copy()
+            self._image = asset_cache.image(os.path.join("assets", "sprites", "sign.png"), size=(48, 48))  # Shared by every sign
         except:
             self._image = pygame.Surface((48, 48), pygame.SRCALPHA)
             pygame.draw.rect(self._image, (139, 69, 19), (10, 24, 28, 24))
             pygame.draw.rect(self._image, (160, 82, 45), (4, 4, 40, 20))
             pygame.draw.rect(self._image, (80, 41, 22), (4, 4, 40, 20), 2)
-            self._original_image = self._image.copy()
             print(f"Created fallback sign sprite for {self._name}")
 
-        self._image = pygame.transform.scale(self._image, (48, 48))
-        self._original_image = self._image.copy()
+        self._original_image = self._image
 
     def _setup_physics(self, physics, x, y):
         """Setup physics body and shape for the sign"""
@@ -693,8 +708,7 @@ class SignNPC(pygame.sprite.Sprite):
     def _create_sign_portrait(self):
         """Create a portrait image for the dialogue system"""
         try:
-            portrait = pygame.image.load(os.path.join("assets", "sprites", "sign_portrait.png")).convert_alpha()
-            return pygame.transform.scale(portrait, (84, 84))
+            return asset_cache.image(os.path.join("assets", "sprites", "sign_portrait.png"), size=(84, 84))
         except:
             portrait = pygame.Surface((84, 84), pygame.SRCALPHA)
 
@@ -773,8 +787,8 @@ class SignNPC(pygame.sprite.Sprite):
         else:
             self._rotation_angle = 0
 
-        rotated_image = pygame.transform.rotate(self._original_image, self._rotation_angle)
-        self._image = rotated_image
+        # Every sign shows the same picture, so they share the baked wobble frames
+        self._image = sprite_bakes.rotated(self._original_image, self._rotation_angle, "sign")
 
         if ball and hasattr(ball, 'body'):
             dx = self._body.position.x - ball.body.position.x
@@ -797,28 +811,24 @@ class SignNPC(pygame.sprite.Sprite):
 
         screen_rect = camera.apply_rect(indicator_rect)
 
-        pulse = (math.sin(self._animation_timer * 4) + 1) * 0.5
+        pulse = sprite_bakes.pulse_step((math.sin(self._animation_timer * 4) + 1) * 0.5)
         glow_size = 4 + int(pulse * 4)
 
         glow_color = (255, 255, 150, int(100 + 100 * pulse))
-        glow_surf = pygame.Surface((screen_rect.width + glow_size*2, screen_rect.height + glow_size*2), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surf, glow_color,
-                         (0, 0, screen_rect.width + glow_size*2, screen_rect.height + glow_size*2),
-                         0, 5 + glow_size)
+        glow_width, glow_height = screen_rect.width + glow_size*2, screen_rect.height + glow_size*2
+
+        def build_glow():
+            glow_surf = pygame.Surface((glow_width, glow_height), pygame.SRCALPHA)
+            pygame.draw.rect(glow_surf, glow_color, (0, 0, glow_width, glow_height), 0, 5 + glow_size)
+            return glow_surf
 
+        glow_surf = sprite_bakes.frame(("indicator glow", glow_width, glow_height, glow_color), build_glow)
         screen.blit(glow_surf, (screen_rect.x - glow_size, screen_rect.y - glow_size))
 
         pygame.draw.rect(screen, (50, 50, 50), screen_rect.inflate(10, 10), 0, 5)
         pygame.draw.rect(screen, (200, 200, 200), screen_rect.inflate(10, 10), 2, 5)
 
-        try:
-            font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 14)
-        except:
-            font = pygame.font.SysFont(None, 20)
-
-        text = font.render("E", True, (255, 255, 255))
-        text_rect = text.get_rect(center=screen_rect.center)
-        screen.blit(text, text_rect)
+        text_renderer.draw(screen, "E", 14, (255, 255, 255), center=screen_rect.center)
 
     def align_to_ground(self, level):
         """Align the sign to the ground to prevent floating"""
@@ -827,28 +837,10 @@ class SignNPC(pygame.sprite.Sprite):
 
         x, y = self._body.position
 
-        ground_found = False
-        test_distance = 200
-
-        for distance in range(10, test_distance, 10):
-            test_point = (x, y + distance)
-
-            sensor_body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
-            sensor_body.position = test_point
-            sensor_shape = pymunk.Circle(sensor_body, 5)
-            sensor_shape.sensor = True
-
-            hits = level.physics.space.shape_query(sensor_shape)
-
-            for hit in hits:
-                if hasattr(hit.shape, 'collision_type') and hit.shape.collision_type == level.physics.collision_types.get("ground", 0):
-                    self._body.position = (x, y + distance - 24)
-                    self._rect.center = (int(x), int(y + distance - 24))
-                    ground_found = True
-                    break
-
-            if ground_found:
-                break
+        ground_y = level.physics.ground_below(x, y, 200)
+        if ground_y is not None:
+            self._body.position = (x, ground_y - 24)
+            self._rect.center = (int(x), int(ground_y - 24))
 
     def can_interact(self, ball):
         """Check if the player can interact with this sign"""
@@ -874,6 +866,11 @@ class SignNPC(pygame.sprite.Sprite):
         print(f"Starting dialogue with sign: {self._name}")
         return self.get_current_dialogue()
 
+    def reset_dialogue(self):
+        """Forget the dialogue so far, for a level that is played again"""
+        self._current_dialogue_index = 0
+        self._dialogue_finished = False
+
     def handle_choice(self, choice_index):
         """Handle player's dialogue choice - for signs, there are no choices"""
         self._dialogue_finished = True  # Set the dialogue finished flag
@@ -991,6 +988,8 @@ class Cubodeez_The_Almighty_Cube(pygame.sprite.Sprite):
         
         # Add to physics space
         self.physics.space.add(self.body, self.shape)
+        self.physics.follow_active_layer(self.shape)
+        self._previous_position = self.body.position  # Body position before the last physics step
         
         # Setup collision handlers using new Pymunk 7.0.0 API
         self._setup_collision_handlers()
@@ -1037,9 +1036,9 @@ class Cubodeez_The_Almighty_Cube(pygame.sprite.Sprite):
         """Load sound effects with fallbacks"""
         try:
             self.sounds = {
-                'jump': pygame.mixer.Sound(os.path.join("assets", "sounds", "jump.mp3")), 
-                'land': pygame.mixer.Sound(os.path.join("assets", "sounds", "squish.mp3")),
-                'hurt': pygame.mixer.Sound(os.path.join("assets", "sounds", "boss_hurt.mp3"))
+                'jump': asset_cache.sound(os.path.join("assets", "sounds", "jump.mp3")), 
+                'land': asset_cache.sound(os.path.join("assets", "sounds", "squish.mp3")),
+                'hurt': asset_cache.sound(os.path.join("assets", "sounds", "boss_hurt.mp3"))
             }
         except:
             # Fallback empty sounds if files don't exist
@@ -1064,7 +1063,7 @@ class Cubodeez_The_Almighty_Cube(pygame.sprite.Sprite):
             # Always process collision normally
             return True
             
-        self.physics.space.on_collision(
+        self.physics.on_collision(
             self.collision_type, ball_type,
             begin=boss_player_collision_begin
         )
@@ -1076,7 +1075,7 @@ class Cubodeez_The_Almighty_Cube(pygame.sprite.Sprite):
                 boss_shape.boss_ref._handle_ground_collision(arbiter)
             return True
             
-        self.physics.space.on_collision(
+        self.physics.on_collision(
             self.collision_type, ground_type,
             begin=boss_ground_collision_begin
         )
@@ -1085,7 +1084,7 @@ class Cubodeez_The_Almighty_Cube(pygame.sprite.Sprite):
         def boss_launcher_collision_begin(arbiter, space, data):
             return self.on_hit_launcher(arbiter, space, data)
             
-        self.physics.space.on_collision(
+        self.physics.on_collision(
             self.physics.collision_types["square"],
             self.physics.collision_types["switch"],  # Use "switch" as in original
             begin=boss_launcher_collision_begin
@@ -1174,16 +1173,9 @@ class Cubodeez_The_Almighty_Cube(pygame.sprite.Sprite):
     def _check_ground_below(self):
         """Improved ground check using ray casting"""
         if not self.is_grounded and self.state != BossState.JUMPING:
-            # Cast ray downward from center of boss
-            start = self.body.position
-            end = (start.x, start.y + self.ground_check_distance)
-            
-            query = self.physics.space.segment_query_first(
-                start, end, 
-                0, pymunk.ShapeFilter(mask=self.physics.collision_types.get("ground", 2))
-            )
-            
-            if query and query.shape:
+            # Look for ground under the center of the boss, the ray down would hit the boss itself first
+            x, y = self.body.position
+            if self.physics.ground_below(x, y, self.ground_check_distance) is not None:
                 self._set_grounded(True)
 
     def _update_last_player_position(self):
@@ -1296,6 +1288,49 @@ class Cubodeez_The_Almighty_Cube(pygame.sprite.Sprite):
         # For now, just reset
         self.reset_to_spawn()
 
+    def snapshot(self):
+        """Get the boss's body and state machine state, to put it back with restore_snapshot"""
+        return {
+            "position": tuple(self.body.position),
+            "velocity": tuple(self.body.velocity),
+            "angle": self.body.angle,
+            "angular_velocity": self.body.angular_velocity,
+            "state": self.state,
+            "state_timer": self.state_timer,
+            "health": self.health,
+            "is_grounded": self.is_grounded,
+            "is_vulnerable": self.is_vulnerable,
+            "vulnerability_timer": self.vulnerability_timer,
+            "damage_taken_this_cycle": self.damage_taken_this_cycle,
+            "target_position": self.target_position
+        }
+
+    def restore_snapshot(self, snapshot):
+        """Put the boss back in a state taken with snapshot"""
+        self.body.position = snapshot["position"]
+        self.body.velocity = snapshot["velocity"]
+        self.body.angle = snapshot["angle"]
+        self.body.angular_velocity = snapshot["angular_velocity"]
+        self._previous_position = self.body.position
+        if self.body.space is not None:
+            self.physics.space.reindex_shapes_for_body(self.body)
+
+        self.state = snapshot["state"]
+        self.state_timer = snapshot["state_timer"]
+        self.health = snapshot["health"]
+        self.is_grounded = snapshot["is_grounded"]
+        self.is_vulnerable = snapshot["is_vulnerable"]
+        self.vulnerability_timer = snapshot["vulnerability_timer"]
+        self.damage_taken_this_cycle = snapshot["damage_taken_this_cycle"]
+        self.target_position = snapshot["target_position"]
+
+        # Effects of the moment don't come back
+        self.show_target_marker = False
+        self.target_locked = False
+        self.shake_timer = 0.0
+        self.flash_timer = 0.0
+        self.screen_shake_timer = 0.0
+
     def reset_to_spawn(self):
         """Reset boss to spawn position and state"""
         print("Resetting boss to spawn position")
@@ -1462,52 +1497,58 @@ class Cubodeez_The_Almighty_Cube(pygame.sprite.Sprite):
 
     def update_visuals(self):
         """Update visual effects and sprite appearance"""
-        # Start with base image
-        self.image = self.base_image.copy()
+        # The look only changes with the eye color and the flash, so each one is baked once
+        flashing = self.flash_timer > 0
+        self.image = sprite_bakes.frame((self.base_image, "eyes", self.eye_color, flashing),
+                                        lambda: self._build_frame(flashing))
         
         # Update rect position (no individual boss shake, screen shake handles this)
         self.rect.center = (self.body.position.x, self.body.position.y)
+
+    def _build_frame(self, flashing):
+        """Draw the boss with its current eye color, and flashing if vulnerable"""
+        # Start with base image
+        image = self.base_image.copy()
         
         # Draw eyes
-        self._draw_eyes()
+        self._draw_eyes(image)
         
         # Apply vulnerability flash
-        if self.flash_timer > 0:
+        if flashing:
             flash_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
             flash_surface.fill((255, 255, 255, 100))
-            self.image.blit(flash_surface, (0, 0))
+            image.blit(flash_surface, (0, 0))
+        return image
 
-    def _draw_eyes(self):
+    def _draw_eyes(self, image):
         """Draw the boss eyes with current color"""
         eye_size = self.size // 8
         eye_y = self.size // 3
         
         # Left eye
-        pygame.draw.rect(self.image, self.eye_color,
+        pygame.draw.rect(image, self.eye_color,
                         (self.size // 4 - eye_size // 2, eye_y, eye_size, eye_size * 2))
         
         # Right eye  
-        pygame.draw.rect(self.image, self.eye_color,
+        pygame.draw.rect(image, self.eye_color,
                         (3 * self.size // 4 - eye_size // 2, eye_y, eye_size, eye_size * 2))
         
         # Angry eyebrows
         eyebrow_thickness = max(2, self.size // 40)
-        pygame.draw.line(self.image, (0, 0, 0),
+        pygame.draw.line(image, (0, 0, 0),
                         (self.size // 4 - eye_size, eye_y - 5),
                         (self.size // 4 + eye_size, eye_y - 8),
                         eyebrow_thickness)
-        pygame.draw.line(self.image, (0, 0, 0),
+        pygame.draw.line(image, (0, 0, 0),
                         (3 * self.size // 4 - eye_size, eye_y - 8),
                         (3 * self.size // 4 + eye_size, eye_y - 5),
                         eyebrow_thickness)
 
-    def update(self):
-        """Main update method"""
+    def update(self, dt=1/60):
+        """Main update method, run once per physics step"""
         if not self.target:
             return
         
-        dt = 1/60  # Assuming 60 FPS
-        
         # Update screen shake timer
         if self.screen_shake_timer > 0:
             self.screen_shake_timer -= dt
@@ -1527,6 +1568,14 @@ class Cubodeez_The_Almighty_Cube(pygame.sprite.Sprite):
         if self.body.position.y > getattr(self.physics, 'level_height', 2000) + 500:
             self.reset_to_spawn()
 
+    def save_position(self):
+        """Remember the body position before a physics step"""
+        self._previous_position = self.body.position
+
+    def interpolate(self, alpha):
+        """Place the sprite between the last two physics states"""
+        self.rect.center = self._previous_position.interpolate_to(self.body.position, alpha)
+
     def draw(self, screen, camera):
         """Draw the boss and related visual elements"""
         # Draw target marker if visible
@@ -20,4 +20,66 @@ TARGET_FPS = 60
 FULLSCREEN = False
 VSYNC = True
 
-daFont = os.path.join("assets", "Daydream.ttf")
\ No newline at end of file
+daFont = os.path.join("assets", "Daydream.ttf")
+
+# Pre-rendered tile chunks (see ChunkRenderer)
+CHUNK_SIZE = 1024
+CHUNK_MEMORY_CAP_MB = 96
+CHUNK_BUILD_ATTEMPTS = 3  # Builds of a chunk that may fail before it is drawn tile by tile for good
+
+# Rendered HUD and menu text (see TextRenderer)
+TEXT_CACHE_ENTRIES = 256
+GLYPH_ATLAS_ENTRIES = 32  # Font size, colour and outline combinations kept as glyph atlases
+GLYPH_ATLAS_CHARACTERS = "0123456789:.,/%+- ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+# Baked sprite frames (see SpriteBakes)
+SPRITE_BAKE_ANGLES = 128  # Rotations baked over a full turn
+SPRITE_BAKE_PULSE_STEPS = 16  # Pulsing effects are baked for this many steps
+SPRITE_BAKE_MEMORY_CAP_MB = 32
+
+# Coins (see CoinField)
+COIN_CELL_SIZE = 256  # Collection and drawing only look at coins in the cells around the ball and the screen
+COIN_SPIN_FRAMES = 24  # Frames baked over half a turn of the spin
+COIN_FADE_STEPS = 8  # Alpha steps of the collection fade
+
+# Pooled boss fight effects (see EntityPool)
+EXPLOSION_POOL_SIZE = 8  # Made when the boss arena loads
+EXPLOSION_POOL_MAX_LIVE = 16
+ROCKET_POOL_SIZE = 4
+ROCKET_POOL_MAX_LIVE = 8
+
+# Streaming of large levels in square regions (see RegionStreamer)
+STREAM_LEVELS = True
+STREAM_MIN_REGIONS = 12  # Levels with fewer regions than this are loaded whole
+STREAM_REGION_SIZE = 2048  # Keep this a multiple of CHUNK_SIZE
+STREAM_LOAD_RADIUS = 1  # Regions around the ball that are kept loaded
+STREAM_UNLOAD_RADIUS = 2  # Regions are only dropped past this, so crossing a border doesn't thrash
+
+# Parallel level build (see level_build.py)
+LEVEL_BUILD_WORKERS = max(1, (os.cpu_count() or 1) - 1)  # Worker processes, 1 builds on the loading thread
+LEVEL_BUILD_BLOCK_TILES = 32  # Collision is traced in blocks of this many tiles square
+
+# Trigger volumes for finish lines, music switches, checkpoints and loop switches (see TriggerVolumes)
+TRIGGER_CELL_SIZE = 256
+
+# Built levels kept in memory: prefetched ones and the ones the player left (see LevelPrefetcher)
+PREFETCH_MAX_LEVELS = 3
+PREFETCH_MEMORY_BUDGET_MB = 384
+PREFETCH_HOVER_DELAY = 0.3  # Seconds a level select tile has to stay hovered before it is prefetched
+
+# Fixed timestep simulation (see FixedTimestep)
+PHYSICS_TIMESTEP = 1.0 / 60.0  # Seconds of simulation per physics step, whatever the framerate
+PHYSICS_MAX_STEPS = 5  # Most physics steps run in one frame, time beyond that is dropped so slow frames can't snowball
+PHYSICS_MIN_SUBSTEPS = 1
+PHYSICS_MAX_SUBSTEPS = 8
+PHYSICS_FEATURE_SIZE = 64  # Thinnest collision feature in pixels, a tile
+PHYSICS_SUBSTEP_TRAVEL = 0.25  # Fraction of the thinnest feature a body may move in one substep
+PHYSICS_SPATIAL_INDEX = "auto"  # "tree", "hash" or "auto" to hash levels with many tiles
+PHYSICS_SPATIAL_HASH_MIN_TILES = 2000
+PHYSICS_GROUND_COLUMN = 8  # Width in pixels of a ground heightfield column (see GroundHeightfield)
+
+# Threaded physics solver, not available on Windows (see PhysicsManager and bench_physics.py)
+PHYSICS_THREADING = "auto"  # "on", "off" or "auto" to thread only spaces with enough bodies to benefit
+PHYSICS_THREADS = 2  # Pymunk uses at most 2
+PHYSICS_THREADED_MIN_BODIES = 800  # Step time crossover of the threaded solver, re-measure with bench_physics.py
+SIMULATION_THREAD = False  # Step levels on their own thread apart from rendering (see SimulationThread)
\ No newline at end of file
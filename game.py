@@ -1,7 +1,8 @@
-import pygame, pygame_gui, os, random, objects, threading, time, json
+import pygame, pygame_gui, os, random, objects, threading, time, json, contextlib, functools
 from constants import *
-from levels import SpaceLevel, CaveLevel, PymunkLevel, levels, spawn_points, BossArena
-from utils import PhysicsManager, SceneManager, MapSystem, GameSave
+from levels import SpaceLevel, CaveLevel, PymunkLevel, levels, spawn_points, BossArena, create_level, LevelPrefetcher
+from utils import PhysicsManager, SceneManager, MapSystem, GameSave, SimulationThread, text_renderer
+from asset_cache import asset_cache
 
 class Game:
     def __init__(self, settings=None):
@@ -30,6 +31,13 @@ class Game:
         # Set framerate settings
         self._target_fps = settings.get('framerate', 60)
         self._use_vsync = settings.get('vsync', True)
+
+        # Physics spaces created from now on follow the threading setting
+        PhysicsManager.threading_mode = settings.get('physics_threading', PHYSICS_THREADING)
+
+        # Levels can step on their own thread while the main thread renders
+        self._threaded_simulation = settings.get('threaded_simulation', SIMULATION_THREAD)
+        self._sim_thread = None
         
         # IMPORTANT: Load the music AFTER mixer initialization
         try:
@@ -49,6 +57,12 @@ class Game:
         
         self._game_save = GameSave()  # Initialize game save system
 
+        # Builds the level the player is likely to pick next while they are still deciding
+        self._prefetcher = LevelPrefetcher(self._game_save)
+        self._prefetch_candidate = None
+        self._prefetch_candidate_since = 0
+        self._results_prefetched = False
+
         self._setup_autosave_warning()
 
         self._player_has_map = False
@@ -97,13 +111,13 @@ class Game:
         self._fade_duration = 1.0  # 1 second for fades
 
         # Load logo
-        self._logo_image = pygame.image.load(os.path.join("assets", "Migglesoft.png")).convert_alpha()
+        self._logo_image = asset_cache.image(os.path.join("assets", "Migglesoft.png"))
 
         # Load title once to reuse
-        self._title_text = pygame.image.load(os.path.join("assets", "title.png")).convert_alpha()
+        self._title_text = asset_cache.image(os.path.join("assets", "title.png"))
 
         pygame.display.set_caption("Red Ball: REDUX!")
-        pygame.display.set_icon(pygame.image.load(os.path.join("assets", "sprites", "Red Ball portrait.png")).convert_alpha())
+        pygame.display.set_icon(asset_cache.image(os.path.join("assets", "sprites", "Red Ball portrait.png")))
 
         # Add variables for flashing text
         self._flash_timer = 0
@@ -115,6 +129,7 @@ class Game:
         self._map_key_pressed = False  # Track M key state to avoid repeat toggling
 
         self._level_images = {}  # Dictionary to store level images
+        self._level_select_scope = asset_cache.open_scope("level select")  # Thumbnail sizes, released when it closes
         self._scroll_offset = 0
         self._target_scroll = 0
         self._selected_level = 0
@@ -149,7 +164,9 @@ class Game:
             'height': 720,
             'fullscreen': False,
             'framerate': 60,
-            'vsync': True
+            'vsync': True,
+            'physics_threading': PHYSICS_THREADING,
+            'threaded_simulation': SIMULATION_THREAD
         }
         
         try:
@@ -209,7 +226,7 @@ class Game:
         for i in range(1, 5):  # Assuming files are named loading1.png, loading2.png, etc.
             try:
                 frame_path = os.path.join("assets", "sprites", "loading screen", f"{i}.png")
-                frame = pygame.image.load(frame_path).convert_alpha()
+                frame = asset_cache.image(frame_path)
                 self._loading_frames.append(frame)
                 print(f"Loaded loading frame: {frame_path}")
             except pygame.error as e:
@@ -316,37 +333,19 @@ class Game:
         
         # Draw each line with fade effect
         for i, line in enumerate(lines):
-            # Create text surface
-            text_surface = self._small_font.render(line, True, (255, 255, 255))
+            # Text with a subtle glow around it for better visibility
+            text_surface = text_renderer.render(line, 15, (255, 255, 255), (50, 50, 50))
             
-            # Apply alpha if fading
+            # Apply alpha if fading; rendered text is shared, so fade a copy
             if self._tip_fade_alpha < 255:
-                # Create a surface with per-pixel alpha
-                faded_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-                faded_surface.fill((255, 255, 255, self._tip_fade_alpha))
-                faded_surface.blit(text_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                text_surface = faded_surface
+                text_surface = text_surface.copy()
+                text_surface.set_alpha(self._tip_fade_alpha)
             
-            # Center the line horizontally
+            # Center the line horizontally, the glow pads it by a pixel
             text_rect = text_surface.get_rect()
             text_rect.centerx = SCREEN_WIDTH // 2
-            text_rect.y = start_y + (i * line_height)
-            
-            # Add subtle glow effect for better visibility
-            for offset in [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]:
-                glow_surface = self._small_font.render(line, True, (50, 50, 50))
-                if self._tip_fade_alpha < 255:
-                    glow_faded = pygame.Surface(glow_surface.get_size(), pygame.SRCALPHA)
-                    glow_faded.fill((50, 50, 50, self._tip_fade_alpha // 3))
-                    glow_faded.blit(glow_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                    glow_surface = glow_faded
-                
-                glow_rect = text_rect.copy()
-                glow_rect.x += offset[0]
-                glow_rect.y += offset[1]
-                self._screen.blit(glow_surface, glow_rect)
+            text_rect.y = start_y + (i * line_height) - 1
             
-            # Draw the main text
             self._screen.blit(text_surface, text_rect)
 
     def _draw_loading_icon(self):
@@ -385,17 +384,8 @@ class Game:
         self._screen.blit(scaled_frame, (x, y))
         
         # Add "Loading..." text with glow effect
-        loading_text = self._menu_font.render("Loading...", True, (255, 255, 255))
-        text_x = x - loading_text.get_width() - 20
-        text_y = y + (scaled_frame.get_height() // 2) - (loading_text.get_height() // 2)
-        
-        # Text glow effect
-        for offset in [(-2, -2), (-2, 0), (-2, 2), (0, -2), (0, 2), (2, -2), (2, 0), (2, 2)]:
-            glow_text = self._menu_font.render("Loading...", True, (100, 100, 100))
-            self._screen.blit(glow_text, (text_x + offset[0], text_y + offset[1]))
-        
-        # Main text
-        self._screen.blit(loading_text, (text_x, text_y))
+        text_renderer.draw(self._screen, "Loading...", 24, (255, 255, 255), (100, 100, 100), 2,
+                           midright=(x - 20, y + scaled_frame.get_height() // 2))
         
         # Draw loading tips if available
         self._draw_loading_tip()
@@ -420,12 +410,10 @@ class Game:
             try:
                 # Load the image
                 print(f"Loading background layer: {path}")
-                image = pygame.image.load(path).convert_alpha()
-
                 # Scale slightly larger to allow movement without showing edges
                 scaled_width = int(SCREEN_WIDTH * 1.1)
                 scaled_height = int(SCREEN_HEIGHT * 1.1)
-                scaled_image = pygame.transform.scale(image, (scaled_width, scaled_height))
+                scaled_image = asset_cache.image(path, size=(scaled_width, scaled_height))
 
                 # Store layer information: image, center position, and speed factor
                 center_x = (scaled_width - SCREEN_WIDTH) / 2
@@ -489,9 +477,9 @@ class Game:
     def _setup_fonts(self):
         """Load game fonts with fallback to system fonts if needed"""
         try:
-            self._pixel_font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 32)
-            self._small_font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 15)
-            self._menu_font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 24)
+            self._pixel_font = asset_cache.font(os.path.join("assets", "Daydream.ttf"), 32)
+            self._small_font = asset_cache.font(os.path.join("assets", "Daydream.ttf"), 15)
+            self._menu_font = asset_cache.font(os.path.join("assets", "Daydream.ttf"), 24)
         except pygame.error as e:
             print(f"Error loading font: {e}")
             # Fallback to default font
@@ -592,7 +580,7 @@ class Game:
         for i in range(1, 5):  # Assuming files are named 1.png, 2.png, 3.png, 4.png
             try:
                 frame_path = os.path.join("assets", "sprites", "loading screen", f"{i}.png")
-                frame = pygame.image.load(frame_path).convert_alpha()
+                frame = asset_cache.image(frame_path)
                 self._autosave_loading_frames.append(frame)
                 print(f"Loaded autosave loading frame: {frame_path}")
             except pygame.error as e:
@@ -635,21 +623,18 @@ class Game:
         # Fill screen with black background
         self._screen.fill((0, 0, 0))
         
-        # Prepare text surfaces
+        # Prepare text surfaces, each with a glow around it (different glow for the title)
         text_surfaces = []
         line_heights = []
         
         for i, line in enumerate(self._autosave_warning_text):
             if i == 0:  # First line - title
-                font = self._menu_font if hasattr(self, '_menu_font') else pygame.font.Font(None, 48)
-                color = (255, 255, 100)  # Yellow for emphasis
+                text_surface = text_renderer.render(line, 24, (255, 255, 100), (80, 80, 40), 2)  # Yellow for emphasis
             else:  # Body text
-                font = self._small_font if hasattr(self, '_small_font') else pygame.font.Font(None, 32)
-                color = (255, 255, 255)  # White
+                text_surface = text_renderer.render(line, 15, (255, 255, 255), (60, 60, 60), 2)  # White
             
-            text_surface = font.render(line, True, color)
             text_surfaces.append(text_surface)
-            line_heights.append(text_surface.get_height())
+            line_heights.append(text_surface.get_height() - 4)
         
         # Calculate total text height and starting position
         total_text_height = sum(line_heights) + (len(line_heights) - 1) * 15  # 15px spacing
@@ -658,22 +643,9 @@ class Game:
         # Draw text with glow effects
         current_y = text_start_y
         for i, (text_surface, line_height) in enumerate(zip(text_surfaces, line_heights)):
-            # Center text horizontally
+            # Center text horizontally, the glow pads it by 2 pixels
             text_x = SCREEN_WIDTH // 2 - text_surface.get_width() // 2
-            
-            # Draw glow effect
-            glow_color = (80, 80, 40) if i == 0 else (60, 60, 60)  # Different glow for title
-            font = self._menu_font if (i == 0 and hasattr(self, '_menu_font')) else (self._small_font if hasattr(self, '_small_font') else pygame.font.Font(None, 32))
-            
-            for offset_x in [-2, -1, 0, 1, 2]:
-                for offset_y in [-2, -1, 0, 1, 2]:
-                    if offset_x == 0 and offset_y == 0:
-                        continue  # Skip center position
-                    glow_surface = font.render(self._autosave_warning_text[i], True, glow_color)
-                    self._screen.blit(glow_surface, (text_x + offset_x, current_y + offset_y))
-            
-            # Draw main text
-            self._screen.blit(text_surface, (text_x, current_y))
+            self._screen.blit(text_surface, (text_x, current_y - 2))
             current_y += line_height + 15
         
         # Draw loading icon
@@ -713,7 +685,7 @@ class Game:
             self._screen.blit(scaled_frame, (icon_x, icon_y))
         
         # Draw "Press any key to continue" text at bottom
-        continue_font = pygame.font.Font(None, 28)
+        continue_font = asset_cache.font(None, 28)
         continue_text = ""
         continue_surface = continue_font.render(continue_text, True, (180, 180, 180))
         continue_x = SCREEN_WIDTH // 2 - continue_surface.get_width() // 2
@@ -836,20 +808,7 @@ class Game:
 
     def render_outlined_text(self, text, color, outline_color, position):
         """Render text with an outline effect"""
-        # Render the outline by drawing the text multiple times with offsets
-        outline_offsets = [(-2, -2), (-2, 0), (-2, 2), (0, -2), (0, 2), (2, -2), (2, 0), (2, 2)]
-
-        # First render outline
-        for offset in outline_offsets:
-            offset_position = (position[0] + offset[0], position[1] + offset[1])
-            outline_surface = self._pixel_font.render(text, True, outline_color)
-            self._screen.blit(outline_surface, offset_position)
-
-        # Then render the text on top
-        text_surface = self._pixel_font.render(text, True, color)
-        self._screen.blit(text_surface, position)
-
-        return text_surface.get_rect(topleft=position)
+        return text_renderer.draw(self._screen, text, 32, color, outline_color, 2, topleft=position)
 
     def run(self):
         """Modified run method to use dynamic framerate"""
@@ -866,32 +825,8 @@ class Game:
 
             # Get events
             events = pygame.event.get()
-            for event in events:
-                # Handle quit
-                if event.type == pygame.QUIT:
-                    self._running = False
-
-                # If in main menu or level select, handle UI events
-                if self._state == "main_menu":
-                    # Handle UI events
-                    self._ui_manager.process_events(event)
-                    self.handle_menu_events(event)
-
-                # Handle keyboard input
-                if event.type == pygame.KEYDOWN:
-                    self._handle_keydown_events(event)
-                elif event.type == pygame.KEYUP:
-                    if event.key == pygame.K_m:
-                        self._map_key_pressed = False
-
-                # Pass events to map system
-                if self._state == "game" and (self._map_system.is_open or self._map_system.fading_in or self._map_system.fading_out):
-                    if self._map_system.handle_event(event):
-                        continue  # Skip further event processing if map handled it
-
-                # Pass events to level if in game state - just handle events, don't check for completion here
-                if self._level and self._state == "game" and not self._show_level_complete and not self._map_system.is_open:
-                    self._level.handle_events(event)
+            with self._world_lock():
+                self._handle_events(events)
 
             # Update and render based on state
             self._update_game_state(events, dt)
@@ -901,6 +836,68 @@ class Game:
 
             pygame.display.flip()
 
+    def _world_lock(self):
+        """Get the lock of the simulation thread while one runs, so the main thread doesn't change the level mid-step"""
+        if self._sim_thread:
+            return self._sim_thread.lock
+        return contextlib.nullcontext()
+
+    def _start_simulation(self):
+        """Start stepping the current level on the simulation thread"""
+        # Bound to this level, so the thread can never step a level that replaces it
+        level = self._level
+        self._sim_thread = SimulationThread(functools.partial(self._step_level, level), level.capture_render_state)
+        level.set_simulation_lock(self._sim_thread.lock)
+        self._sim_thread.start()
+
+    def _stop_simulation(self):
+        """Stop the simulation thread and wait for it to leave, the main thread steps the level again"""
+        if self._sim_thread:
+            sim_thread = self._sim_thread
+            self._sim_thread = None
+            sim_thread.stop()
+            if self._level:
+                self._level.apply_render_state(None, None, 0)
+                self._level.set_simulation_lock(None)
+
+    def _step_level(self, level, dt):
+        """Advance a level by one fixed step (runs on the simulation thread)"""
+        if not self._show_level_complete and not self._level_paused():
+            level.update(dt)
+
+    def _level_paused(self):
+        """Check whether the map is covering the level, which pauses gameplay"""
+        return self._map_system.is_open or self._map_system.fading_in
+
+    def _handle_events(self, events):
+        """Handle the events of a frame"""
+        for event in events:
+            # Handle quit
+            if event.type == pygame.QUIT:
+                self._running = False
+
+            # If in main menu or level select, handle UI events
+            if self._state == "main_menu":
+                # Handle UI events
+                self._ui_manager.process_events(event)
+                self.handle_menu_events(event)
+
+            # Handle keyboard input
+            if event.type == pygame.KEYDOWN:
+                self._handle_keydown_events(event)
+            elif event.type == pygame.KEYUP:
+                if event.key == pygame.K_m:
+                    self._map_key_pressed = False
+
+            # Pass events to map system
+            if self._state == "game" and (self._map_system.is_open or self._map_system.fading_in or self._map_system.fading_out):
+                if self._map_system.handle_event(event):
+                    continue  # Skip further event processing if map handled it
+
+            # Pass events to level if in game state - just handle events, don't check for completion here
+            if self._level and self._state == "game" and not self._show_level_complete and not self._map_system.is_open:
+                self._level.handle_events(event)
+
     def _handle_keydown_events(self, event):
         """Handle keyboard down events"""
         if event.key == pygame.K_m:
@@ -957,6 +954,9 @@ class Game:
 
     def _update_game_state(self, events, dt):
         """Update and render based on the current game state"""
+        if self._state != "game":
+            self._stop_simulation()
+
         if self._state == "autosave_warning":
             self._update_autosave_warning(dt)
             self._draw_autosave_warning()
@@ -984,8 +984,26 @@ class Game:
         elif self._state == "credits":
             self._update_credits_state()
         elif self._state == "game":
-            self.update(dt)
-            self.render()
+            if self._threaded_simulation:
+                self._update_threaded(dt)
+            else:
+                self.update(dt)
+                self.render()
+
+    def _update_threaded(self, dt):
+        """Update and render the game while the level steps on the simulation thread"""
+        if not self._sim_thread:
+            self._start_simulation()
+        elif self._sim_thread.error:
+            raise self._sim_thread.error
+
+        # Only the published snapshots are taken; drawing doesn't wait for a step in progress
+        sim_thread = self._sim_thread
+        previous, latest, alpha = sim_thread.read_snapshots()
+        self.update(dt, step_level=False)
+        if self._level and self._sim_thread is sim_thread:
+            self._level.apply_render_state(previous, latest, alpha)
+        self.render()
 
     def _update_credits_state(self):
         """Handle credits screen update and finishing"""
@@ -1021,22 +1039,27 @@ class Game:
             layer['pos_x'] = layer['center_x'] - (relative_x * self._bg_move_amount * layer['factor'])
             layer['pos_y'] = layer['center_y'] - (relative_y * self._bg_move_amount * layer['factor'])
 
-    def setup_game(self, level_index=0):
-        """Set up physics and level with impulse-based ball"""
+    def setup_game(self, level_index=0, level=None):
+        """Set up physics and level with impulse-based ball, using a prefetched level instance if given"""
+        # The simulation thread starts again for the new level
+        self._stop_simulation()
+
         # Create minimal physics manager
         self._physics = PhysicsManager()
 
-        # Check if the level index is 3 or 4
-        if level_index in [2, 3]:
-            self._level = CaveLevel(tmx_map=levels[level_index], spawn=spawn_points[level_index], level_index = level_index, gamesave=self._game_save)
-        elif level_index == 4:
-            self._level = SpaceLevel(tmx_map=levels[level_index], spawn=spawn_points[level_index], level_index = level_index, gamesave=self._game_save)
-        elif level_index == 5:
-            self._level = BossArena(tmx_map=levels[level_index], spawn=spawn_points[level_index])
+        # Assets only the level being replaced used go with it, unless the prefetcher keeps it to play again
+        if self._level is not None and self._level is not level and not self._prefetcher.keeps(self._level):
+            self._level.release_assets()
+
+        if level is not None:
+            # Built ahead of time, so only its music and timer still have to start
+            level.begin()
+            self._level = level
         else:
-            self._level = PymunkLevel(tmx_map=levels[level_index], spawn=spawn_points[level_index], level_index = level_index, gamesave=self._game_save)
+            self._level = create_level(level_index, self._game_save)
 
         self._current_level_index = level_index  # Store current index.
+        self._results_prefetched = False
 
         # Reset level completion flags
         self._show_level_complete = False
@@ -1045,8 +1068,8 @@ class Game:
         # Now load the map for this level
         self._map_system.load_map_for_level(level_index)
 
-    def update(self, dt):
-        """Update physics simulation and handle level completion"""
+    def update(self, dt, step_level=True):
+        """Update physics simulation and handle level completion, step_level being False while the simulation thread steps it"""
         if not self._level:
             return
 
@@ -1059,17 +1082,40 @@ class Game:
                 self._map_system.update(dt)
                 
                 # Don't update level if map is open (pause gameplay)
-                if not self._map_system.is_open and not self._map_system.fading_in:
+                if step_level and not self._level_paused():
                     self._level.update(dt)
-            else:
+            elif step_level:
                 # Normal level update when map is not open
                 self._level.update(dt)
 
+            # The results screen is up, so the next level is the likely pick
+            if self._level.showing_results and not self._results_prefetched:
+                self._results_prefetched = True
+                self._prefetch_next_level()
+
             # Check for level completion after updating
             if self._level.level_complete:
                 self._show_level_complete = True
                 self._level_complete_timer = 0
 
+    def _prefetch_next_level(self):
+        """Start building the level after the current one in the background"""
+        next_index = self._current_level_index + 1
+        if next_index >= len(levels):
+            return
+        # Finishing level 5 is what unlocks the boss level
+        if next_index == 5 and not (self._boss_level_unlocked or self._current_level_index == 4):
+            return
+        self._prefetcher.prefetch(next_index)
+
+    def _update_level_prefetch(self, level_index):
+        """Prefetch a level once the player has lingered on it in level select"""
+        if level_index != self._prefetch_candidate:
+            self._prefetch_candidate = level_index
+            self._prefetch_candidate_since = time.time()
+        elif time.time() - self._prefetch_candidate_since >= PREFETCH_HOVER_DELAY:
+            self._prefetcher.prefetch(level_index)
+
     def _handle_level_complete(self, dt):
         """Handle the level complete transition with loading screen"""
         self._level_complete_timer += dt
@@ -1140,9 +1186,7 @@ class Game:
 
         # Draw completion message with Daydream font
         completion_text = "Returning to menu..."
-        text_surface = self._pixel_font.render(completion_text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self._screen.blit(text_surface, text_rect)
+        text_renderer.draw(self._screen, completion_text, 32, (255, 255, 255), center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
     def render_start_screen(self):
         """Render the start screen with centered title and flashing text"""
@@ -1223,10 +1267,8 @@ class Game:
         for level_id, path in self._level_image_paths.items():
             try:
                 # Load and scale the image to fit the level squares
-                image = pygame.image.load(path)
-                scaled_image = pygame.transform.scale(image, (100, 100))
-                self._level_images[level_id] = scaled_image
-            except pygame.error:
+                self._level_images[level_id] = asset_cache.image(path, size=(100, 100), scope=self._level_select_scope)
+            except (pygame.error, FileNotFoundError):
                 # Create a placeholder colored surface if image doesn't exist
                 placeholder = pygame.Surface((100, 100))
                 if level_id == 5:  # Secret level
@@ -1235,6 +1277,12 @@ class Game:
                     placeholder.fill((64 + level_id * 30, 100, 150))  # Different colors per level
                 self._level_images[level_id] = placeholder
 
+    def _level_thumbnail(self, level_id, size):
+        """Get a level preview image scaled to a size"""
+        try:
+            return asset_cache.image(self._level_image_paths[level_id], size=(size, size), scope=self._level_select_scope)
+        except (pygame.error, FileNotFoundError):
+            return pygame.transform.scale(self._level_images[level_id], (size, size))  # Placeholder
 
     def _get_level_at_mouse_pos(self, mouse_pos):
         """Get which level the mouse is hovering over, accounting for scroll offset"""
@@ -1427,6 +1475,7 @@ class Game:
     def close_level_select(self):
         """Close the level select screen"""
         self._level_select_open = False
+        asset_cache.release_scope(self._level_select_scope)
         self._mouse_dragging = False
         self._drag_start_pos = None
         self._drag_velocity = 0
@@ -1654,24 +1703,15 @@ class Game:
             title_center = (SCREEN_WIDTH // 2, max(60, SCREEN_HEIGHT // 10))  # Adaptive title position
             outline_width = 3
 
-            # Draw outline for title
-            outline_surface = self._pixel_font.render(title_text, True, outline_color)
-            for dx in range(-outline_width, outline_width + 1):
-                for dy in range(-outline_width, outline_width + 1):
-                    if dx != 0 or dy != 0:
-                        screen.blit(outline_surface, (title_center[0] + dx - outline_surface.get_width() // 2,
-                                                    title_center[1] + dy - outline_surface.get_height() // 2))
-            
-            # Draw main title text
-            title_surface = self._pixel_font.render(title_text, True, title_color)
-            title_rect = title_surface.get_rect(center=title_center)
-            screen.blit(title_surface, title_rect)
+            # Draw outlined title text
+            text_renderer.draw(screen, title_text, 32, title_color, outline_color, outline_width, center=title_center)
         
         # Calculate adaptive sizes
         base_size = min(120, SCREEN_WIDTH // 12)  # Adaptive base size
         selected_size = min(140, SCREEN_WIDTH // 10)  # Adaptive selected size
         
         # Draw level squares
+        hovered_level = None
         for i in range(6):
             if i >= len(self._level_positions):
                 continue
@@ -1704,6 +1744,8 @@ class Game:
             # Check if mouse is hovering over this level
             mouse_pos = pygame.mouse.get_pos()
             is_hovering = level_rect.collidepoint(mouse_pos) and not self._mouse_dragging
+            if is_hovering:
+                hovered_level = i
             
             # Draw level background with border
             pygame.draw.rect(screen, (40, 40, 40), level_rect)  # Dark background
@@ -1725,9 +1767,9 @@ class Game:
             
             # Draw level image if available
             if i in self._level_images:
-                # Scale image to current size
+                # Scale image to current size, each size is scaled once while the level select is open
                 image_size = current_size - 20  # Leave space for border
-                scaled_image = pygame.transform.scale(self._level_images[i], (image_size, image_size))
+                scaled_image = self._level_thumbnail(i, image_size)
                 
                 # Apply lock overlay if locked
                 if is_locked:
@@ -1760,10 +1802,6 @@ class Game:
             if is_locked:
                 # Use adaptive font size
                 lock_font_size = max(14, SCREEN_WIDTH // 80)
-                try:
-                    lock_font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), lock_font_size)
-                except:
-                    lock_font = pygame.font.SysFont(None, lock_font_size)
                 
                 lock_text = "LOCKED"
                 lock_color = (255, 255, 255)
@@ -1771,25 +1809,12 @@ class Game:
                 lock_center = (x, base_y)
                 outline_width = 2
                 
-                # Draw outline for LOCKED text
-                outline_surface = lock_font.render(lock_text, True, outline_color)
-                for dx in range(-outline_width, outline_width + 1):
-                    for dy in range(-outline_width, outline_width + 1):
-                        if dx != 0 or dy != 0:
-                            screen.blit(outline_surface, (lock_center[0] + dx - outline_surface.get_width() // 2,
-                                                        lock_center[1] + dy - outline_surface.get_height() // 2))
-                
-                # Draw main LOCKED text
-                lock_surface = lock_font.render(lock_text, True, lock_color)
-                lock_rect = lock_surface.get_rect(center=lock_center)
-                screen.blit(lock_surface, lock_rect)
+                # Draw outlined LOCKED text
+                text_renderer.draw(screen, lock_text, lock_font_size, lock_color, outline_color, outline_width,
+                                   center=lock_center)
             
             # Draw level number/text with adaptive font
             text_font_size = max(16, SCREEN_WIDTH // 70)
-            try:
-                font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), text_font_size)
-            except:
-                font = pygame.font.SysFont(None, text_font_size)
             
             if i == 5:
                 text = "???" if not self._boss_level_unlocked else "BOSS"
@@ -1804,18 +1829,13 @@ class Game:
             outline_color = (0, 0, 0)  # Black outline for level numbers/text
             outline_width = 2
 
-            # Draw outline for level number/text
-            outline_surface = font.render(text, True, outline_color)
-            for dx in range(-outline_width, outline_width + 1):
-                for dy in range(-outline_width, outline_width + 1):
-                    if dx != 0 or dy != 0:
-                        screen.blit(outline_surface, (text_center[0] + dx - outline_surface.get_width() // 2,
-                                                    text_center[1] + dy - outline_surface.get_height() // 2))
-            
-            # Draw main level number/text
-            text_surface = font.render(text, True, text_color)
-            text_rect = text_surface.get_rect(center=text_center)
-            screen.blit(text_surface, text_rect)
+            # Draw outlined level number/text
+            text_renderer.draw(screen, text, text_font_size, text_color, outline_color, outline_width, center=text_center)
+
+        # Start building the hovered (or else the selected) level while the player decides
+        intended_level = hovered_level if hovered_level is not None else self._selected_level
+        if intended_level != 5 or self._boss_level_unlocked:
+            self._update_level_prefetch(intended_level)
         
         # Draw selection indicator with adaptive size
         center_x = SCREEN_WIDTH // 2
@@ -1841,18 +1861,9 @@ class Game:
             for i, instruction in enumerate(instructions):
                 inst_center = (SCREEN_WIDTH // 2, y_offset + i * 40)
                 
-                # Draw outline for instructions
-                outline_surface = self._small_font.render(instruction, True, instruction_outline_color)
-                for dx in range(-outline_width, outline_width + 1):
-                    for dy in range(-outline_width, outline_width + 1):
-                        if dx != 0 or dy != 0:
-                            screen.blit(outline_surface, (inst_center[0] + dx - outline_surface.get_width() // 2,
-                                                        inst_center[1] + dy - outline_surface.get_height() // 2))
-                
-                # Draw main instruction text
-                inst_surface = self._small_font.render(instruction, True, instruction_text_color)
-                inst_rect = inst_surface.get_rect(center=inst_center)
-                screen.blit(inst_surface, inst_rect)
+                # Draw outlined instruction text
+                text_renderer.draw(screen, instruction, 15, instruction_text_color, instruction_outline_color,
+                                   outline_width, center=inst_center)
 
     def _handle_ui_button_press(self, event):
         """Handle UI button presses in the menu"""
@@ -1886,7 +1897,7 @@ class Game:
                 
                 # Play a special sound effect (if available)
                 try:
-                    secret_sound = pygame.mixer.Sound(os.path.join("assets", "sounds", "secret.mp3"))
+                    secret_sound = asset_cache.sound(os.path.join("assets", "sounds", "secret.mp3"))
                     secret_sound.play()
                 except:
                     print("Secret sound effect not found")
@@ -1895,7 +1906,15 @@ class Game:
         """Handle UI transitions between game states"""
         old_state = self._state
         self._state = new_state
+
+        # Leaving the level stops the simulation thread before the level is stored or replaced
+        if new_state != "game":
+            self._stop_simulation()
         
+        # Keep the level that was just left, reset, so playing it again is instant
+        if new_state == "main_menu" and old_state in ("game", "credits") and self._level:
+            self._prefetcher.store(self._current_level_index, self._level)
+
         # Hide/show UI elements based on state
         if new_state == "main_menu":
             # Show main menu buttons
@@ -1941,6 +1960,7 @@ class Game:
     def close_level_select(self):
         """Closes the level selection menu"""
         self._level_select_open = False
+        asset_cache.release_scope(self._level_select_scope)
         
         # Show main menu buttons
         if hasattr(self, '_main_menu_buttons'):
@@ -1970,9 +1990,7 @@ class Game:
             # If we've unlocked the boss level, show a small indicator
             if self._boss_level_unlocked:
                 boss_unlocked_text = "BOSS LEVEL UNLOCKED!"
-                boss_text_surface = self._small_font.render(boss_unlocked_text, True, (255, 215, 0))  # Gold color
-                boss_text_rect = boss_text_surface.get_rect(topleft=(10, 10))
-                self._screen.blit(boss_text_surface, boss_text_rect)
+                text_renderer.draw(self._screen, boss_unlocked_text, 15, (255, 215, 0), topleft=(10, 10))  # Gold color
         
         # Draw UI elements (buttons will be shown/hidden based on state)
         self._ui_manager.draw_ui(self._screen)
@@ -2026,15 +2044,21 @@ class Game:
         pygame.mixer_music.fadeout(500)
         SceneManager.fade_to_black(self._screen, render_main_menu, self._fade_duration)
         
-        # 2. Show loading screen on black background while setting up game
-        self._show_loading = True
-        
-        def loading_task():
-            """The actual loading work"""
-            self.setup_game(level_index)
+        if self._prefetcher.is_ready(level_index):
+            # 2. The level was built in the background already, so no loading screen is needed
+            self.setup_game(level_index, self._prefetcher.take(level_index))
             self.handle_state_transition("game")
-        
-        self._draw_loading_screen_between_transitions(loading_task)
+        else:
+            # 2. Show loading screen on black background while setting up game
+            self._show_loading = True
+            
+            def loading_task():
+                """The actual loading work"""
+                # Picks up the level if it is being prefetched right now, otherwise builds it
+                self.setup_game(level_index, self._prefetcher.take(level_index))
+                self.handle_state_transition("game")
+            
+            self._draw_loading_screen_between_transitions(loading_task)
         
         # 3. Fade from black to new game state
         self._show_loading = False
@@ -0,0 +1,383 @@
+import math, threading
+from concurrent.futures import ProcessPoolExecutor
+
+# CPU-heavy level build steps that don't need pygame, so they can run in worker processes.
+# Keep this module free of pygame (and of constants.py, which initializes it) so the
+# workers start quickly; only plain data - tuples, bytes and dictionaries - goes in and out.
+
+_pool = None
+_pool_lock = threading.Lock()
+
+class TerrainBuilder:
+    """
+    Turns a tiled collision mask into continuous, simplified terrain contours.
+    Runs marching squares over the stitched tile masks, links the cell edges into
+    chains across tile boundaries and simplifies each chain with Douglas-Peucker.
+    """
+    # Marching squares edge table: corner bits TL=8, TR=4, BR=2, BL=1 -> pairs of cell edges
+    # Saddles (5 and 10) keep the two solid corners separate
+    _EDGES = {
+        1: (("left", "bottom"),), 2: (("bottom", "right"),), 3: (("left", "right"),),
+        4: (("top", "right"),), 5: (("top", "right"), ("left", "bottom")), 6: (("top", "bottom"),),
+        7: (("top", "left"),), 8: (("top", "left"),), 9: (("top", "bottom"),),
+        10: (("top", "left"), ("bottom", "right")), 11: (("top", "right"),), 12: (("left", "right"),),
+        13: (("bottom", "right"),), 14: (("left", "bottom"),)
+    }
+
+    def __init__(self, tile_size, step=4, tolerance=2):
+        """
+        Initialize the terrain builder.
+
+        Args:
+            tile_size: Size of a tile in pixels
+            step: Sampling distance in pixels (should divide tile_size)
+            tolerance: Maximum distance in pixels a simplified contour may stray from the traced one
+        """
+        self._tile_size = tile_size
+        self._step = step
+        self._tolerance = tolerance
+
+    def sample_mask(self, mask):
+        """
+        Sample a tile's collision mask at the centre of every sample block.
+
+        Args:
+            mask: Tile-sized pygame.mask.Mask
+
+        Returns:
+            Bytes with one 0/1 value per sample block, row by row
+        """
+        cells = self._tile_size // self._step
+        half = self._step // 2
+        return bytes(1 if mask.get_at((x * self._step + half, y * self._step + half)) else 0
+                     for y in range(cells) for x in range(cells))
+
+    def build(self, tile_samples, solid_tiles=None, area=None):
+        """
+        Trace the contours of a collision layer.
+
+        Args:
+            tile_samples: Dictionary of (tile x, tile y) -> samples from sample_mask
+            solid_tiles: Optional set of tiles whose masks are completely filled (skips sampling)
+            area: Optional (min x, min y, end x, end y) tile bounds; only edges of tiles inside
+                  it are traced, but tile_samples must also hold the tiles right around it
+
+        Returns:
+            List of contours, each a list of (x, y) world points
+        """
+        solid_tiles = solid_tiles or set()
+        segments = self._march(tile_samples, solid_tiles, area)
+        chains = self._link(segments)
+        return [self.simplify(chain, self._tolerance) for chain in chains]
+
+    def _march(self, tile_samples, solid_tiles, area):
+        """Run marching squares over every cell whose samples are not all the same"""
+        step = self._step
+        half = step // 2
+        cells_per_tile = self._tile_size // step
+        samples = {}
+
+        def sample(sx, sy):
+            """Whether the pixel at the centre of sample block (sx, sy) is solid"""
+            key = (sx, sy)
+            value = samples.get(key)
+            if value is None:
+                tile = (sx // cells_per_tile, sy // cells_per_tile)
+                if tile in solid_tiles:
+                    value = True
+                else:
+                    tile_sample = tile_samples.get(tile)
+                    value = bool(tile_sample is not None and
+                                 tile_sample[(sy % cells_per_tile) * cells_per_tile + sx % cells_per_tile])
+                samples[key] = value
+            return value
+
+        # A tile's cells also read its right, lower and diagonal neighbours, so only tiles
+        # whose 2x2 block mixes solid and empty (or has partial tiles) can contain edges
+        candidates = set()
+        for tx, ty in tile_samples:
+            for nx, ny in ((tx, ty), (tx - 1, ty), (tx, ty - 1), (tx - 1, ty - 1)):
+                if area and not (area[0] <= nx < area[2] and area[1] <= ny < area[3]):
+                    continue
+                block = [(nx + i, ny + j) for i in (0, 1) for j in (0, 1)]
+                if all(tile in solid_tiles for tile in block) or not any(tile in tile_samples for tile in block):
+                    continue
+                candidates.add((nx, ny))
+
+        segments = []
+        for tx, ty in candidates:
+            for cy in range(ty * cells_per_tile, (ty + 1) * cells_per_tile):
+                for cx in range(tx * cells_per_tile, (tx + 1) * cells_per_tile):
+                    case = (sample(cx, cy) * 8 + sample(cx + 1, cy) * 4 +
+                            sample(cx + 1, cy + 1) * 2 + sample(cx, cy + 1))
+                    if case == 0 or case == 15:
+                        continue
+
+                    # Edge midpoints land exactly on the sample block boundaries
+                    points = {
+                        "top": ((cx + 1) * step, cy * step + half),
+                        "right": ((cx + 1) * step + half, (cy + 1) * step),
+                        "bottom": ((cx + 1) * step, (cy + 1) * step + half),
+                        "left": (cx * step + half, (cy + 1) * step)
+                    }
+                    for edge_a, edge_b in self._EDGES[case]:
+                        segments.append((points[edge_a], points[edge_b]))
+
+        return segments
+
+    def _link(self, segments):
+        """Join cell edges that share end points into chains"""
+        neighbours = {}
+        for a, b in segments:
+            neighbours.setdefault(a, []).append(b)
+            neighbours.setdefault(b, []).append(a)
+
+        used = set()
+        chains = []
+
+        def walk(start):
+            chain = [start]
+            current = start
+            while True:
+                next_point = None
+                for candidate in neighbours[current]:
+                    edge = (current, candidate) if current < candidate else (candidate, current)
+                    if edge not in used:
+                        used.add(edge)
+                        next_point = candidate
+                        break
+                if next_point is None:
+                    return chain
+                chain.append(next_point)
+                current = next_point
+
+        # Open chains (ending at the map border) first, then closed loops
+        for point, linked in neighbours.items():
+            if len(linked) == 1:
+                chain = walk(point)
+                if len(chain) > 1:
+                    chains.append(chain)
+        for point in neighbours:
+            chain = walk(point)
+            if len(chain) > 1:
+                chains.append(chain)
+
+        return chains
+
+    @staticmethod
+    def simplify(points, tolerance):
+        """
+        Simplify a polyline with the Douglas-Peucker algorithm.
+
+        Args:
+            points: List of (x, y) points; a closed loop repeats its first point at the end
+            tolerance: Maximum distance a removed point may be from the simplified line
+
+        Returns:
+            Simplified list of points
+        """
+        if len(points) <= 2:
+            return list(points)
+
+        # A closed loop has no baseline, so split it at the point furthest from the start
+        if points[0] == points[-1]:
+            start = points[0]
+            split = max(range(1, len(points) - 1),
+                        key=lambda i: (points[i][0] - start[0]) ** 2 + (points[i][1] - start[1]) ** 2)
+            first = TerrainBuilder.simplify(points[:split + 1], tolerance)
+            second = TerrainBuilder.simplify(points[split:], tolerance)
+            return first[:-1] + second
+
+        keep = [False] * len(points)
+        keep[0] = keep[-1] = True
+        stack = [(0, len(points) - 1)]
+        while stack:
+            first, last = stack.pop()
+            (x1, y1), (x2, y2) = points[first], points[last]
+            dx, dy = x2 - x1, y2 - y1
+            length = math.hypot(dx, dy) or 1.0
+
+            max_distance = -1
+            index = None
+            for i in range(first + 1, last):
+                px, py = points[i]
+                distance = abs(dy * (px - x1) - dx * (py - y1)) / length
+                if distance > max_distance:
+                    max_distance = distance
+                    index = i
+
+            if index is not None and max_distance > tolerance:
+                keep[index] = True
+                stack.append((first, index))
+                stack.append((index, last))
+
+        return [point for point, kept in zip(points, keep) if kept]
+
+def chain_spec(points, friction):
+    """Make the collision spec of a segment chain, with its bounding box"""
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    return ("chain", points, friction, min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+
+def friction_at(x, y, tile_frictions, tile_size):
+    """Get the friction of the collision tile at or right next to a point on a contour"""
+    for dx, dy in ((0, 0), (1, 1), (-1, 1), (1, -1), (-1, -1)):
+        tile = (int((x + dx) // tile_size), int((y + dy) // tile_size))
+        if tile in tile_frictions:
+            return tile_frictions[tile]
+    return 0.8
+
+def split_contour_by_friction(contour, tile_frictions, tile_size):
+    """Split a contour into runs of segments lying on tiles with the same friction"""
+    runs = []
+    current = [contour[0]]
+    current_friction = None
+
+    for p1, p2 in zip(contour, contour[1:]):
+        friction = friction_at((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2, tile_frictions, tile_size)
+        if current_friction is not None and friction != current_friction:
+            runs.append((current, current_friction))
+            current = [p1]
+        current.append(p2)
+        current_friction = friction
+
+    if current_friction is not None:
+        runs.append((current, current_friction))
+    return runs
+
+def merge_solid_cells(solid_cells, tile_size):
+    """Greedily merge fully solid tiles with the same friction into maximal rectangles"""
+    specs = []
+    remaining = dict(solid_cells)
+
+    # Scan in row order so every rectangle starts at its top-left cell
+    for x, y in sorted(solid_cells, key=lambda cell: (cell[1], cell[0])):
+        if (x, y) not in remaining:
+            continue
+        friction = remaining[(x, y)]
+
+        # Grow to the right as far as the row allows
+        width = 1
+        while remaining.get((x + width, y)) == friction:
+            width += 1
+
+        # Then grow down while the whole row below matches
+        height = 1
+        while all(remaining.get((x + i, y + height)) == friction for i in range(width)):
+            height += 1
+
+        for j in range(height):
+            for i in range(width):
+                del remaining[(x + i, y + j)]
+
+        specs.append(("box", None, friction, x * tile_size, y * tile_size, width * tile_size, height * tile_size))
+
+    return specs
+
+def build_collision_block(job):
+    """
+    Work unit: trace the collision specs of one block of tiles of a collision layer.
+
+    Args:
+        job: Dictionary with
+            tile_size, step, tolerance: TerrainBuilder settings
+            area: (min x, min y, end x, end y) tile bounds of the block
+            tiles: Dictionary of (tile x, tile y) -> GID for the block and the tiles right around it
+            samples: Dictionary of GID -> mask samples (see TerrainBuilder.sample_mask)
+            frictions: Dictionary of GID -> friction
+            solid: Set of GIDs whose collision fills the whole tile
+
+    Returns:
+        (specs, segment count, contour count, box count)
+    """
+    tile_size = job["tile_size"]
+    min_x, min_y, end_x, end_y = job["area"]
+    tiles = job["tiles"]
+    tile_samples = {tile: job["samples"][gid] for tile, gid in tiles.items()}
+    tile_frictions = {tile: job["frictions"][gid] for tile, gid in tiles.items()}
+    solid_tiles = {tile for tile, gid in tiles.items() if gid in job["solid"]}
+
+    # Trace the terrain surface as continuous segment chains
+    specs = []
+    segment_count = 0
+    builder = TerrainBuilder(tile_size, job["step"], job["tolerance"])
+    contours = builder.build(tile_samples, solid_tiles, job["area"])
+    for contour in contours:
+        for points, friction in split_contour_by_friction(contour, tile_frictions, tile_size):
+            specs.append(chain_spec(points, friction))
+            segment_count += len(points) - 1
+
+    # Fill the inside of solid areas with merged boxes so nothing can tunnel through the surface
+    interior = {}
+    for x, y in solid_tiles:
+        if not (min_x <= x < end_x and min_y <= y < end_y):
+            continue
+        if all(neighbour in solid_tiles for neighbour in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))):
+            interior[(x, y)] = tile_frictions[(x, y)]
+    boxes = merge_solid_cells(interior, tile_size)
+    specs.extend(boxes)
+
+    return specs, segment_count, len(contours), len(boxes)
+
+def join_chain_specs(specs):
+    """Rejoin chains with the same friction that were cut apart at block borders"""
+    chains = {}  # id -> [points, friction]
+    ends = {}  # (end point, friction) -> chain ids ending there
+    others = []
+    for spec in specs:
+        if spec[0] != "chain":
+            others.append(spec)
+            continue
+        points, friction = spec[1], spec[2]
+        chain_id = len(chains)
+        chains[chain_id] = [list(points), friction]
+        if points[0] != points[-1]:
+            for point in (points[0], points[-1]):
+                ends.setdefault((point, friction), []).append(chain_id)
+
+    for (point, friction), chain_ids in ends.items():
+        # Only join where exactly two chain ends meet, anything else is a real junction
+        if len(chain_ids) != 2 or chain_ids[0] == chain_ids[1]:
+            continue
+        first_id, second_id = chain_ids
+        first, second = chains[first_id][0], chains[second_id][0]
+        if first[-1] != point:
+            first.reverse()
+        if second[0] != point:
+            second.reverse()
+        first.extend(second[1:])
+
+        # The second chain is gone, so its far end now belongs to the first one
+        del chains[second_id]
+        far_end = ends.get((first[-1], friction), [])
+        ends[(first[-1], friction)] = [first_id if chain_id == second_id else chain_id for chain_id in far_end]
+
+    return [chain_spec(points, friction) for points, friction in chains.values()] + others
+
+def run_jobs(function, jobs, workers):
+    """
+    Run work units in the shared process pool, or inline if there are no workers to spare.
+
+    Args:
+        function: Module-level function taking one job
+        jobs: List of picklable jobs
+        workers: Number of worker processes to use
+
+    Returns:
+        List of results in job order
+    """
+    global _pool
+    if workers > 1 and len(jobs) > 1:
+        with _pool_lock:
+            try:
+                # The pool is started on first use and reused by every later level load
+                if _pool is None:
+                    _pool = ProcessPoolExecutor(max_workers=workers)
+                return list(_pool.map(function, jobs))
+            except Exception as e:
+                print(f"Level build pool failed, building on this thread instead: {e}")
+                if _pool is not None:
+                    _pool.shutdown(wait=False, cancel_futures=True)
+                _pool = None
+
+    return [function(job) for job in jobs]
@@ -1,9 +1,13 @@
-import pygame, pytmx, os, random, math, time, threading
+import pygame, pytmx, os, random, math, time, threading, collections, contextlib
+from array import array
 from constants import *
-from utils import PhysicsManager, ParallaxBackground, DialogueSystem, LevelTimer, GameStats, ResultsScreen, GameSave
+from utils import PhysicsManager, ParallaxBackground, DialogueSystem, LevelTimer, GameStats, ResultsScreen, GameSave, LevelCache
 from characters import PurePymunkBall, NPCCharacter, BlueBall, SignNPC, Cubodeez_The_Almighty_Cube as cb
-from utils import Camera, SpatialGrid
-from objects import RocketLauncher, Rocket, Credits, Explosion, Coin
+from utils import Camera, SpatialGrid, ChunkRenderer, RegionStreamer, FixedTimestep, GroundHeightfield, TriggerVolumes, EntityPool
+from utils import text_renderer
+from level_build import TerrainBuilder, build_collision_block, join_chain_specs, chain_spec, run_jobs
+from objects import RocketLauncher, Rocket, Credits, Explosion, CoinField
+from asset_cache import asset_cache
 pygame.mixer.init()
 
 Level1 = os.path.join("assets", "world building", "Tiled Worlds", "Level1.tmx")
@@ -21,30 +25,44 @@ spawn5 = (50, 2500)
 spawn6 = (250, 450)
 spawn_points = [spawn1, spawn2, spawn3, spawn4, spawn5, spawn6]
 
+# Baked level data lives here so levels can skip TMX parsing when nothing has changed
+level_cache = LevelCache()
+
+# Draw order of the tile layers, background first
+layer_order = {"background": 0, "Surface B": 1, "Masks B": 2, "Masks F": 3, "Surface F": 4, "Objects": 5}
+
 class PymunkLevel:
     """Level that uses spatial partitioning for efficient rendering"""
+    _music_switch_track = None  # Track the music switch tiles change to, levels without one ignore them
+
     def __init__(self, spawn, tmx_map=None, play_music=True, level_index=0, gamesave=None):
         self._level_index = level_index  # Store the level index for music and stats
+        # Assets only this level asks for are dropped from the shared cache when the player leaves it
+        self._asset_scope = asset_cache.open_scope(os.path.splitext(os.path.basename(tmx_map))[0] if tmx_map else "level")
         x, y = spawn
         self._spawn_point = spawn
-        self._physics = PhysicsManager()
+        self._physics = PhysicsManager(expected_bodies=self.expected_dynamic_bodies())
         self._TILE_SIZE = 64
         self._ball = PurePymunkBall(self._physics, x, y)
         self._camera = Camera(2000, 2000)  # Default size, will be updated when map loads
+        self._render_camera = None  # Camera placed from the render snapshots while the simulation has its own thread
+        self._render_state = None  # Sprite id -> (image, world centre) from the render snapshots, drawn instead of the sprite
+        self._render_coins = None  # Coin field snapshot the coins are drawn from while the render snapshots are in use
+        self._simulation_lock = None  # Held by the simulation thread while it steps, drawing live state holds it too
         self._game_ref = None  # Reference to the game object, if needed
         self._gamesave = gamesave
         # Initialize dialogue system
         self._setup_dialogue_system()
         # flag image
-        original_flag_image = pygame.image.load(os.path.join("assets", "world building", "flag.png")).convert_alpha()
-        self._flag_image = pygame.transform.scale(original_flag_image, (62, 64))
-        # Play level music
+        self._flag_image = asset_cache.image(os.path.join("assets", "world building", "flag.png"), size=(62, 64), scope=self._asset_scope)
+        # Play level music (prefetched levels start it when they are played)
         if play_music:
-            self._setup_music()
+            self.start_music()
         
         self._music_switched = False  # Track if music has been switched
         self._music_switching = False  # New flag to prevent multiple switches
         self._pending_track = None     # Track to load after fadeout
+        self._music_switch_thread = None  # Thread that loads the pending track once the fadeout ends
 
         # Set up parallax background
         self._setup_parallax_background()
@@ -54,29 +72,39 @@ class PymunkLevel:
         self._spatial_grid = SpatialGrid(cell_size=self._TILE_SIZE * 2)
         
         # Physics and visual objects
-        self._static_bodies = []
         self._static_shapes = []
+        self._layer_shapes = {"F": [], "B": []}  # Collision shapes of each mask layer, both kept in the space
         self._visual_tiles = pygame.sprite.Group()  # Keep this for compatibility
-        self._mask_switch_triggers = []
+        self._triggers = TriggerVolumes()  # Finish lines, music switches, checkpoints and loop switches
         self._finish_tiles = []  # Store finish line tiles
         self._coin_tiles = []
+        self._coin_field = CoinField()  # Every coin of the level, collected or not, so a reset can put them back
         self._music_switch_tiles = []
         self._switch_used = False
         self._level_complete = False  # Track if level is complete
         self._checkpoints = []  # List of checkpoints
+        self._checkpoint_snapshot = None  # World state to respawn into, from the last checkpoint or the spawn point
+        self._reached_checkpoints = set()
+        self._rocket_tiles = []  # World positions of tiles marked as rocket launchers
+        self._boss_spawn = None  # BossSpawn object position, if the map has one
+        self._baked_level = None  # Cached level data when loaded from the level cache
+        self._streaming = False  # Whether tiles and collision are streamed in regions around the ball
+        self._streamer = None
+        self._stream_layers = []  # (layer name, tile grid, visible) for layers loaded per region
+        self._stream_images = {}  # Tile grid value -> tile image
+        self._region_specs = {"F": {}, "B": {}}  # Collision specs of each mask layer by region
         self._total_tiles = 0  # Track total tile count
         
         # Rendering statistics (for debugging/optimization)
         self._rendered_tiles_count = 0
         self._culled_tiles_count = 0
+        self._frame_substeps = 0  # Physics substeps run in the last frame
 
-        # Layer tracking - only one is active at a time
+        # Layer tracking - both layers are loaded but only one is collided with at a time
         self._active_layer = "F"  # Start with F layer active
 
-        # Buffer zone size (in pixels) to prevent pop-in at screen edges
-        self._viewport_buffer = self._TILE_SIZE * 2
-
             # Add timer and stats systems
+        self._timestep = FixedTimestep()  # Physics runs in fixed steps whatever the framerate
         self._timer = LevelTimer()
         self._stats = GameStats()
         self._results_screen = ResultsScreen(SCREEN_WIDTH, SCREEN_HEIGHT, self._gamesave)
@@ -92,6 +120,9 @@ class PymunkLevel:
         self._timer.start()  # Start the timer when the level is created
         self._secret_found = False  # Track if a secret has been found
 
+        # Deaths before the first checkpoint go back to the level as it starts
+        self._checkpoint_snapshot = self.take_snapshot(self._spawn_point)
+
     def _setup_dialogue_system(self):
         """Initialize the dialogue system"""
         self._dialogue_system = DialogueSystem(SCREEN_WIDTH, SCREEN_HEIGHT, ui_manager=None)
@@ -110,8 +141,8 @@ class PymunkLevel:
     def _load_player_portrait(self):
         """Load the player portrait for dialogues"""
         try:
-            self._player_portrait = pygame.image.load(os.path.join("assets", "sprites", "red ball portrait.png")).convert_alpha()
-            self._player_portrait = pygame.transform.scale(self._player_portrait, (84, 84))
+            self._player_portrait = asset_cache.image(os.path.join("assets", "sprites", "red ball portrait.png"), size=(84, 84),
+                                                      scope=self._asset_scope)
         except:
             # Create a fallback portrait if image not found
             self._player_portrait = pygame.Surface((84, 84), pygame.SRCALPHA)
@@ -148,14 +179,14 @@ class PymunkLevel:
         bg_loaded = False
         for bg in bg_paths:
             if os.path.exists(bg["path"]):
-                if self._parallax_bg.add_layer(bg["path"], bg["factor"]):
+                if self._parallax_bg.add_layer(bg["path"], bg["factor"], scope=self._asset_scope):
                     bg_loaded = True
 
         # If no backgrounds were loaded, try a fallback
         if not bg_loaded:
             try:
                 windmill_path = os.path.join("assets", "backgrounds", "windmillisle.png")
-                self._parallax_bg.add_layer(windmill_path, 0.1)
+                self._parallax_bg.add_layer(windmill_path, 0.1, scope=self._asset_scope)
             except:
                 # Create a solid color background as last resort
                 self._parallax_bg.add_color_layer((100, 100, 255))
@@ -188,6 +219,10 @@ class PymunkLevel:
     def camera(self):
         return self._camera
     
+    @property
+    def coin_field(self):
+        return self._coin_field
+    
     @property
     def game_ref(self):
         return self._game_ref
@@ -206,7 +241,8 @@ class PymunkLevel:
     
     @property
     def static_shapes(self):
-        return self._static_shapes
+        """Get the static shapes the ball can currently collide with"""
+        return self._static_shapes + self._layer_shapes[self._active_layer]
     
     @property
     def level_complete(self):
@@ -223,6 +259,141 @@ class PymunkLevel:
     @property
     def in_dialogue(self):
         return self._in_dialogue
+
+    @property
+    def frame_substeps(self):
+        """Get the number of physics substeps run in the last frame"""
+        return self._frame_substeps
+
+    @property
+    def showing_results(self):
+        """Get whether the results screen is showing"""
+        return self._showing_results
+
+    def expected_dynamic_bodies(self):
+        """Get how many dynamic bodies the level simulates at once, used to decide on a threaded physics space"""
+        return 1  # Just the ball
+
+    def start_music(self):
+        """Start the level music"""
+        self._setup_music()
+
+    def begin(self):
+        """Start the music and the timer of a level that was built ahead of time"""
+        self.start_music()
+        self._timer.start()
+
+    def release_assets(self):
+        """Drop the assets only this level uses from the shared cache, the level keeps its own references"""
+        asset_cache.release_scope(self._asset_scope)
+
+    def estimate_memory(self):
+        """Roughly estimate the memory the level holds in bytes, used to budget prefetched levels"""
+        # Everything loaded into the level's asset scope, such as the background layers, then its own images
+        image_sizes = {id(asset): size for asset, size in asset_cache.scope_assets(self._asset_scope)}
+        images = [tile.image for tile in self._visual_tiles] + list(self._stream_images.values())
+        images += [layer['image'] for layer in self._parallax_bg.layers]
+        for image in images:
+            image_sizes.setdefault(id(image), image.get_width() * image.get_height() * image.get_bytesize())
+        image_bytes = sum(image_sizes.values())
+
+        # Sprites and shapes are counted at a flat rate each
+        object_count = (len(self._visual_tiles) + len(self._static_shapes) +
+                        len(self._layer_shapes["F"]) + len(self._layer_shapes["B"]))
+        grid_bytes = sum(grid.itemsize * len(grid) for layer_name, grid, is_visible in self._stream_layers)
+        return image_bytes + object_count * 512 + grid_bytes + self._chunk_renderer.memory_used
+
+    def reset(self):
+        """
+        Put the level back the way it was when it was built, without touching its tiles or collision,
+        so a level kept in memory can be played again right away
+        """
+        # The same ball starts again at the spawn point, without loading its sounds and frames again
+        self._ball.respawn(*self._spawn_point)
+
+        # Back to the front layer, which the level starts on
+        if self._active_layer != "F":
+            self.switch_layer()
+
+        # Streamed levels need the regions around the spawn point before the first step
+        if self._streamer:
+            self._streamer.preload(*self._ball.body.position)
+
+        # Bring back every coin, collected or not
+        self._coin_field.reset()
+        self._coin_score = 0
+        self._total_coins_collected = 0
+
+        # NPCs and signs start their dialogue over
+        for npc in self.NPCs:
+            if hasattr(npc, 'reset_dialogue'):
+                npc.reset_dialogue()
+        if self._dialogue_system.active:
+            self._dialogue_system.hide()
+        self._in_dialogue = False
+        self._showing_player_choice = False
+        self._waiting_for_player_continue = False
+        self._player_choice_text = ""
+        self._player_choice_index = -1
+        self._waiting_for_player_dialogue = False
+        self._current_npc = None
+        self._dialogue_just_started = False
+
+        # Triggers fire again and checkpoints have to be reached again
+        self._triggers.reset()
+        self._reached_checkpoints = set()
+        self._switch_used = False
+        self._secret_found = False
+        self._music_switched = False
+        self._music_switching = False
+        self._pending_track = None
+
+        # Fresh timer and stats; the timer starts again in begin()
+        self._timestep.reset()
+        self._timer = LevelTimer()
+        self._stats.reset()
+        self._results_screen.hide()
+        self._showing_results = False
+        self._level_complete = False
+
+        self._camera.update(self._ball)
+        self._checkpoint_snapshot = self.take_snapshot(self._spawn_point)
+
+    def take_snapshot(self, position=None):
+        """
+        Record the dynamic world state a respawn goes back to.
+
+        Args:
+            position (tuple): Where the ball respawns, defaults to where it is now
+
+        Returns:
+            dict: The snapshot, for restore_snapshot
+        """
+        return {
+            "ball_position": tuple(position or self._ball.body.position),
+            "layer": self._active_layer,
+            "coins": self._coin_field.taken(),
+            "coin_score": getattr(self, '_coin_score', 0),
+            "coins_collected": getattr(self, '_total_coins_collected', 0)
+        }
+
+    def restore_snapshot(self, snapshot):
+        """Put the world back in a state taken with take_snapshot, reusing the ball"""
+        self._ball.respawn(*snapshot["ball_position"])
+        if self._active_layer != snapshot["layer"]:
+            self.switch_layer()
+
+        # Regions around the respawn point have to be there before the next step
+        if self._streamer:
+            self._streamer.preload(*snapshot["ball_position"])
+
+        # Coins collected since the snapshot come back
+        self._coin_field.restore(snapshot["coins"])
+        self._coin_score = snapshot["coin_score"]
+        self._total_coins_collected = snapshot["coins_collected"]
+
+        self._timestep.reset()
+        self._camera.update(self._ball)
     
     def collect_ring(self):
         """Call this when player collects a ring"""
@@ -250,44 +421,143 @@ class PymunkLevel:
         # Clear any existing physics objects
         self.clear_physics_objects()
 
-        self._tmx_data = pytmx.load_pygame(tmx_map)
-        self.width = self._tmx_data.width * self._TILE_SIZE
-        self.height = self._tmx_data.height * self._TILE_SIZE
+        # Use the baked copy of the level if it is still up to date with the TMX
+        self._baked_level = level_cache.load(tmx_map, self._TILE_SIZE)
+
+        if self._baked_level:
+            print(f"Loading baked level for {tmx_map}")
+            self._tmx_data = None
+            self.width = self._baked_level["width"] * self._TILE_SIZE
+            self.height = self._baked_level["height"] * self._TILE_SIZE
+        else:
+            self._tmx_data = pytmx.load_pygame(tmx_map)
+            self._tile_info = {}  # GID -> scaled image, properties, shape type, friction and outline
+            self.width = self._tmx_data.width * self._TILE_SIZE
+            self.height = self._tmx_data.height * self._TILE_SIZE
         self._camera = Camera(self.width, self.height)
 
-        # Load all visual tiles with spatial partitioning
-        self.load_visual_tiles()
+        # Big levels only keep the regions around the ball loaded
+        self._streaming = self.should_stream()
 
-        # Load only the active layer's collision shapes
-        if self._active_layer == "F":
-            self.load_collision_layer("Masks F")
+        if self._baked_level:
+            self.load_baked_tiles()
         else:
-            self.load_collision_layer("Masks B")
+            # Load all visual tiles with spatial partitioning
+            self.load_visual_tiles()
+
+        # Static tile layers are drawn from pre-rendered chunks
+        self._chunk_renderer = ChunkRenderer(self._spatial_grid, self.width, self.height,
+                                             self.get_tile_passes(), layer_order=layer_order,
+                                             hidden_layers=("Masks F", "Masks B"))
+
+        # Big uniform tile grids collide faster with a spatial hash
+        self._physics.configure_spatial_index(self.width, self.height, self._total_tiles, self._TILE_SIZE)
+
+        # Load both layers' collision shapes up front, switching only changes which one collides
+        self.load_collision_layer("Masks F")
+        self.load_collision_layer("Masks B")
+        self._physics.set_active_layer(self._active_layer)
+
+        # Stream in the regions around the spawn point now, the rest follows the ball
+        if self._streaming:
+            self._streamer = RegionStreamer(self.width, self.height, self._prepare_region,
+                                            self._load_region, self._unload_region)
+            self._streamer.preload(*self._ball.body.position)
+            print(f"Streaming {self._streamer.region_count} regions, "
+                  f"{len(self._streamer.loaded_regions)} loaded around the spawn point")
 
         # Process triggers (always present regardless of active layer)
         self.load_triggers()
         self.initialize_npcs()
         self.initialize_coins()
 
+        # Write the baked copy so the next load skips the TMX parsing
+        if not self._baked_level:
+            try:
+                level_cache.save(tmx_map, self._TILE_SIZE, self.bake_level_data())
+            except Exception as e:
+                print(f"Could not bake level {tmx_map}: {e}")
+
+    def should_stream(self):
+        """Check whether the level is big enough to stream in regions instead of loading it whole"""
+        regions = math.ceil(self.width / STREAM_REGION_SIZE) * math.ceil(self.height / STREAM_REGION_SIZE)
+        return STREAM_LEVELS and regions >= STREAM_MIN_REGIONS
+
+    def get_tile_passes(self):
+        """Get the tile layers composited together, one list per draw pass (None means all remaining layers)"""
+        # Everything is drawn behind the ball
+        return [None]
+
+    def bake_level_data(self):
+        """Collect everything load_tmx needs from the parsed TMX into a cacheable dictionary"""
+        tmx_data = self._tmx_data
+        atlas_indices = {}  # GID -> index into the atlas
+        atlas_images = []
+        layers = []
+        object_tiles = {}
+
+        for layer in tmx_data.visible_layers:
+            if not isinstance(layer, pytmx.TiledTileLayer):
+                continue
+
+            # Flat grid of atlas index + 1, with 0 meaning an empty cell
+            grid = array("I", [0]) * (tmx_data.width * tmx_data.height)
+            for x, y, gid in layer.iter_data():
+                if not gid:
+                    continue
+
+                tile_info = self.get_tile_info(gid)
+                if gid not in atlas_indices:
+                    atlas_indices[gid] = len(atlas_images)
+                    atlas_images.append(tile_info["image"])
+
+                grid[y * tmx_data.width + x] = atlas_indices[gid] + 1
+
+                # Keep only the simple tile properties the Objects layer cares about
+                if layer.name == "Objects":
+                    properties = {key: value for key, value in tile_info["properties"].items()
+                                  if isinstance(value, (str, int, float, bool))}
+                    if properties:
+                        object_tiles[(x, y)] = properties
+
+            layers.append({"name": layer.name, "grid": grid})
+
+        print(f"Baked {len(atlas_images)} unique tiles across {len(layers)} layers")
+
+        return {
+            "width": tmx_data.width,
+            "height": tmx_data.height,
+            "atlas": LevelCache.pack_atlas(atlas_images, self._TILE_SIZE),
+            "layers": layers,
+            "object_tiles": object_tiles,
+            "objects": self._read_object_layers(),
+            "collision": {
+                "Masks F": self._build_collision_specs("Masks F"),
+                "Masks B": self._build_collision_specs("Masks B")
+            },
+            "triggers": self._read_trigger_objects()
+        }
+
     def clear_physics_objects(self):
         """Clear all physics objects from space and memory"""
+        # Unload streamed regions through the streamer so batches still being prepared are dropped too
+        if self._streamer:
+            self._streamer.clear()
+            self._streamer = None
+
         # Remove from physics space
-        for shape in self._static_shapes:
+        for shape in self._static_shapes + self._layer_shapes["F"] + self._layer_shapes["B"]:
             try:
                 self._physics.space.remove(shape)
             except:
                 pass
 
-        for body in self._static_bodies:
-            try:
-                self._physics.space.remove(body)
-            except:
-                pass
-
         # Clear all lists
-        self._static_bodies = []
         self._static_shapes = []
-        self._mask_switch_triggers = []
+        self._layer_shapes = {"F": [], "B": []}
+        self._physics.set_heightfield("F", None)
+        self._physics.set_heightfield("B", None)
+        self._triggers.clear()
         self._finish_tiles = []
         self._music_switch_tiles = []
         self.NPCs = pygame.sprite.Group()
@@ -303,12 +573,7 @@ class PymunkLevel:
     def load_visual_tiles(self):
         """Load visual tiles into the spatial grid with improved NPC and sign handling"""
         # Clear existing visual tiles
-        self._visual_tiles.empty()
-        self._finish_tiles = []
-        self.npc_tiles = []  # Store NPC tiles for initialization later
-        self.sign_objects = []  # New list to store sign objects
-        self._coin_tiles = []  # Store coin tiles for initialization later
-        self.NPCs = pygame.sprite.Group()  # Initialize NPCs group
+        self._reset_tile_lists()
 
         # Cache for better performance
         visible_layers = []
@@ -328,40 +593,32 @@ class PymunkLevel:
             if layer_name == "Masks F" or layer_name == "Masks B":
                 is_visible = False  # Always set mask layers to invisible
 
+            # Streamed layers only keep their GIDs, the sprites are made when a region loads
+            if self._streaming and layer_name != "Objects":
+                map_width = self._tmx_data.width
+                grid = array("I", [0]) * (map_width * self._tmx_data.height)
+                for x, y, gid in layer.iter_data():
+                    if gid:
+                        grid[y * map_width + x] = gid
+                        self._stream_images[gid] = self.get_tile_info(gid)["image"]
+                        self._total_tiles += 1
+                self._stream_layers.append((layer_name, grid, is_visible))
+                continue
+
             # Process tiles in batches for better performance
             batch_count = 0
-            for x, y, gid in layer.tiles():
+            for x, y, gid in layer.iter_data():
                 if gid:
                     world_x = x * self._TILE_SIZE
                     world_y = y * self._TILE_SIZE
 
-                    # Get the tile image
-                    if isinstance(gid, pygame.Surface):
-                        tile_image = gid  # Use it directly
-                    else:
-                        try:
-                            tile_image = self._tmx_data.get_tile_image_by_gid(gid)
-                        except (TypeError, ValueError) as e:
-                            print(f"Error getting image for GID {gid}: {e}")
-                            tile_image = None
-
-                    # Fallback if we couldn't get a proper image
-                    if not tile_image:
-                        tile_image = pygame.Surface((self._TILE_SIZE, self._TILE_SIZE))
-                        tile_image.fill((255, 0, 0))
-
-                    # Create visual tile
-                    visual_tile = pygame.sprite.Sprite()
-                    visual_tile.image = pygame.transform.scale(tile_image, (self._TILE_SIZE, self._TILE_SIZE))
-                    visual_tile.rect = pygame.Rect(world_x, world_y, self._TILE_SIZE, self._TILE_SIZE)
-                    visual_tile.has_collision = (layer_name == "Masks F" or layer_name == "Masks B")
-                    visual_tile.layer_name = layer_name
-                    visual_tile.visible = is_visible
-                    visual_tile.is_finish_line = False  # Default value
+                    # Scaled image and properties are shared by every tile with this GID
+                    tile_info = self.get_tile_info(gid)
+                    visual_tile = self._create_visual_tile(tile_info["image"], world_x, world_y, layer_name, is_visible)
 
                     # Properties handling for Objects layer
                     if layer_name == "Objects":
-                        self._process_object_layer_tile(visual_tile, gid, layer, x, y, world_x, world_y, layer_index=self._tmx_data.layers.index(layer))
+                        self._apply_object_tile_properties(visual_tile, tile_info["properties"], world_x, world_y)
 
                     # Add to the spatial grid for efficient lookup
                     self._spatial_grid.insert(visual_tile)
@@ -378,25 +635,150 @@ class PymunkLevel:
         # Now process object layers for direct object placement (especially signs)
         self._process_object_layers()
         
-        print(f"Total tiles loaded: {self._total_tiles}")
+        print(f"Total tiles loaded: {self._total_tiles} ({len(self._tile_info)} unique)")
         print(f"Found {len(self._finish_tiles)} finish line tiles")
         print(f"Found {len(self.npc_tiles)} NPC tiles for initialization")
         print(f"Found {len(self.sign_objects)} direct sign objects")
 
-    def _process_object_layer_tile(self, visual_tile, gid, layer, x, y, world_x, world_y, layer_index):
-        """Process a tile from the Objects layer"""
-        # Get properties from the tile
+    def load_baked_tiles(self):
+        """Load visual tiles from the baked level data instead of the TMX file"""
+        self._reset_tile_lists()
+
+        # One atlas holds every unique tile, already scaled to the tile size
+        tile_images = LevelCache.unpack_atlas(self._baked_level.pop("atlas"))
+        map_width = self._baked_level["width"]
+        object_tiles = self._baked_level["object_tiles"]
+        if self._streaming:
+            self._stream_images = {index + 1: image for index, image in enumerate(tile_images)}
+
+        for layer in self._baked_level["layers"]:
+            layer_name = layer["name"]
+            is_visible = layer_name != "Masks F" and layer_name != "Masks B"
+
+            # The baked grids already are what the region streamer reads
+            if self._streaming and layer_name != "Objects":
+                self._stream_layers.append((layer_name, layer["grid"], is_visible))
+                self._total_tiles += sum(1 for atlas_index in layer["grid"] if atlas_index)
+                continue
+
+            batch_count = 0
+            for index, atlas_index in enumerate(layer["grid"]):
+                if not atlas_index:
+                    continue
+
+                x, y = index % map_width, index // map_width
+                world_x = x * self._TILE_SIZE
+                world_y = y * self._TILE_SIZE
+
+                visual_tile = self._create_visual_tile(tile_images[atlas_index - 1], world_x, world_y, layer_name, is_visible)
+
+                if layer_name == "Objects" and (x, y) in object_tiles:
+                    self._apply_object_tile_properties(visual_tile, object_tiles[(x, y)], world_x, world_y)
+
+                self._spatial_grid.insert(visual_tile)
+                self._visual_tiles.add(visual_tile)
+                batch_count += 1
+                self._total_tiles += 1
+
+            print(f"  - Added {batch_count} tiles from layer {layer_name}")
+
+        self._process_object_layers(self._baked_level["objects"])
+
+        print(f"Total tiles loaded: {self._total_tiles} ({len(tile_images)} unique)")
+
+    def _reset_tile_lists(self):
+        """Clear the tile lists that are filled while loading visual tiles"""
+        self._visual_tiles.empty()
+        self._finish_tiles = []
+        self.npc_tiles = []  # Store NPC tiles for initialization later
+        self.sign_objects = []  # New list to store sign objects
+        self._coin_tiles = []  # Store coin tiles for initialization later
+        self._rocket_tiles = []
+        self._boss_spawn = None
+        self._stream_layers = []
+        self._stream_images = {}
+        self.NPCs = pygame.sprite.Group()  # Initialize NPCs group
+
+    def _create_visual_tile(self, tile_image, world_x, world_y, layer_name, is_visible):
+        """Create a tile sprite from an image that is already scaled to the tile size"""
+        visual_tile = pygame.sprite.Sprite()
+        visual_tile.image = tile_image
+        visual_tile.rect = pygame.Rect(world_x, world_y, self._TILE_SIZE, self._TILE_SIZE)
+        visual_tile.has_collision = (layer_name == "Masks F" or layer_name == "Masks B")
+        visual_tile.layer_name = layer_name
+        visual_tile.visible = is_visible
+        visual_tile.is_finish_line = False  # Default value
+        return visual_tile
+
+    def get_tile_info(self, gid):
+        """Get the derived data for a GID, worked out once per unique tile instead of once per placed tile"""
+        tile_info = self._tile_info.get(gid)
+        if tile_info is not None:
+            return tile_info
+
         try:
-            if isinstance(gid, pygame.Surface):
-                # Try to get properties through the layer directly
-                properties = self._tmx_data.get_tile_properties(x, y, layer_index) or {}
-            else:
-                # Standard way to get properties
-                properties = self._tmx_data.get_tile_properties_by_gid(gid) or {}
+            properties = self._tmx_data.get_tile_properties_by_gid(gid) or {}
         except Exception as e:
-            print(f"Error getting properties: {e}")
+            print(f"Error getting properties for GID {gid}: {e}")
             properties = {}
 
+        try:
+            tile_image = self._tmx_data.get_tile_image_by_gid(gid)
+        except (TypeError, ValueError) as e:
+            print(f"Error getting image for GID {gid}: {e}")
+            tile_image = None
+
+        # Fallback if we couldn't get a proper image
+        has_image = bool(tile_image)
+        if not has_image:
+            tile_image = pygame.Surface((self._TILE_SIZE, self._TILE_SIZE))
+            tile_image.fill((255, 0, 0))
+
+        shape_type = self.get_shape_type(properties)
+        angle = properties.get('angle', 0)
+
+        tile_info = {
+            "image": pygame.transform.scale(tile_image, (self._TILE_SIZE, self._TILE_SIZE)),
+            "has_image": has_image,
+            "properties": properties,
+            "shape_type": shape_type,
+            "angle": angle,
+            "friction": self.get_friction_for_shape(shape_type, angle),
+            "collision_mask": None,
+            "solid": False
+        }
+        self._tile_info[gid] = tile_info
+        return tile_info
+
+    def get_tile_mask(self, gid):
+        """Get the tile-sized collision mask for a GID, building it only the first time"""
+        tile_info = self.get_tile_info(gid)
+        if tile_info["collision_mask"] is None:
+            if tile_info["shape_type"] == "slope":
+                # Slopes collide as their polygon rather than their artwork
+                surface = pygame.Surface((self._TILE_SIZE, self._TILE_SIZE), pygame.SRCALPHA)
+                vertices = self.get_slope_vertices(0, 0, self._TILE_SIZE, self._TILE_SIZE, tile_info["angle"])
+                pygame.draw.polygon(surface, (255, 255, 255, 255), vertices)
+                mask = pygame.mask.from_surface(surface)
+            elif tile_info["has_image"]:
+                mask = pygame.mask.from_surface(tile_info["image"])
+                # Tiles with (almost) no solid pixels have always collided as a full box
+                if mask.count() < 3:
+                    mask.fill()
+            else:
+                mask = pygame.mask.Mask((self._TILE_SIZE, self._TILE_SIZE), fill=True)
+
+            tile_info["collision_mask"] = mask
+            tile_info["solid"] = mask.count() == self._TILE_SIZE * self._TILE_SIZE
+        return tile_info["collision_mask"]
+
+    def is_tile_solid(self, gid):
+        """Check whether a GID's collision shape fills the whole tile"""
+        self.get_tile_mask(gid)
+        return self._tile_info[gid]["solid"]
+
+    def _apply_object_tile_properties(self, visual_tile, properties, world_x, world_y):
+        """Apply Objects layer tile properties (finish line, NPC, music switch, coin, rocket)"""
         # Handle finish line property
         if properties and properties.get('Finish Line', False):
             visual_tile.is_finish_line = True
@@ -436,24 +818,33 @@ class PymunkLevel:
             self.coin_tiles.append(visual_tile)
             
             print(f"Found coin tile: {visual_tile.coin_type} (value: {visual_tile.coin_value}) at ({world_x}, {world_y})")
-  
-    def _process_object_layers(self):
-        """Process the TiledObjectGroup layers for direct object placement"""
+
+        if properties and properties.get('Rocket', False):
+            # Store rocket launcher position for the boss arena
+            self._rocket_tiles.append((world_x, world_y))
+
+    def _read_object_layers(self):
+        """Read signs, NPC objects and the boss spawn from the TiledObjectGroup layers"""
+        objects = {"signs": [], "npcs": [], "boss_spawn": None}
+
         for layer in self._tmx_data.visible_layers:
             if isinstance(layer, pytmx.TiledObjectGroup):
                 layer_name = layer.name if hasattr(layer, 'name') else "Unnamed"
                 print(f"Processing object layer: {layer_name}")
-                
+
                 # Process all objects in the layer
                 for obj in layer:
+                    if hasattr(obj, 'name') and obj.name == "BossSpawn" and objects["boss_spawn"] is None:
+                        objects["boss_spawn"] = (obj.x, obj.y)
+
                     # Check if this is a sign object
                     properties = obj.properties if hasattr(obj, 'properties') else {}
-                    
+
                     if properties.get('sign', False) or properties.get('Sign', False):
                         # Get sign properties
                         sign_name = properties.get('name', properties.get('Name', 'Sign'))
                         sign_message = properties.get('message', properties.get('Message', 'Read this sign for information.'))
-                        
+
                         # Store sign info for later creation
                         sign_info = {
                             'x': obj.x + (obj.width / 2 if hasattr(obj, 'width') else 0),
@@ -461,37 +852,81 @@ class PymunkLevel:
                             'name': sign_name,
                             'message': sign_message
                         }
-                        
-                        self.sign_objects.append(sign_info)
+
+                        objects["signs"].append(sign_info)
                         print(f"Found sign object: '{sign_name}' at ({sign_info['x']}, {sign_info['y']})")
-                    
+
                     # Check for NPCs as objects (alternative method)
                     elif properties.get('NPC', False) or properties.get('npc', False):
                         # Get NPC properties
                         npc_type = properties.get('NPCType', properties.get('npcType', '')).lower()
                         npc_name = properties.get('NPCName', properties.get('npcName', 'NPC'))
-                        
+
                         # For signs, get the message
                         sign_message = None
                         if npc_type == 'sign':
                             sign_message = properties.get('SignMessage', properties.get('signMessage', 'Read this sign for information.'))
-                        
-                        # Create a temporary object with the necessary attributes
-                        npc_obj = pygame.sprite.Sprite()
-                        npc_obj.rect = pygame.Rect(obj.x, obj.y, 48, 48)
-                        npc_obj.npc_type = npc_type
-                        npc_obj.npc_name = npc_name
-                        
-                        if sign_message:
-                            npc_obj.sign_message = sign_message
-                        
-                        # Add to npc_tiles list
-                        self.npc_tiles.append(npc_obj)
+
+                        objects["npcs"].append({
+                            'x': obj.x,
+                            'y': obj.y,
+                            'type': npc_type,
+                            'name': npc_name,
+                            'message': sign_message
+                        })
                         print(f"Found NPC object: {npc_type} '{npc_name}' at ({obj.x}, {obj.y})")
 
+        return objects
+
+    def _process_object_layers(self, objects=None):
+        """Process the TiledObjectGroup layers for direct object placement"""
+        if objects is None:
+            objects = self._read_object_layers()
+
+        self.sign_objects.extend(dict(sign_info) for sign_info in objects["signs"])
+        self._boss_spawn = objects["boss_spawn"]
+
+        for npc_info in objects["npcs"]:
+            # Create a temporary object with the necessary attributes
+            npc_obj = pygame.sprite.Sprite()
+            npc_obj.rect = pygame.Rect(npc_info['x'], npc_info['y'], 48, 48)
+            npc_obj.npc_type = npc_info['type']
+            npc_obj.npc_name = npc_info['name']
+
+            if npc_info['message']:
+                npc_obj.sign_message = npc_info['message']
+
+            # Add to npc_tiles list
+            self.npc_tiles.append(npc_obj)
+
     def load_collision_layer(self, layer_name):
         """Load collision shapes for a specific layer using masks for precise shapes"""
-        processed_tiles = set()
+        if self._baked_level:
+            specs = self._baked_level["collision"].get(layer_name, [])
+        else:
+            specs = self._build_collision_specs(layer_name)
+
+        layer = "F" if layer_name == "Masks F" else "B"
+
+        # Spawns find the ground in the heightfield, streamed regions may not have their shapes yet
+        heightfield = GroundHeightfield(self.width)
+        heightfield.add_specs(specs)
+        self._physics.set_heightfield(layer, heightfield)
+
+        if self._streaming:
+            # The shapes are built region by region as the ball gets close
+            self._region_specs[layer] = self._split_specs_by_region(specs)
+        else:
+            self._create_collision_shapes(specs, layer)
+
+    def _build_collision_specs(self, layer_name):
+        """Trace the collision shapes for a layer as (kind, vertices, friction, x, y, width, height) tuples"""
+        builder = TerrainBuilder(self._TILE_SIZE, step=4, tolerance=2)
+        block_size = LEVEL_BUILD_BLOCK_TILES
+        tiles = {}  # (tile x, tile y) -> GID
+        samples = {}  # GID -> mask samples
+        frictions = {}
+        solid = set()
 
         # Cache layers for better performance
         collision_layers = []
@@ -499,106 +934,240 @@ class PymunkLevel:
             if isinstance(layer, pytmx.TiledTileLayer) and layer.name == layer_name:
                 collision_layers.append(layer)
 
+        # Work out the per-GID data here since it needs pygame; the tracing only gets plain data
         for layer in collision_layers:
-            layer_index = self._tmx_data.layers.index(layer)
-            
-            for x, y, gid in layer.tiles():
-                if gid:
-                    world_x = x * self._TILE_SIZE
-                    world_y = y * self._TILE_SIZE
-                    tile_key = (world_x, world_y)
-
-                    # Skip if already processed
-                    if tile_key in processed_tiles:
-                        continue
-                    processed_tiles.add(tile_key)
-
-                    # Handle both cases - gid as image or gid as number
-                    properties, tile_image = self._get_tile_properties(gid, x, y, layer_index)
-
-                    # Get shape parameters
-                    shape_type = self.get_shape_type(properties)
-                    angle = properties.get('angle', 0)
-                    friction = self.get_friction_for_shape(shape_type, angle)
-
-                    # Create collision shape based on type
-                    if shape_type == "slope":
-                        vertices = self.get_slope_vertices(world_x, world_y, self._TILE_SIZE, self._TILE_SIZE, angle)
-                        if len(vertices) >= 3:
-                            body, shape = self._physics.create_poly(vertices, friction=friction)
-                            if body and shape:
-                                self._static_bodies.append(body)
-                                self._static_shapes.append(shape)
-                    else:
-                        # Try to create from mask first - important for precise collision detection
-                        success = False
-                        if tile_image:
-                            success = self.create_body_from_mask(tile_image, world_x, world_y, friction)
-
-                        # Fall back to box if needed
-                        if not success:
-                            body, shape = self._physics.create_box(world_x, world_y, self._TILE_SIZE, self._TILE_SIZE, friction=friction)
-                            if body and shape:
-                                self._static_bodies.append(body)
-                                self._static_shapes.append(shape)
-
-    def _get_tile_properties(self, gid, x, y, layer_index):
-        """Get tile properties and image from GID"""
-        if isinstance(gid, pygame.Surface):
-            # Use layer index to get properties
-            try:
-                properties = self._tmx_data.get_tile_properties(x, y, layer_index) or {}
-            except Exception as e:
-                print(f"Error getting properties at ({x}, {y}): {e}")
-                properties = {}
-                
-            # Store gid as image for later use
-            tile_image = gid
-        else:
-            # Standard case - gid is a number
-            try:
-                properties = self._tmx_data.get_tile_properties_by_gid(gid) or {}
-                tile_image = self._tmx_data.get_tile_image_by_gid(gid)
-            except Exception as e:
-                print(f"Error with GID {gid}: {e}")
-                properties = {}
-                tile_image = None
-                
-        return properties, tile_image
+            for x, y, gid in layer.iter_data():
+                if gid and (x, y) not in tiles:
+                    tiles[(x, y)] = gid
+                    if gid not in samples:
+                        samples[gid] = builder.sample_mask(self.get_tile_mask(gid))
+                        frictions[gid] = self.get_tile_info(gid)["friction"]
+                        if self.is_tile_solid(gid):
+                            solid.add(gid)
+
+        # Split the layer into blocks traced in parallel; each block also gets the tiles right around it
+        block_tiles = {}  # (block x, block y) -> tiles
+        for (x, y), gid in tiles.items():
+            bx, by = x // block_size, y // block_size
+            block_xs = [bx] + ([bx - 1] if x % block_size == 0 else []) + ([bx + 1] if x % block_size == block_size - 1 else [])
+            block_ys = [by] + ([by - 1] if y % block_size == 0 else []) + ([by + 1] if y % block_size == block_size - 1 else [])
+            for block in [(block_x, block_y) for block_x in block_xs for block_y in block_ys]:
+                block_tiles.setdefault(block, {})[(x, y)] = gid
+
+        jobs = []
+        for (bx, by), area_tiles in block_tiles.items():
+            jobs.append({
+                "tile_size": self._TILE_SIZE,
+                "step": 4,
+                "tolerance": 2,
+                "area": (bx * block_size, by * block_size, (bx + 1) * block_size, (by + 1) * block_size),
+                "tiles": area_tiles,
+                "samples": samples,
+                "frictions": frictions,
+                "solid": solid
+            })
+
+        start_time = time.time()
+        specs = []
+        segment_count = contour_count = box_count = 0
+        for block_specs, segments, contours, boxes in run_jobs(build_collision_block, jobs, LEVEL_BUILD_WORKERS):
+            specs.extend(block_specs)
+            segment_count += segments
+            contour_count += contours
+            box_count += boxes
+
+        # Chains cut apart at block borders become one chain again
+        specs = join_chain_specs(specs)
+
+        print(f"{layer_name}: {len(tiles)} collision tiles traced into {segment_count} segments "
+              f"({contour_count} contours) and {box_count} interior boxes "
+              f"in {len(jobs)} blocks, {time.time() - start_time:.2f}s")
+
+        return specs
+
+    def _split_specs_by_region(self, specs):
+        """Bucket collision specs by streaming region, cutting chains and boxes at region borders"""
+        size = STREAM_REGION_SIZE
+        columns = max(1, math.ceil(self.width / size))
+        rows = max(1, math.ceil(self.height / size))
+        regions = {}  # (rx, ry) -> specs
+
+        def region_of(x, y):
+            return min(max(int(x // size), 0), columns - 1), min(max(int(y // size), 0), rows - 1)
+
+        for spec in specs:
+            kind, vertices, friction, world_x, world_y, width, height = spec
+            if kind == "chain":
+                # Each segment goes to the region holding its midpoint, consecutive ones stay chained
+                run, run_region = [vertices[0]], None
+                for p1, p2 in zip(vertices, vertices[1:]):
+                    region = region_of((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2)
+                    if run_region is not None and region != run_region:
+                        regions.setdefault(run_region, []).append(chain_spec(run, friction))
+                        run = [p1]
+                    run.append(p2)
+                    run_region = region
+                if run_region is not None:
+                    regions.setdefault(run_region, []).append(chain_spec(run, friction))
+            elif kind == "box":
+                # Boxes are clipped to every region they overlap
+                min_rx, min_ry = region_of(world_x, world_y)
+                max_rx, max_ry = region_of(world_x + width - 1, world_y + height - 1)
+                for ry in range(min_ry, max_ry + 1):
+                    for rx in range(min_rx, max_rx + 1):
+                        left, top = max(world_x, rx * size), max(world_y, ry * size)
+                        right = min(world_x + width, (rx + 1) * size)
+                        bottom = min(world_y + height, (ry + 1) * size)
+                        regions.setdefault((rx, ry), []).append(("box", None, friction, left, top, right - left, bottom - top))
+            else:
+                regions.setdefault(region_of(world_x + width / 2, world_y + height / 2), []).append(spec)
+
+        return regions
+
+    def _create_collision_shapes(self, specs, layer):
+        """Add the static shapes described by collision specs to the space, filtered to a collision layer"""
+        shapes = self._build_collision_shapes(specs, layer)
+
+        # One bulk add instead of one per shape
+        self._physics.space.add(*shapes)
+        self._layer_shapes[layer].extend(shapes)
+
+    def _build_collision_shapes(self, specs, layer):
+        """Build the static shapes described by collision specs without adding them to the space"""
+        shapes = []
+        layer_filter = self._physics.layer_filter(layer)
+
+        # All shapes go on the space's static body
+        for kind, vertices, friction, world_x, world_y, width, height in specs:
+            if kind == "chain":
+                body, chain = self._physics.create_chain(vertices, thickness=1, friction=friction, add_to_space=False)
+                for shape in chain:
+                    shape.filter = layer_filter
+                shapes.extend(chain)
+                continue
 
-    def load_triggers(self):
-        """Load trigger objects from the Invis Objects layer"""
-        # This method is also fine as is - triggers are relatively few
+            body, shape = None, None
+            if vertices:
+                try:
+                    body, shape = self._physics.create_poly(vertices, friction=friction, add_to_space=False)
+                except Exception:
+                    body, shape = None, None
+
+            # Mask and box tiles fall back to a full box, slopes are skipped
+            if not (body and shape) and kind != "slope":
+                body, shape = self._physics.create_box(world_x, world_y, width, height, friction=friction,
+                                                       add_to_space=False)
+
+            if body and shape:
+                shape.filter = layer_filter
+                shapes.append(shape)
+
+        return shapes
+
+    def _prepare_region(self, region):
+        """Build the tile sprites and collision shapes of a streaming region (runs in the background)"""
+        region_rect = self._streamer.region_rect(region)
+        map_width = self.width // self._TILE_SIZE
+        map_height = self.height // self._TILE_SIZE
+        columns = range(region_rect.left // self._TILE_SIZE, min(map_width, region_rect.right // self._TILE_SIZE))
+        rows = range(region_rect.top // self._TILE_SIZE, min(map_height, region_rect.bottom // self._TILE_SIZE))
+
+        tiles = []
+        for layer_name, grid, is_visible in self._stream_layers:
+            for y in rows:
+                row_start = y * map_width
+                for x in columns:
+                    value = grid[row_start + x]
+                    if value:
+                        tiles.append(self._create_visual_tile(self._stream_images[value], x * self._TILE_SIZE,
+                                                              y * self._TILE_SIZE, layer_name, is_visible))
+
+        shapes = {}
+        for layer in ("F", "B"):
+            shapes[layer] = self._build_collision_shapes(self._region_specs[layer].get(region, []), layer)
+
+        return {"tiles": tiles, "shapes": shapes}
+
+    def _load_region(self, region, batch):
+        """Add a prepared streaming region to the spatial grid and the physics space"""
+        for tile in batch["tiles"]:
+            self._spatial_grid.insert(tile)
+        self._visual_tiles.add(batch["tiles"])
+
+        self._physics.space.add(*batch["shapes"]["F"], *batch["shapes"]["B"])
+        for layer, shapes in batch["shapes"].items():
+            self._layer_shapes[layer].extend(shapes)
+
+        # Chunks built before the region was loaded are missing its tiles
+        self._chunk_renderer.invalidate_rect(self._streamer.region_rect(region))
+
+    def _unload_region(self, region, batch):
+        """Remove a streaming region from the spatial grid and the physics space"""
+        for tile in batch["tiles"]:
+            self._spatial_grid.remove(tile)
+        self._visual_tiles.remove(batch["tiles"])
+
+        self._physics.space.remove(*batch["shapes"]["F"], *batch["shapes"]["B"])
+        for layer, shapes in batch["shapes"].items():
+            removed_shapes = set(shapes)
+            self._layer_shapes[layer] = [shape for shape in self._layer_shapes[layer] if shape not in removed_shapes]
+
+        self._chunk_renderer.invalidate_rect(self._streamer.region_rect(region))
+
+    def _read_trigger_objects(self):
+        """Read Loop Switch and Checkpoint objects from the Invis Objects layer"""
+        triggers = []
         for layer in self._tmx_data.visible_layers:
             if isinstance(layer, pytmx.TiledObjectGroup) and layer.name == "Invis Objects":
                 for i, obj in enumerate(layer):
-                    if hasattr(obj, 'name') and obj.name == "Loop Switch":
-                        # Create switch
-                        body, shape = self._physics.create_box(
-                            obj.x, obj.y, obj.width, obj.height,
-                            is_static=True,
-                            collision_type="switch"
-                        )
-
-                        if body and shape:
-                            shape.used = False
-                            shape.switch_id = i
-                            shape.collision_type = self._physics.collision_types["switch"]
-
-                            self._mask_switch_triggers.append(shape)
-                            self._static_bodies.append(body)
-                            self._static_shapes.append(shape)
-                    elif hasattr(obj, 'name') and obj.name == "Checkpoint":
-                        self._checkpoints.append((obj.x, obj.y))
+                    if hasattr(obj, 'name') and obj.name in ("Loop Switch", "Checkpoint"):
+                        triggers.append({
+                            'name': obj.name,
+                            'index': i,
+                            'x': obj.x,
+                            'y': obj.y,
+                            'width': obj.width,
+                            'height': obj.height
+                        })
+        return triggers
+
+    def load_triggers(self):
+        """Register the trigger volumes: Invis Objects triggers, finish line and music switch tiles"""
+        if self._baked_level:
+            triggers = self._baked_level["triggers"]
+        else:
+            triggers = self._read_trigger_objects()
+
+        for trigger in triggers:
+            # Point objects still get an area the ball can touch
+            rect = pygame.Rect(trigger['x'], trigger['y'], max(1, trigger['width']), max(1, trigger['height']))
+            if trigger['name'] == "Loop Switch":
+                self._triggers.add(rect, on_enter=self._on_loop_switch, data=trigger['index'])
+            elif trigger['name'] == "Checkpoint":
+                self._checkpoints.append((trigger['x'], trigger['y']))
+                self._triggers.add(rect, on_enter=self._on_checkpoint, data=(trigger['x'], trigger['y']))
+
+        for tile in self._finish_tiles:
+            self._triggers.add(tile.rect, on_enter=self._on_finish_line)
+        for tile in self._music_switch_tiles:
+            self._triggers.add(tile.rect, on_enter=self._on_music_switch)
+
+    def _on_loop_switch(self, trigger):
+        """Change the collision layer when the ball passes a loop switch"""
+        print(f"Loop switch {trigger.data} passed")
+        self.switch_layer()
+
+    def _on_checkpoint(self, trigger):
+        """Respawn at a checkpoint from now on once the ball reaches it"""
+        self._checkpoint_snapshot = self.take_snapshot(trigger.data)
+        if trigger.data not in self._reached_checkpoints:
+            self._reached_checkpoints.add(trigger.data)
+            self.reach_checkpoint()
+            print(f"Checkpoint reached at {trigger.data}")
 
     def initialize_coins(self):
         """Create coins at their designated positions"""
         
-        # Keep existing coins group if it exists, otherwise create new
-        if not hasattr(self, 'coins') or self.coins is None:
-            self.coins = pygame.sprite.Group()
-            print("created new coins group")
-        
         # Process coin tiles from the Objects layer
         if hasattr(self, 'coin_tiles') and self.coin_tiles:
             print(f"Initializing {len(self.coin_tiles)} coins from tiles...")
@@ -607,24 +1176,10 @@ class PymunkLevel:
                 x, y = coin_tile.rect.center
                 coin_type = getattr(coin_tile, 'coin_type', 'gold').lower()
                 coin_value = getattr(coin_tile, 'coin_value', 10)
-                
-                print(f"Creating {coin_type} coin worth {coin_value} at ({x}, {y})")
-                
-                # Create coin based on type
-                coin = Coin(self._physics, x, y, coin_type=coin_type, value=coin_value)
-                
-                # Add to sprite group
-                self.coins.add(coin)
-                
-                # Verify coin added properly
-                if coin in self.coins:
-                    print(f"Successfully added {coin_type} coin to group")
-                else:
-                    print(f"WARNING: Failed to add {coin_type} coin to group")
-                
-                # Align coin to ground
-                if hasattr(coin, 'align_to_ground'):
-                    coin.align_to_ground(self)
+                self._coin_field.add(x, y, coin_type=coin_type, value=coin_value)
+            
+            # Align coins to ground
+            self._coin_field.align_to_ground(self._physics)
         
         # Add coin collection state if not already present
         if not hasattr(self, '_total_coins_collected'):
@@ -633,47 +1188,30 @@ class PymunkLevel:
             self._coin_score = 0
         
         # Log completion
-        coin_count = len(self.coins) if hasattr(self, 'coins') else 0
-        print(f"Coin initialization complete. {coin_count} coins created.")
+        print(f"Coin initialization complete. {self._coin_field.count} coins created "
+              f"in {self._coin_field.cell_count} grid cells.")
 
     def update_coins(self, dt):
         """Update all coins (add this method to your level class)"""
-        if hasattr(self, 'coins'):
-            # Update all coins
-            self.coins.update(dt)
-            
-            # Remove collected coins
-            for coin in list(self.coins):
-                if coin.collected:
-                    self.coins.remove(coin)
+        self._coin_field.update(dt)
 
     def check_coin_collection(self, player):
         """Check if player collects any coins (add this method to your level class)"""
-        if not hasattr(self, 'coins'):
-            return 0
-        
         coins_collected = 0
         
-        for coin in list(self.coins):
-            if not coin.is_being_collected and not coin.collected:
-                # Check collision with player
-                if player.rect.colliderect(coin.rect):
-                    value = coin.collect()
-                    if value > 0:
-                        coins_collected += 1
-                        self._coin_score += value
-                        self._total_coins_collected += 1
-                        
-                        # Call the existing collect_ring method to integrate with your stats system
-                        if hasattr(player, 'collect_ring'):
-                            player.collect_ring()
-                        elif hasattr(self, 'collect_ring'):
-                            self.collect_ring()
-                        
-                        # You can add sound effects here
-                        # self.play_sound('coin_collect')
-                        
-                        print(f"Collected {coin.coin_type} coin worth {value}! Total score: {self._coin_score}")
+        # Only coins in the grid cells under the player are checked
+        for coin_type, value in self._coin_field.collect(player.rect):
+            coins_collected += 1
+            self._coin_score += value
+            self._total_coins_collected += 1
+            
+            # Call the existing collect_ring method to integrate with your stats system
+            if hasattr(player, 'collect_ring'):
+                player.collect_ring()
+            elif hasattr(self, 'collect_ring'):
+                self.collect_ring()
+            
+            print(f"Collected {coin_type} coin worth {value}! Total score: {self._coin_score}")
         
         return coins_collected
 
@@ -757,13 +1295,7 @@ class PymunkLevel:
         print(f"NPC and sign initialization complete. {npc_count} NPCs and signs created.")
 
     def update(self, dt=0, level_index=0, allow_respawn=True):
-        """Update level state with NPCs and dialogue handling"""
-        clock = pygame.time.Clock()
-        if clock.get_fps() > 0:
-            dt = 1.0 / clock.get_fps()
-        else:
-            dt = 1.0/60.0
-        
+        """Update level state with NPCs and dialogue handling, dt being the real time since the last frame"""
         # Handle timer pausing for dialogue
         if self._in_dialogue and not self._timer.is_paused:
             self._timer.pause()
@@ -793,8 +1325,17 @@ class PymunkLevel:
         
         # Don't update physics if in dialogue
         if not self._in_dialogue:
-            self._ball.update()
-            self._physics.step(dt)
+            # Stream level regions in and out around the ball
+            if self._streamer:
+                self._streamer.update(*self._ball.body.position)
+
+            # Run as many fixed physics steps as the frame time calls for
+            for i in range(self._timestep.advance(dt)):
+                self._fixed_update(self._timestep.step)
+            self._frame_substeps = self._physics.take_substep_count()
+
+            # Show moving objects between the last two physics states
+            self._interpolate(self._timestep.alpha)
             
             # Update NPCs - only if they're near the player for performance
             if hasattr(self, 'NPCs'):
@@ -817,8 +1358,8 @@ class PymunkLevel:
             camera_center_y = -self._camera.offset_y + SCREEN_HEIGHT/2
             self._parallax_bg.update(camera_center_x, camera_center_y)
 
-            # Check for finish line collisions
-            self.check_finish_line()
+            # Finish lines, music switches, checkpoints and loop switches the ball entered or left
+            self._triggers.update(self._ball.rect)
 
             # Check if the ball has fallen off the bottom of the world
             if self._ball.body.position[1] > self.height - 20:
@@ -837,159 +1378,175 @@ class PymunkLevel:
 
     def draw(self, screen, level_index=0):
         """Draw level with optimized tile rendering including NPCs"""
+        camera = self._view_camera()
         level_index=self._level_index
         # Draw parallax background
         self._parallax_bg.draw(screen)
         
-        # Get the current viewport rectangle with buffer zone
-        viewport = pygame.Rect(
-            -self._camera.offset_x, 
-            -self._camera.offset_y, 
-            SCREEN_WIDTH, 
-            SCREEN_HEIGHT
-        )
-        
-        # Expand viewport by buffer to prevent pop-in at edges
-        buffered_viewport = viewport.inflate(self._viewport_buffer * 2, self._viewport_buffer * 2)
-        
-        # Query the spatial grid for visible tiles
-        visible_tiles = self._spatial_grid.query_rect(buffered_viewport)
-        
-        # Update statistics
-        self._rendered_tiles_count = 0
-        self._culled_tiles_count = self._total_tiles - len(visible_tiles)
-        
-        # Define explicit layer order with background first, then other layers
-        layer_order = {"background": 0, "Surface B": 1, "Masks B": 2, "Masks F": 3, "Surface F": 4, "Objects": 5}
-        
-        # Group tiles by layer for batch rendering
-        layer_groups = {}
-        for tile in visible_tiles:
-            if not tile.visible:
-                continue
-                
-            layer_name = getattr(tile, 'layer_name', 'Unknown')
-            if layer_name not in layer_groups:
-                layer_groups[layer_name] = []
-                
-            layer_groups[layer_name].append(tile)
-            self._rendered_tiles_count += 1
-        
-        # Draw visible tiles by layer order
-        for layer_name in sorted(layer_groups.keys(), key=lambda name: layer_order.get(name, 999)):
-            for tile in layer_groups[layer_name]:
-                screen.blit(tile.image, self._camera.apply(tile))
-        
-        # Draw NPCs - All NPCs first, then hide based on distance
-        if hasattr(self, 'NPCs') and self.NPCs:
-            # First update activity state of all NPCs
-            for npc in self.NPCs:
-                if hasattr(npc, 'update'):
-                    # Only pass the ball if it exists and has the right properties
-                    if hasattr(self, '_ball') and hasattr(self._ball, 'body') and hasattr(self._ball.body, 'position'):
-                        npc.update(self._ball)
-                    else:
-                        npc.update()
-            
-            # Now draw only active NPCs
-            npc_count = 0
-            for npc in self.NPCs:
-                # Always draw all NPCs for debugging, or use is_active check for optimization
-                #if True or (hasattr(npc, 'is_active') and npc.is_active):
-                if hasattr(npc, 'is_active') and npc.is_active:
-                    # Draw NPC
-                    screen.blit(npc.image, self._camera.apply(npc))
-                    npc_count += 1
+        # Draw the pre-rendered tile chunks
+        self._chunk_renderer.draw(screen, camera)
+        self._rendered_tiles_count = self._chunk_renderer.chunks_drawn
+        
+        with self._live_state():
+            # Draw NPCs - All NPCs first, then hide based on distance
+            if hasattr(self, 'NPCs') and self.NPCs:
+                # First update activity state of all NPCs, the simulation thread does it while it runs
+                for npc in (self.NPCs if self._render_state is None else ()):
+                    if hasattr(npc, 'update'):
+                        # Only pass the ball if it exists and has the right properties
+                        if hasattr(self, '_ball') and hasattr(self._ball, 'body') and hasattr(self._ball.body, 'position'):
+                            npc.update(self._ball)
+                        else:
+                            npc.update()
+            
+                # Now draw only active NPCs
+                npc_count = 0
+                for npc in self.NPCs:
+                    # Always draw all NPCs for debugging, or use is_active check for optimization
+                    #if True or (hasattr(npc, 'is_active') and npc.is_active):
+                    if hasattr(npc, 'is_active') and npc.is_active:
+                        # Draw NPC
+                        screen.blit(npc.image, camera.apply(npc))
+                        npc_count += 1
                     
-                    # Draw interaction indicator if player is close enough
-                    if hasattr(npc, 'draw_indicator') and hasattr(npc, 'show_indicator') and npc.show_indicator:
-                        npc.draw_indicator(screen, self._camera)
+                        # Draw interaction indicator if player is close enough
+                        if hasattr(npc, 'draw_indicator') and hasattr(npc, 'show_indicator') and npc.show_indicator:
+                            npc.draw_indicator(screen, camera)
         
         # Draw finish line tiles
-        for tile in self._finish_tiles:
-            if buffered_viewport.colliderect(tile.rect):
-                # Get flag_image from constants
-                try:
-                    screen.blit(self._flag_image, self._camera.apply(tile))
-                except ImportError:
-                    # Fallback if flag_image not available
-                    pygame.draw.rect(screen, (255, 0, 0), self._camera.apply_rect(tile.rect), 3)
+        self._draw_finish_tiles(screen, camera)
         
         # Draw the player ball LAST so it's on top of everything
         if hasattr(self, '_ball'):
-            screen.blit(self._ball.image, self._camera.apply(self._ball))
+            self._draw_sprite(screen, self._ball, camera)
 
-        if self.coins:
-            for coin in self.coins:
-                screen.blit(coin.image, self._camera.apply(coin))
+        self._coin_field.draw(screen, camera, self._render_coins)
 
-        # Draw dialogue system if active
-        if self._in_dialogue:
-            self._dialogue_system.draw(screen)
+        with self._live_state():
+            # Draw dialogue system if active
+            if self._in_dialogue:
+                self._dialogue_system.draw(screen)
         
-        # Draw timer in top-left corner (only if not in dialogue or showing results)
-        if not self._in_dialogue and not self._showing_results and self._timer.is_running:
-            self.draw_timer(screen)
+            # Draw timer in top-left corner (only if not in dialogue or showing results)
+            if not self._in_dialogue and not self._showing_results and self._timer.is_running:
+                self.draw_timer(screen)
         
-        # Draw stats HUD in top-right corner
-        if not self._showing_results:
-            self.draw_stats_hud(screen)
+            # Draw stats HUD in top-right corner
+            if not self._showing_results:
+                self.draw_stats_hud(screen)
         
-        # Draw results screen if active
-        if self._showing_results:
-            self._results_screen.draw(screen, level_index=level_index)
+            # Draw results screen if active
+            if self._showing_results:
+                self._results_screen.draw(screen, level_index=level_index)
 
     def draw_timer(self, screen):
         """Draw the timer display"""
-        font = pygame.font.Font(daFont, 18)
         time_text = f"TIME: {self._timer.format_time()}"
-        
-        # Create text with black outline for visibility
-        outline_color = (0, 0, 0)
-        text_color = (255, 255, 255)
-        
-        # Draw outline
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx != 0 or dy != 0:
-                    outline_surf = font.render(time_text, True, outline_color)
-                    screen.blit(outline_surf, (20 + dx, 20 + dy))
-        
-        # Draw main text
-        text_surf = font.render(time_text, True, text_color)
-        screen.blit(text_surf, (20, 20))
+
+        # White text with a black outline for visibility, put together from glyphs since it changes every frame
+        text_renderer.glyphs(18, (255, 255, 255), (0, 0, 0)).draw(screen, time_text, topleft=(20, 20))
 
     def draw_stats_hud(self, screen):
         """Draw current stats in HUD"""
-        font = pygame.font.Font(daFont, 14)
         stats_info = [
             f"Coins: {self._stats.rings_collected}",
             f"Enemies: {self._stats.enemies_defeated}",
             f"Deaths: {self._stats.deaths}"
         ]
+        glyphs = text_renderer.glyphs(14, (255, 255, 255), (0, 0, 0))
         
         for i, stat_text in enumerate(stats_info):
             y_pos = 20 + (i * 30)
-            
-            # Draw outline for visibility
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        outline_surf = font.render(stat_text, True, (0, 0, 0))
-                        screen.blit(outline_surf, (SCREEN_WIDTH - 150 + dx, y_pos + dy))
-            
-            # Draw main text
-            text_surf = font.render(stat_text, True, (255, 255, 255))
-            screen.blit(text_surf, (SCREEN_WIDTH - 150, y_pos))
+
+            # Outlined for visibility
+            glyphs.draw(screen, stat_text, topleft=(SCREEN_WIDTH - 150, y_pos))
+
+    def _fixed_update(self, dt):
+        """Advance the simulation by one fixed physics step"""
+        self._ball.save_position()
+        self._ball.update()
+        self._physics.step(dt)
+
+    def _interpolate(self, alpha):
+        """Place the sprites of physics objects between the last two physics states"""
+        self._ball.interpolate(alpha)
+
+    def render_sprites(self):
+        """Get the sprites that move every step"""
+        return [self._ball]
+
+    def capture_render_state(self):
+        """
+        Get an immutable snapshot of the camera and of where the moving sprites are and which frame
+        they show. It holds copied values only, sprites are named by id, so drawing from it never
+        touches what the simulation is changing.
+        """
+        sprites = []
+        for sprite in self.render_sprites():
+            body = getattr(sprite, 'body', None)
+            x, y = body.position if body is not None else sprite.rect.center
+            # Pooled sprites come back somewhere else, so only physics bodies are interpolated
+            sprites.append((id(sprite), float(x), float(y), sprite.image, body is not None))
+        return (self._camera.offset_x, self._camera.offset_y), tuple(sprites), self._coin_field.capture()
+
+    def apply_render_state(self, previous, latest, alpha):
+        """Place the camera and the moving sprites between two render snapshots for drawing, None stops drawing from snapshots"""
+        if not latest:
+            self._render_state = None
+            self._render_coins = None
+            return
+
+        if self._render_camera is None:
+            self._render_camera = Camera(self.width, self.height)
+        (camera_x, camera_y), sprites, coins = latest
+        (start_camera_x, start_camera_y), previous_sprites, _ = previous or latest
+        self._render_camera.offset_x = start_camera_x + (camera_x - start_camera_x) * alpha
+        self._render_camera.offset_y = start_camera_y + (camera_y - start_camera_y) * alpha
+
+        previous_positions = {key: (x, y) for key, x, y, image, interpolated in previous_sprites}
+        render_state = {}
+        for key, x, y, image, interpolated in sprites:
+            start_x, start_y = previous_positions.get(key, (x, y)) if interpolated else (x, y)
+            render_state[key] = (image, (start_x + (x - start_x) * alpha, start_y + (y - start_y) * alpha))
+        self._render_state = render_state
+        self._render_coins = coins
+
+    def set_simulation_lock(self, lock):
+        """Set the lock the simulation thread holds while it steps the level, None when the level isn't stepped on one"""
+        self._simulation_lock = lock
+
+    def _live_state(self):
+        """Get the simulation lock to hold while drawing parts that read live state rather than the render snapshots"""
+        if self._simulation_lock is not None:
+            return self._simulation_lock
+        return contextlib.nullcontext()
+
+    def _draw_finish_tiles(self, screen, camera):
+        """Draw the finish line flags on screen; the chunk renderer culls the other tiles"""
+        screen_rect = screen.get_rect()
+        for tile in self._finish_tiles:
+            tile_rect = camera.apply_rect(tile.rect)
+            if screen_rect.colliderect(tile_rect):
+                screen.blit(self._flag_image, tile_rect)
+
+    def _view_camera(self):
+        """Get the camera to draw with, the one placed from the render snapshots while they're in use"""
+        return self._render_camera if self._render_state is not None else self._camera
+
+    def _draw_sprite(self, screen, sprite, camera):
+        """Draw a sprite where the render snapshots put it, or where it is if they don't have it"""
+        state = self._render_state.get(id(sprite)) if self._render_state is not None else None
+        if state is None:
+            screen.blit(sprite.image, camera.apply(sprite))
+        else:
+            image, center = state
+            screen.blit(image, camera.apply_rect(image.get_rect(center=center)))
 
     def update_visuals(self):
         """Update visibility of visual tiles based on active layer"""
-        # This needs to update all tiles, but we can optimize the iteration
-        for tile in self._visual_tiles:
-            if tile.layer_name == "Masks F":
-                tile.visible = (self._active_layer == "F")
-            elif tile.layer_name == "Masks B":
-                tile.visible = (self._active_layer == "B")
+        # Only the inactive mask layer is hidden; the renderer keeps chunks for both choices
+        if hasattr(self, '_chunk_renderer'):
+            self._chunk_renderer.set_hidden_layers(["Masks B" if self._active_layer == "F" else "Masks F"])
 
     def handle_player_choice(self, choice_index):
         """Handle when the player selects a dialogue choice"""
@@ -1163,8 +1720,8 @@ class PymunkLevel:
                 # Try to load a portrait based on NPC name
                 portrait_path = os.path.join("assets", "sprites", f"{npc.name.lower()} portrait.png")
                 if os.path.exists(portrait_path):
-                    npc.portrait = pygame.image.load(portrait_path).convert_alpha()
-                    npc.portrait = pygame.transform.scale(npc.portrait, (84, 84))  # Match DialogueSystem portrait size
+                    # Match DialogueSystem portrait size
+                    npc.portrait = asset_cache.image(portrait_path, size=(84, 84), scope=self._asset_scope)
                     print(f"Loaded portrait for {npc.name}")
                 elif hasattr(npc, 'portrait'):
                     # If there's already a portrait attribute but it's None, create a colored portrait
@@ -1203,8 +1760,7 @@ class PymunkLevel:
             try:
                 portrait_path = os.path.join("assets", "sprites", "Red Ball portrait.png")
                 if os.path.exists(portrait_path):
-                    self._player_portrait = pygame.image.load(portrait_path).convert_alpha()
-                    self._player_portrait = pygame.transform.scale(self._player_portrait, (84, 84))
+                    self._player_portrait = asset_cache.image(portrait_path, size=(84, 84), scope=self._asset_scope)
                     print("Loaded player portrait")
                 else:
                     # Create a bright red fallback portrait for visibility
@@ -1236,89 +1792,67 @@ class PymunkLevel:
         # Toggle active layer
         self._active_layer = "B" if self._active_layer == "F" else "F"
         
-        # Clear physics objects
-        self.clear_physics_objects()
-        
-        # Reload collision for the new active layer
-        if self._active_layer == "F":
-            self.load_collision_layer("Masks F")
-        else:
-            self.load_collision_layer("Masks B")
+        # Both layers are already in the space, just change which one the ball collides with
+        self._physics.set_active_layer(self._active_layer)
             
         # Update tile visibility
         self.update_visuals()
         
         return True
     
-    def check_finish_line(self):
-        """Check if player has reached a finish line tile"""
-        # If we're already showing results, don't check again
+    def _on_finish_line(self, trigger):
+        """Finish the level when the ball reaches a finish line tile"""
+        # If we're already showing results, don't finish again
         if self._showing_results:
             return False
             
-        ball_rect = self._ball.rect
-
-        if not self._finish_tiles:
-            return False
-
-        for tile in self._finish_tiles:
-            if ball_rect.colliderect(tile.rect):
-                # Level finished! (but not complete yet)
-                print(f"Finish line reached at {tile.rect.x}, {tile.rect.y}")
-                
-                # Stop timer and calculate final stats
-                final_time = self._timer.stop()
-                self._stats.completion_time = final_time
-                
-                # Show results screen
-                self._results_screen.show_results(self._stats, self._level_index)
-                self._showing_results = True
-                
-                # NEW: Save level progress and check for improvements
-                if hasattr(self, '_gamesave') and self._gamesave:
-                    improvements = self._gamesave.save_level_result(
-                        self._level_index, 
-                        self._stats, 
-                        self._results_screen
-                    )
-                    
-                    # Optional: Store improvements to show in UI later
-                    self._recent_improvements = improvements
-                    
-                    # Optional: Print improvements for debugging
-                    if improvements:
-                        print("🎉 NEW RECORDS:")
-                        for improvement in improvements:
-                            print(f"  - {improvement}")
-                    else:
-                        print("Level completed - no new records this time")
-                else:
-                    print("Warning: GameSave not available - progress not saved")
-                
-                # Pause the game physics/movement while showing results
-                if hasattr(self, '_space'):
-                    # If using pymunk physics, you might want to pause the space
-                    pass
-                
-                return True
-
-        return False
-
-    def check_music_switch(self, track):
-        """Check if player has reached a music switch tile"""
-        if not self._music_switch_tiles or self._music_switched or self._music_switching:
-            return False
+        # Level finished! (but not complete yet)
+        print(f"Finish line reached at {trigger.rect.x}, {trigger.rect.y}")
         
-        ball_rect = self._ball.rect
+        # Stop timer and calculate final stats
+        final_time = self._timer.stop()
+        self._stats.completion_time = final_time
         
-        # Check collision with any music switch tile
-        for tile in self._music_switch_tiles:
-            if ball_rect.colliderect(tile.rect):
-                print(f"Music switch activated at {tile.rect.x}, {tile.rect.y}")
-                self._start_music_transition(track)
-                return True
+        # Show results screen
+        self._results_screen.show_results(self._stats, self._level_index)
+        self._showing_results = True
         
-        return False
+        # NEW: Save level progress and check for improvements
+        if hasattr(self, '_gamesave') and self._gamesave:
+            improvements = self._gamesave.save_level_result(
+                self._level_index, 
+                self._stats, 
+                self._results_screen
+            )
+            
+            # Optional: Store improvements to show in UI later
+            self._recent_improvements = improvements
+            
+            # Optional: Print improvements for debugging
+            if improvements:
+                print("🎉 NEW RECORDS:")
+                for improvement in improvements:
+                    print(f"  - {improvement}")
+            else:
+                print("Level completed - no new records this time")
+        else:
+            print("Warning: GameSave not available - progress not saved")
+        
+        # Pause the game physics/movement while showing results
+        if hasattr(self, '_space'):
+            # If using pymunk physics, you might want to pause the space
+            pass
+        
+        return True
+
+    def _on_music_switch(self, trigger):
+        """Change to the level's switch track when the ball reaches a music switch tile"""
+        if not self._music_switch_track or self._music_switched or self._music_switching:
+            return False
+        
+        print(f"Music switch activated at {trigger.rect.x}, {trigger.rect.y}")
+        self._start_music_transition(self._music_switch_track)
+        return True
 
     def _start_music_transition(self, new_track):
         """Start the music transition process"""
@@ -1335,6 +1869,15 @@ class PymunkLevel:
         switch_thread = threading.Thread(target=self._handle_music_switch)
         switch_thread.daemon = True  # Dies when main thread dies
         switch_thread.start()
+        self._music_switch_thread = switch_thread
+
+    def finish_music_switch(self):
+        """Wait for a music switch in progress, so loading other music afterwards can't race its thread"""
+        switch_thread = self._music_switch_thread
+        if switch_thread is not None and switch_thread is not threading.current_thread():
+            pygame.mixer.music.stop()  # Ends the wait for the fadeout
+            switch_thread.join()
+        self._music_switch_thread = None
 
     def _handle_music_switch(self):
         """Handle the actual music switching after fadeout (runs in separate thread)"""
@@ -1365,42 +1908,41 @@ class PymunkLevel:
             self._ball.death()
 
         if self._ball.is_dead:
-            if self._checkpoints:
-                # Reset to the last checkpoint
-                last_checkpoint = self._checkpoints[-1]
-                spawn_x, spawn_y = last_checkpoint
-            else:
-                # Reset to the original spawn point
-                spawn_x, spawn_y = self._spawn_point
-
-            self._ball.kill()
-
-            # Create a new ball
-            self._ball = PurePymunkBall(self._physics, spawn_x, spawn_y)
+            # Back to the last checkpoint reached or the spawn point, with the same ball
+            self.restore_snapshot(self._checkpoint_snapshot)
             self.player_died()
 
     def create_body_from_mask(self, surface, x, y, friction=0.8, threshold=128):
         """Create a polygon shape from a surface mask - for precise slopes"""
+        try:
+            vertices = self.get_mask_vertices(surface, x, y, threshold)
+            if vertices:
+                body, shape = self._physics.create_poly(vertices, friction=friction)
+                if body and shape:
+                    self._static_shapes.append(shape)
+                    return True
+        except Exception as e:
+            pass
+        return False
+
+    def get_mask_vertices(self, surface, x, y, threshold=128):
+        """Trace a tile surface mask into world-space polygon vertices, or None if it has no usable outline"""
         try:
             if surface is None:
-                return False
+                return None
 
             scaled_surface = pygame.transform.scale(surface, (self._TILE_SIZE, self._TILE_SIZE))
             mask = pygame.mask.from_surface(scaled_surface)
             outline = mask.outline()
             if len(outline) < 3:
-                return False
+                return None
             simplified_outline = self.simplify_polygon(outline, tolerance=2)
             vertices = [(x + point[0], y + point[1]) for point in simplified_outline]
             if len(vertices) >= 3:
-                body, shape = self._physics.create_poly(vertices, friction=friction)
-                if body and shape:
-                    self._static_bodies.append(body)
-                    self._static_shapes.append(shape)
-                    return True
+                return vertices
         except Exception as e:
             pass
-        return False
+        return None
 
     def simplify_polygon(self, points, tolerance=2):
         """Simplify a polygon to reduce vertex count"""
@@ -1470,16 +2012,20 @@ class PymunkLevel:
     
 class CaveLevel(PymunkLevel):
     """Cave-themed level with fog particle effects, using optimized rendering"""
-    def __init__(self, spawn, tmx_map=None, level_index=2, gamesave=None):
-        # Call the optimized parent class constructor but disable default music
-        super().__init__(spawn, tmx_map, play_music=False, level_index=2, gamesave=gamesave)
+    _music_switch_track = os.path.join("assets", "music", "cave.mp3")
+
+    def __init__(self, spawn, tmx_map=None, level_index=2, gamesave=None, play_music=True):
+        # Call the optimized parent class constructor, which starts the cave music through start_music
+        super().__init__(spawn, tmx_map, play_music=play_music, level_index=2, gamesave=gamesave)
         self._level_index = level_index  # Store the level index for music and stats
-        # Set cave-specific music
-        self._setup_cave_music()
         self._gamesave = gamesave
         # Override the parallax background with cave-themed images
         self._setup_cave_background()
     
+    def start_music(self):
+        """Start the cave music"""
+        self._setup_cave_music()
+
     def _setup_cave_music(self):
         """Set up cave-specific music"""
         pygame.mixer_music.load(os.path.join("assets", "music", "level 1.mp3"))
@@ -1506,7 +2052,7 @@ class CaveLevel(PymunkLevel):
         bg_loaded = False
         for bg in cave_bg_paths:
             if os.path.exists(bg["path"]):
-                if self._parallax_bg.add_layer(bg["path"], bg["factor"]):
+                if self._parallax_bg.add_layer(bg["path"], bg["factor"], scope=self._asset_scope):
                     bg_loaded = True
         
         # If no cave backgrounds are found, use fallback
@@ -1516,6 +2062,10 @@ class CaveLevel(PymunkLevel):
             self._parallax_bg.add_color_layer((30, 25, 40), 0.3)  # Dark purple-grey
             self._parallax_bg.add_color_layer((40, 30, 50), 0.5)  # Medium purple-grey
     
+    def get_tile_passes(self):
+        """Background is drawn behind the ball, every other layer in front of it"""
+        return [["background"], None]
+
     def update(self, dt=0, level_index=2, allow_respawn=True):
         """Update level state including fog particles"""
         # Call the parent update method
@@ -1523,123 +2073,75 @@ class CaveLevel(PymunkLevel):
     
     def draw(self, screen, level_index=2):
         """Draw level with fog effects"""
+        camera = self._view_camera()
         level_index = self._level_index
         # Draw parallax background
         self._parallax_bg.draw(screen)
         
-        # Get the current viewport rectangle with buffer zone
-        viewport = pygame.Rect(
-            -self._camera.offset_x, 
-            -self._camera.offset_y, 
-            SCREEN_WIDTH, 
-            SCREEN_HEIGHT
-        )
-
-        self.check_music_switch(os.path.join("assets", "music", "cave.mp3"))
-
-        # Expand viewport by buffer to prevent pop-in at edges
-        buffered_viewport = viewport.inflate(self._viewport_buffer * 2, self._viewport_buffer * 2)
-        
-        # Query the spatial grid for visible tiles
-        visible_tiles = self._spatial_grid.query_rect(buffered_viewport)
-        
-        # Update statistics
-        self._rendered_tiles_count = 0
-        self._culled_tiles_count = self._total_tiles - len(visible_tiles)
-        
-        # Define explicit layer order with background first, then other layers
-        layer_order = {"background": 0, "Surface B": 1, "Masks B": 2, "Masks F": 3, "Surface F": 4, "Objects": 5}
-        
-        # Group tiles by layer for batch rendering
-        layer_groups = {}
-        for tile in visible_tiles:
-            if not tile.visible:
-                continue
-                
-            layer_name = getattr(tile, 'layer_name', 'Unknown')
-            if layer_name not in layer_groups:
-                layer_groups[layer_name] = []
-                
-            layer_groups[layer_name].append(tile)
-            self._rendered_tiles_count += 1
-        
-        # First draw only background layer if it exists
-        if "background" in layer_groups:
-            for tile in layer_groups["background"]:
-                screen.blit(tile.image, self._camera.apply(tile))
+        # First draw the background chunks
+        self._chunk_renderer.draw(screen, camera, 0)
         
         # Now draw the ball AFTER background but BEFORE other tiles
         if hasattr(self, '_ball'):
-            screen.blit(self._ball.image, self._camera.apply(self._ball))
-        
-        # Draw remaining layers (excluding background which was already drawn)
-        for layer_name in sorted(layer_groups.keys(), key=lambda name: layer_order.get(name, 999)):
-            if layer_name != "background":  # Skip background as it's already drawn
-                for tile in layer_groups[layer_name]:
-                    screen.blit(tile.image, self._camera.apply(tile))
-        
-        # Draw NPCs - All NPCs first, then hide based on distance
-        if hasattr(self, 'NPCs') and self.NPCs:
-            # First update activity state of all NPCs
-            for npc in self.NPCs:
-                if hasattr(npc, 'update'):
-                    # Only pass the ball if it exists and has the right properties
-                    if hasattr(self, '_ball') and hasattr(self._ball, 'body') and hasattr(self._ball.body, 'position'):
-                        npc.update(self._ball)
-                    else:
-                        npc.update()
-            
-            # Now draw only active NPCs
-            npc_count = 0
-            for npc in self.NPCs:
-                if hasattr(npc, 'is_active') and npc.is_active:
-                    # Draw NPC
-                    screen.blit(npc.image, self._camera.apply(npc))
-                    npc_count += 1
+            self._draw_sprite(screen, self._ball, camera)
+        
+        # Draw the chunks of the remaining layers in front of the ball
+        self._chunk_renderer.draw(screen, camera, 1)
+        self._rendered_tiles_count = self._chunk_renderer.chunks_drawn
+        
+        with self._live_state():
+            # Draw NPCs - All NPCs first, then hide based on distance
+            if hasattr(self, 'NPCs') and self.NPCs:
+                # First update activity state of all NPCs, the simulation thread does it while it runs
+                for npc in (self.NPCs if self._render_state is None else ()):
+                    if hasattr(npc, 'update'):
+                        # Only pass the ball if it exists and has the right properties
+                        if hasattr(self, '_ball') and hasattr(self._ball, 'body') and hasattr(self._ball.body, 'position'):
+                            npc.update(self._ball)
+                        else:
+                            npc.update()
+            
+                # Now draw only active NPCs
+                npc_count = 0
+                for npc in self.NPCs:
+                    if hasattr(npc, 'is_active') and npc.is_active:
+                        # Draw NPC
+                        screen.blit(npc.image, camera.apply(npc))
+                        npc_count += 1
                     
-                    # Draw interaction indicator if player is close enough
-                    if hasattr(npc, 'draw_indicator') and hasattr(npc, 'show_indicator') and npc.show_indicator:
-                        npc.draw_indicator(screen, self._camera)
+                        # Draw interaction indicator if player is close enough
+                        if hasattr(npc, 'draw_indicator') and hasattr(npc, 'show_indicator') and npc.show_indicator:
+                            npc.draw_indicator(screen, camera)
         
         # Draw finish line tiles
-        for tile in self._finish_tiles:
-            if buffered_viewport.colliderect(tile.rect):
-                # Get flag_image from constants
-                try:
-                    screen.blit(self._flag_image, self._camera.apply(tile))
-                except ImportError:
-                    # Fallback if flag_image not available
-                    pygame.draw.rect(screen, (255, 0, 0), self._camera.apply_rect(tile.rect), 3)
+        self._draw_finish_tiles(screen, camera)
 
-        if self.coins:
-            for coin in self.coins:
-                screen.blit(coin.image, self._camera.apply(coin))
+        self._coin_field.draw(screen, camera, self._render_coins)
 
-        # Draw dialogue system if active
-        if self._in_dialogue:
-            self._dialogue_system.draw(screen)
+        with self._live_state():
+            # Draw dialogue system if active
+            if self._in_dialogue:
+                self._dialogue_system.draw(screen)
         
-                # Draw timer in top-left corner (only if not in dialogue or showing results)
-        if not self._in_dialogue and not self._showing_results and self._timer.is_running:
-            self.draw_timer(screen)
+                    # Draw timer in top-left corner (only if not in dialogue or showing results)
+            if not self._in_dialogue and not self._showing_results and self._timer.is_running:
+                self.draw_timer(screen)
         
-        # Draw stats HUD in top-right corner
-        if not self._showing_results:
-            self.draw_stats_hud(screen)
+            # Draw stats HUD in top-right corner
+            if not self._showing_results:
+                self.draw_stats_hud(screen)
         
-        # Draw results screen if active
-        if self._showing_results:
-            self._results_screen.draw(screen, level_index=level_index)
+            # Draw results screen if active
+            if self._showing_results:
+                self._results_screen.draw(screen, level_index=level_index)
 
 class SpaceLevel(PymunkLevel):
     """Space-themed level with low gravity and space backgrounds"""
     
-    def __init__(self, spawn, tmx_map=None, level_index=4, gamesave=None):
-        # Call parent constructor with disabled music
-        super().__init__(spawn, tmx_map, play_music=False, level_index=4, gamesave=gamesave)
+    def __init__(self, spawn, tmx_map=None, level_index=4, gamesave=None, play_music=True):
+        # Call parent constructor, which starts the space music through start_music
+        super().__init__(spawn, tmx_map, play_music=play_music, level_index=4, gamesave=gamesave)
         self._level_index = level_index  # Store the level index for music and stats
-        # Set space-specific music
-        self._setup_space_music()
         self._gamesave = gamesave
         # Override gravity with a much lower value
         self._physics.space.gravity = (0, 450)  # Adjusted for space-like conditions
@@ -1647,6 +2149,10 @@ class SpaceLevel(PymunkLevel):
         # Set up space-themed parallax background
         self._setup_space_background()
     
+    def start_music(self):
+        """Start the space music"""
+        self._setup_space_music()
+
     def _setup_space_music(self):
         """Set up space-themed music"""
         global CURRENT_TRACK
@@ -1678,7 +2184,7 @@ class SpaceLevel(PymunkLevel):
         bg_loaded = False
         for bg in space_bg_paths:
             if os.path.exists(bg["path"]):
-                if self._parallax_bg.add_layer(bg["path"], bg["factor"]):
+                if self._parallax_bg.add_layer(bg["path"], bg["factor"], scope=self._asset_scope):
                     bg_loaded = True
                     print(f"Loaded space background: {bg['path']}")
         
@@ -1705,6 +2211,10 @@ class SpaceLevel(PymunkLevel):
         # Add the starfield as a layer with minimal parallax
         self._parallax_bg.add_surface(bg_surface, 0.05)
     
+    def get_tile_passes(self):
+        """Background is drawn behind the ball, every other layer in front of it"""
+        return [["background"], None]
+
     def update(self, dt=0, level_index=4, allow_respawn=True):
         """Update level state with space-specific behaviors"""
         # Call the parent update method first
@@ -1712,118 +2222,74 @@ class SpaceLevel(PymunkLevel):
     
     def draw(self, screen, level_index=0):
         """Draw the space level with the ball rendered behind everything else"""
+        camera = self._view_camera()
         level_index = self._level_index
         # Draw parallax background
         self._parallax_bg.draw(screen)
         
-        # Get the current viewport rectangle with buffer zone
-        viewport = pygame.Rect(
-            -self._camera.offset_x, 
-            -self._camera.offset_y, 
-            SCREEN_WIDTH, 
-            SCREEN_HEIGHT
-        )
-        
-        # Expand viewport by buffer to prevent pop-in at edges
-        buffered_viewport = viewport.inflate(self._viewport_buffer * 2, self._viewport_buffer * 2)
-        
-        # Query the spatial grid for visible tiles
-        visible_tiles = self._spatial_grid.query_rect(buffered_viewport)
-        
-        # Update statistics
-        self._rendered_tiles_count = 0
-        self._culled_tiles_count = self._total_tiles - len(visible_tiles)
-        
-        # Define explicit layer order with background first, then other layers
-        layer_order = {"background": 0, "Surface B": 1, "Masks B": 2, "Masks F": 3, "Surface F": 4, "Objects": 5}
-        
-        # Group tiles by layer for batch rendering
-        layer_groups = {}
-        for tile in visible_tiles:
-            if not tile.visible:
-                continue
-                
-            layer_name = getattr(tile, 'layer_name', 'Unknown')
-            if layer_name not in layer_groups:
-                layer_groups[layer_name] = []
-                
-            layer_groups[layer_name].append(tile)
-            self._rendered_tiles_count += 1
-        
-        # First draw only background layer if it exists
-        if "background" in layer_groups:
-            for tile in layer_groups["background"]:
-                screen.blit(tile.image, self._camera.apply(tile))
+        # First draw the background chunks
+        self._chunk_renderer.draw(screen, camera, 0)
         
         # Now draw the ball AFTER background but BEFORE other tiles
         if hasattr(self, '_ball'):
-            screen.blit(self._ball.image, self._camera.apply(self._ball))
-        
-        # Draw remaining layers (excluding background which was already drawn)
-        for layer_name in sorted(layer_groups.keys(), key=lambda name: layer_order.get(name, 999)):
-            if layer_name != "background":  # Skip background as it's already drawn
-                for tile in layer_groups[layer_name]:
-                    screen.blit(tile.image, self._camera.apply(tile))
-        
-        # Draw NPCs - All NPCs first, then hide based on distance
-        if hasattr(self, 'NPCs') and self.NPCs:
-            # First update activity state of all NPCs
-            for npc in self.NPCs:
-                if hasattr(npc, 'update'):
-                    # Only pass the ball if it exists and has the right properties
-                    if hasattr(self, '_ball') and hasattr(self._ball, 'body') and hasattr(self._ball.body, 'position'):
-                        npc.update(self._ball)
-                    else:
-                        npc.update()
-            
-            # Now draw only active NPCs
-            npc_count = 0
-            for npc in self.NPCs:
-                if hasattr(npc, 'is_active') and npc.is_active:
-                    # Draw NPC
-                    screen.blit(npc.image, self._camera.apply(npc))
-                    npc_count += 1
+            self._draw_sprite(screen, self._ball, camera)
+        
+        # Draw the chunks of the remaining layers in front of the ball
+        self._chunk_renderer.draw(screen, camera, 1)
+        self._rendered_tiles_count = self._chunk_renderer.chunks_drawn
+        
+        with self._live_state():
+            # Draw NPCs - All NPCs first, then hide based on distance
+            if hasattr(self, 'NPCs') and self.NPCs:
+                # First update activity state of all NPCs, the simulation thread does it while it runs
+                for npc in (self.NPCs if self._render_state is None else ()):
+                    if hasattr(npc, 'update'):
+                        # Only pass the ball if it exists and has the right properties
+                        if hasattr(self, '_ball') and hasattr(self._ball, 'body') and hasattr(self._ball.body, 'position'):
+                            npc.update(self._ball)
+                        else:
+                            npc.update()
+            
+                # Now draw only active NPCs
+                npc_count = 0
+                for npc in self.NPCs:
+                    if hasattr(npc, 'is_active') and npc.is_active:
+                        # Draw NPC
+                        screen.blit(npc.image, camera.apply(npc))
+                        npc_count += 1
                     
-                    # Draw interaction indicator if player is close enough
-                    if hasattr(npc, 'draw_indicator') and hasattr(npc, 'show_indicator') and npc.show_indicator:
-                        npc.draw_indicator(screen, self._camera)
+                        # Draw interaction indicator if player is close enough
+                        if hasattr(npc, 'draw_indicator') and hasattr(npc, 'show_indicator') and npc.show_indicator:
+                            npc.draw_indicator(screen, camera)
         
         # Draw finish line tiles
-        for tile in self._finish_tiles:
-            if buffered_viewport.colliderect(tile.rect):
-                # Get flag_image from constants
-                try:
-                    screen.blit(self._flag_image, self._camera.apply(tile))
-                except ImportError:
-                    # Fallback if flag_image not available
-                    pygame.draw.rect(screen, (255, 0, 0), self._camera.apply_rect(tile.rect), 3)
-
-        if self.coins:
-            for coin in self.coins:
-                screen.blit(coin.image, self._camera.apply(coin))
+        self._draw_finish_tiles(screen, camera)
+
+        self._coin_field.draw(screen, camera, self._render_coins)
                 
-        # Draw dialogue system if active
-        if self._in_dialogue:
-            self._dialogue_system.draw(screen)
+        with self._live_state():
+            # Draw dialogue system if active
+            if self._in_dialogue:
+                self._dialogue_system.draw(screen)
         
-                # Draw timer in top-left corner (only if not in dialogue or showing results)
-        if not self._in_dialogue and not self._showing_results and self._timer.is_running:
-            self.draw_timer(screen)
+                    # Draw timer in top-left corner (only if not in dialogue or showing results)
+            if not self._in_dialogue and not self._showing_results and self._timer.is_running:
+                self.draw_timer(screen)
         
-        # Draw stats HUD in top-right corner
-        if not self._showing_results:
-            self.draw_stats_hud(screen)
+            # Draw stats HUD in top-right corner
+            if not self._showing_results:
+                self.draw_stats_hud(screen)
         
-        # Draw results screen if active
-        if self._showing_results:
-            self._results_screen.draw(screen, level_index=level_index)
+            # Draw results screen if active
+            if self._showing_results:
+                self._results_screen.draw(screen, level_index=level_index)
 
 class BossArena(SpaceLevel):
     """The final Level is a bossfight against Cubodeez The Almighty Cube"""
     
-    def __init__(self, spawn, tmx_map=None):
-        # Call parent constructor but disable default music
-        super().__init__(spawn, tmx_map)
+    def __init__(self, spawn, tmx_map=None, play_music=True):
+        # Call parent constructor, which starts the boss music through start_music
+        super().__init__(spawn, tmx_map, play_music=play_music)
         
         # Set proper space gravity (use SpaceLevel's gravity)
         self._physics.space.gravity = (0, 450)  # Same as SpaceLevel
@@ -1837,9 +2303,6 @@ class BossArena(SpaceLevel):
         # Make physics space available to boss for collision filtering
         self._setup_physics_properties()
         
-        # Set boss-specific music
-        self._setup_boss_music()
-        
         # Load sound effects
         self._load_sound_effects()
         
@@ -1853,8 +2316,6 @@ class BossArena(SpaceLevel):
         # Performance optimizations
         self._update_frame_counter = 0
         self._help_text_alpha = 255  # For fading help text
-        self._help_text_surf = None  # Cache help text surface
-        self._boss_name_surf = None  # Cache boss name text
         self._cached_health_width = -1  # For health bar optimization
         self._player_defeat_sound = None
         
@@ -1869,7 +2330,11 @@ class BossArena(SpaceLevel):
 
         # Initialize rocket launchers group
         self._rocket_launchers = pygame.sprite.Group()
-        self._explosions = pygame.sprite.Group()
+
+        # Explosions and rockets are made now so the fight itself never loads or allocates them
+        self._explosion_pool = EntityPool(lambda: Explosion(start=False), EXPLOSION_POOL_SIZE, EXPLOSION_POOL_MAX_LIVE)
+        self._rocket_pool = EntityPool(lambda: Rocket(start=False), ROCKET_POOL_SIZE, ROCKET_POOL_MAX_LIVE)
+        self._explosions = self._explosion_pool.live
         
         # Game over flag - this will be set when player dies
         self._game_over_triggered = False
@@ -1902,11 +2367,11 @@ class BossArena(SpaceLevel):
             self._physics.collision_types["launcher"] = 6  # Assign a unique collision type for launchers
         
         # Setup boss vs launcher collision handler
-        boss_launcher_handler = self._physics.space.on_collision(
+        self._physics.on_collision(
             self._physics.collision_types["boss"],
-            self._physics.collision_types["launcher"]
+            self._physics.collision_types["launcher"],
+            begin=self.on_hit_launcher
         )
-        boss_launcher_handler.begin = self.on_hit_launcher
 
     def on_hit_launcher(self, arbiter, space, data):
         """Destroy rocket launchers when the boss touches them"""
@@ -1927,6 +2392,14 @@ class BossArena(SpaceLevel):
         
         return True
     
+    def expected_dynamic_bodies(self):
+        """Get how many dynamic bodies the arena simulates at once: the ball and the boss"""
+        return 2
+
+    def start_music(self):
+        """Start the boss music"""
+        self._setup_boss_music()
+
     def _setup_boss_music(self):
         """Set up boss-specific music"""
         global CURRENT_TRACK
@@ -1949,8 +2422,8 @@ class BossArena(SpaceLevel):
     def _load_sound_effects(self):
         """Load boss-related sound effects"""
         try:
-            self._boss_intro_sound = pygame.mixer.Sound(os.path.join("assets", "sounds", "boss_intro.mp3"))
-            self._boss_defeat_sound = pygame.mixer.Sound(os.path.join("assets", "sounds", "boss_defeat.mp3"))
+            self._boss_intro_sound = asset_cache.sound(os.path.join("assets", "sounds", "boss_intro.mp3"), scope=self._asset_scope)
+            self._boss_defeat_sound = asset_cache.sound(os.path.join("assets", "sounds", "boss_defeat.mp3"), scope=self._asset_scope)
         except:
             print("Could not load boss sound effects")
             self._boss_intro_sound = None
@@ -1972,8 +2445,8 @@ class BossArena(SpaceLevel):
 
         # Create an arrow surface (or load one if you have an image)
         try:
-            self._arrow_image = pygame.image.load(os.path.join("assets", "sprites", "arrow.png"))
-            self._arrow_image = pygame.transform.scale(self._arrow_image, (self._arrow_size, self._arrow_size))
+            self._arrow_image = asset_cache.image(os.path.join("assets", "sprites", "arrow.png"),
+                                                  size=(self._arrow_size, self._arrow_size), scope=self._asset_scope)
         except:
             # Create a triangular arrow if image loading fails
             self._arrow_image = None
@@ -2004,14 +2477,6 @@ class BossArena(SpaceLevel):
         self._game_over_fade_alpha = 0  # Start at 0 (transparent)
         self._game_over_fade_speed = 255  # Alpha units per second
         self._game_over_buttons_ready = False
-        
-        # Font for game over screen - adjusted size
-        try:
-            self._game_over_font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 28)  # Smaller size
-            self._button_font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 24)
-        except:
-            self._game_over_font = pygame.font.SysFont(None, 36)  # Smaller fallback
-            self._button_font = pygame.font.SysFont(None, 28)
     
     def _setup_victory_sequence(self):
         """Set up the victory sequence variables"""
@@ -2060,51 +2525,26 @@ class BossArena(SpaceLevel):
         """Find and place rocket launchers at marked rocket tiles or objects"""
         rocket_count = 0
         
-        # Process tile layers for rocket properties
-        for layer in self._tmx_data.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer) and layer.name == "Objects":
-                print(f"Searching for rocket tiles in Objects layer")
-                
-                # Get the layer index for direct property access
-                layer_index = self._tmx_data.layers.index(layer)
-                
-                for x, y, gid in layer.tiles():
-                    # Try two different methods to get properties
-                    if isinstance(gid, pygame.Surface):
-                        # For direct image tiles, try using coordinates and layer index
-                        properties = self._tmx_data.get_tile_properties(x, y, layer_index) or {}
-                        print(f"Image tile at ({x}, {y}) properties: {properties}")
-                    else:
-                        # For tileset-based tiles, use GID
-                        properties = self._tmx_data.get_tile_properties_by_gid(gid) or {}
-                        print(f"Tileset tile at ({x}, {y}) properties: {properties}")
-                    
-                    # Check if this tile is marked as a rocket launcher
-                    if properties.get('Rocket', False):
-                        # Create rocket launcher logic
-                        world_x = x * self._TILE_SIZE
-                        world_y = y * self._TILE_SIZE
-                        
-                        launcher = RocketLauncher(
-                            world_x + self._TILE_SIZE // 2,
-                            world_y + self._TILE_SIZE // 2,
-                            self._boss,
-                            explosion_group=self._explosions
-                        )
-                        self._rocket_launchers.add(launcher)
-                        rocket_count += 1
-                        print(f"Placed tile-based rocket launcher at ({world_x}, {world_y})")
+        # Rocket tiles are collected from the Objects layer while the level loads
+        for world_x, world_y in self._rocket_tiles:
+            launcher = RocketLauncher(
+                world_x + self._TILE_SIZE // 2,
+                world_y + self._TILE_SIZE // 2,
+                self._boss,
+                explosion_pool=self._explosion_pool,
+                rocket_pool=self._rocket_pool
+            )
+            self._rocket_launchers.add(launcher)
+            rocket_count += 1
+            print(f"Placed tile-based rocket launcher at ({world_x}, {world_y})")
         
         print(f"Found and placed {rocket_count} rocket launchers")
     
     def _get_boss_spawn_point(self):
         """Find a suitable spawn point for the boss based on level design"""
         # Check if there's a designated spawn point in the level data
-        for layer in self._tmx_data.visible_layers:
-            if isinstance(layer, pytmx.TiledObjectGroup):
-                for obj in layer:
-                    if hasattr(obj, 'name') and obj.name == "BossSpawn":
-                        return obj.x, obj.y
+        if self._boss_spawn:
+            return self._boss_spawn
         
         # Fallback: Place boss on the other side of the level from the player
         spawn_x = 500
@@ -2312,37 +2752,74 @@ class BossArena(SpaceLevel):
         # Mark buttons as ready
         self._game_over_buttons_ready = True
     
-    def reset_level(self):
-        """Completely reload the entire level as if quitting and relogging, but keep the music playing."""
-        print("Resetting the entire level...")
-
-        # Clear all physics objects
-        self.clear_physics_objects()
-        # Reset all attributes to their initial state
-        self.__init__(self._spawn_point, self._tmx_map)
+    def reset(self):
+        """Reset the level along with the boss, its rocket launchers and the game over and victory state"""
+        # Take the boss and the launchers out of the space before the new ones are made
+        if self._boss and self._boss.body in self._physics.space.bodies:
+            try:
+                self._physics.space.remove(self._boss.body, self._boss.shape)
+            except:
+                pass
+        for launcher in self._rocket_launchers:
+            if launcher.body in self._physics.space.bodies:
+                self._physics.space.remove(launcher.body, launcher.shape)
+        self._rocket_launchers.empty()
+        self._rocket_pool.clear()
+        self._explosion_pool.clear()
+        self._explosion_group.empty()
+        print(f"Effect pools: {self._explosion_pool.created} explosions and {self._rocket_pool.created} rockets made, "
+              f"{self._explosion_pool.exhausted + self._rocket_pool.exhausted} spawns refused at the cap")
 
-        # Reload the TMX map
-        if self._tmx_map:
-            self.load_tmx(self._tmx_map)
+        super().reset()
 
-        # Reinitialize the boss
-        self._boss = None
-        self.initialize_boss()
+        # Boss state, the boss itself is created again once the intro is over
+        self._initialize_boss_state()
+        self._setup_player_death_handling()
+        self._setup_victory_sequence()
+        self._camera_shake_amount = 0
+        self._camera_shake_duration = 0
+        self._help_text_alpha = 255
+        self._cached_health_width = -1
 
-        # Reset game state flags
-        self._boss_active = False
-        self._boss_intro_played = False
-        self._boss_defeated = False
-        self._intro_timer = 3.0
-        self._intro_sequence_active = True
-        self._intro_fade_in = 0.0
-        self._intro_text_scale = 1.0
-        self._show_game_over = False
+        # Game over screen
         self._game_over_triggered = False
         self._game_over_fade_alpha = 0
         self._game_over_buttons_ready = False
-        self._show_credits = False
-        self._game_over_music_played = False
+
+    def take_snapshot(self, position=None):
+        """Record the world state along with the boss's state machine and the launchers' uses left"""
+        snapshot = super().take_snapshot(position)
+
+        # The boss and launchers are kept by reference, a snapshot only applies to the ones it was taken of
+        boss = getattr(self, '_boss', None)
+        if boss and boss.body.space is not None:
+            snapshot["boss"] = (boss, boss.snapshot())
+        launchers = getattr(self, '_rocket_launchers', ())
+        snapshot["launchers"] = [(launcher, launcher.snapshot()) for launcher in launchers]
+        return snapshot
+
+    def restore_snapshot(self, snapshot):
+        """Put the world, the boss and the launchers back in a state taken with take_snapshot"""
+        super().restore_snapshot(snapshot)
+
+        if "boss" in snapshot:
+            boss, boss_snapshot = snapshot["boss"]
+            if boss is self._boss:
+                boss.restore_snapshot(boss_snapshot)
+        for launcher, launcher_snapshot in snapshot.get("launchers", []):
+            if launcher in self._rocket_launchers:
+                launcher.restore_snapshot(launcher_snapshot)
+
+    def reset_level(self):
+        """Reset the entire level as if quitting and relogging, but keep the music playing."""
+        print("Resetting the entire level...")
+
+        # Tiles and collision stay as they are, everything else starts over
+        self.reset()
+        self._timer.start()
+
+        # Reinitialize the boss
+        self.initialize_boss()
 
         print("Level reset complete.")
     
@@ -2375,8 +2852,8 @@ class BossArena(SpaceLevel):
         # Get boss position for the explosion
         boss_x, boss_y = self._boss.body.position
         
-        # Create a large explosion at the boss's position
-        self._boss_explosion = Explosion(boss_x, boss_y)
+        # Create a large explosion at the boss's position, louder if there's no defeat sound
+        self._boss_explosion = Explosion(boss_x, boss_y, volume=0.7 if self._boss_defeat_sound else 1.0)
         
         # Scale up the explosion to be bigger than the boss
         explosion_scale = self._boss.size / 50  # Adjust based on boss size and explosion sprite size
@@ -2393,10 +2870,6 @@ class BossArena(SpaceLevel):
         # Play defeat sound if available
         if self._boss_defeat_sound:
             self._boss_defeat_sound.play()
-        else:
-            # Fallback to explosion sound if defeat sound isn't available
-            if hasattr(self._boss_explosion, 'explosion_sound') and self._boss_explosion.explosion_sound:
-                self._boss_explosion.explosion_sound.set_volume(1.0)  # Make it louder
         
         # Apply camera shake for impact
         self._shake_camera(1.0, 20)
@@ -2497,8 +2970,8 @@ class BossArena(SpaceLevel):
                     # Stop any boss-related sounds that might still be playing
                     if self._boss_defeat_sound:
                         self._boss_defeat_sound.stop()
-                    if self._boss_explosion and hasattr(self._boss_explosion, 'explosion_sound'):
-                        self._boss_explosion.explosion_sound.stop()
+                    if self._boss_explosion and self._boss_explosion.explosion_channel:
+                        self._boss_explosion.explosion_channel.stop()
 
         # Intro sequence handling
         if self._intro_sequence_active:
@@ -2602,17 +3075,15 @@ class BossArena(SpaceLevel):
     
     def _update_gameplay(self, dt):
         """Update core gameplay elements"""
-        # Update rocket launchers with player, keys, and dt
         keys = pygame.key.get_pressed()
         if keys[pygame.K_F11]:
             self.boss.health = 0  # For testing purposes, set boss health to 0
-        for launcher in self._rocket_launchers:
-            launcher.update(dt, self._ball, keys)
         
         # Update explosions
         self._explosions.update(dt)
         
-        # Call parent update for normal gameplay (skip if transitioning)
+        # Call parent update for normal gameplay (skip if transitioning),
+        # the rocket launchers and the boss are stepped along with the physics in _fixed_update
         if not self._fading_to_black and not self._boss_defeated:
             super().update(dt, allow_respawn=False)
         
@@ -2620,10 +3091,8 @@ class BossArena(SpaceLevel):
         if not self._boss_active or not self._boss:
             return
             
-        # Update boss state (unless defeated)
+        # Check the boss state (unless defeated)
         if not self._boss_defeated:
-            self._boss.update()
-            
             # Check for direct player squishing by boss
             self._check_boss_player_collision()
             
@@ -2631,6 +3100,47 @@ class BossArena(SpaceLevel):
             if self._boss and self._boss.health <= 0 and not self._boss_defeated:
                 self.handle_boss_defeat()
     
+    def _fixed_update(self, dt):
+        """Advance the ball, the rocket launchers and the boss by one fixed physics step"""
+        # The intro, game over and victory sequences only step the ball
+        in_gameplay = not (self._intro_sequence_active or self._game_over_triggered or self._boss_defeated)
+        boss_running = in_gameplay and self._boss_active and self._boss
+
+        # Update rocket launchers with player, keys, and dt
+        if in_gameplay:
+            keys = pygame.key.get_pressed()
+            for launcher in self._rocket_launchers:
+                launcher.save_positions()
+                launcher.update(dt, self._ball, keys)
+
+        if boss_running:
+            self._boss.save_position()
+
+        super()._fixed_update(dt)
+
+        if boss_running:
+            self._boss.update(dt)
+
+    def _interpolate(self, alpha):
+        """Place the ball, the boss and the rockets between the last two physics states"""
+        super()._interpolate(alpha)
+        if self._boss and self._boss_active and not self._boss_defeated:
+            self._boss.interpolate(alpha)
+        for launcher in self._rocket_launchers:
+            launcher.interpolate(alpha)
+
+    def render_sprites(self):
+        """Get the ball, the boss while it fights and the rockets and explosions"""
+        sprites = super().render_sprites()
+        if self._boss and self._boss_active and not self._boss_defeated:
+            sprites.append(self._boss)
+        for launcher in self._rocket_launchers:
+            sprites.extend(launcher.rockets)
+        sprites.extend(self._explosions)
+        if self._boss_defeated and self._boss_explosion:
+            sprites.append(self._boss_explosion)
+        return sprites
+    
     def _check_boss_player_collision(self):
         """Check for direct collision between boss and player"""
         if not self._boss or not self._boss_active or not self._ball:
@@ -2654,6 +3164,7 @@ class BossArena(SpaceLevel):
     
     def draw(self, screen):
         """Draw the boss arena with all elements"""
+        camera = self._view_camera()
         # If showing credits, only draw them
         if self._show_credits and self._credits:
             # Let the credits class handle the drawing completely
@@ -2663,57 +3174,59 @@ class BossArena(SpaceLevel):
         # Draw the level (from parent class)
         super().draw(screen)
 
-        # Draw rocket launchers
-        for launcher in self._rocket_launchers:
-            launcher.draw(screen, self._camera)
-        
-        # Draw active rockets
-        for launcher in self._rocket_launchers:
-            for rocket in launcher.rockets:
-                screen.blit(rocket.image, self._camera.apply(rocket))
-        
-        # Draw explosions
-        for explosion in self._explosions:
-            screen.blit(explosion.image, self._camera.apply(explosion))
-        
-        # If the boss is defeated, draw the big explosion instead of the boss
-        if self._boss_defeated and self._boss_explosion:
-            if hasattr(self._boss_explosion, 'rect') and hasattr(self._boss_explosion, 'image'):
-                screen.blit(self._boss_explosion.image, self._camera.apply(self._boss_explosion))
-        # Otherwise draw the boss if it's active and exists
-        elif self._boss_active and self._boss:
-            # Draw Cubodeez's target marker first
-            self._boss.draw(screen, self._camera)
-            
-            # Draw the boss sprite itself
-            screen.blit(self._boss.image, self._camera.apply(self._boss))
-        
-        # Draw boss health bar if active
-        if self._boss_active and self._boss and not self._boss_defeated:
-            self._draw_boss_health_bar(screen)
-            
-        # Draw intro/outro text
-        if self._intro_sequence_active and not self._boss_intro_played:
-            self._draw_intro_text(screen)
-        elif self._boss_defeated and not self._show_credits:
-            self._draw_victory_text(screen)
-        
-        # Draw help text for player
-        if self._boss_active and self._boss and self._boss.vulnerable and not self._boss_defeated:
-            self._draw_help_text(screen)
-        
-        # Draw boss arrow (if boss is off-screen)
-        self.draw_boss_arrow(screen)
-
-        # Draw game over screen if needed
-        if self._show_game_over:
-            self._draw_game_over_screen(screen)
-            
-        # Draw fade to black overlay for transition to credits
-        if self._fading_to_black:
-            fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            fade_surface.fill((0, 0, 0, self._fade_alpha))
-            screen.blit(fade_surface, (0, 0))
+        # Rockets, explosions and the boss overlays are read live, only the sprites come from the snapshots
+        with self._live_state():
+            # Draw rocket launchers
+            for launcher in self._rocket_launchers:
+                launcher.draw(screen, camera)
+        
+            # Draw active rockets
+            for launcher in self._rocket_launchers:
+                for rocket in launcher.rockets:
+                    self._draw_sprite(screen, rocket, camera)
+        
+            # Draw explosions
+            for explosion in self._explosions:
+                self._draw_sprite(screen, explosion, camera)
+        
+            # If the boss is defeated, draw the big explosion instead of the boss
+            if self._boss_defeated and self._boss_explosion:
+                if hasattr(self._boss_explosion, 'rect') and hasattr(self._boss_explosion, 'image'):
+                    self._draw_sprite(screen, self._boss_explosion, camera)
+            # Otherwise draw the boss if it's active and exists
+            elif self._boss_active and self._boss:
+                # Draw Cubodeez's target marker first
+                self._boss.draw(screen, camera)
+            
+                # Draw the boss sprite itself
+                self._draw_sprite(screen, self._boss, camera)
+        
+            # Draw boss health bar if active
+            if self._boss_active and self._boss and not self._boss_defeated:
+                self._draw_boss_health_bar(screen)
+            
+            # Draw intro/outro text
+            if self._intro_sequence_active and not self._boss_intro_played:
+                self._draw_intro_text(screen)
+            elif self._boss_defeated and not self._show_credits:
+                self._draw_victory_text(screen)
+        
+            # Draw help text for player
+            if self._boss_active and self._boss and self._boss.vulnerable and not self._boss_defeated:
+                self._draw_help_text(screen)
+        
+            # Draw boss arrow (if boss is off-screen)
+            self.draw_boss_arrow(screen)
+
+            # Draw game over screen if needed
+            if self._show_game_over:
+                self._draw_game_over_screen(screen)
+            
+            # Draw fade to black overlay for transition to credits
+            if self._fading_to_black:
+                fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+                fade_surface.fill((0, 0, 0, self._fade_alpha))
+                screen.blit(fade_surface, (0, 0))
     
     def _draw_boss_health_bar(self, screen):
         """Draw the boss health bar at the top of the screen"""
@@ -2740,46 +3253,20 @@ class BossArena(SpaceLevel):
         pygame.draw.rect(screen, (0, 0, 0), (x, y, bar_width, bar_height), 2)
         
         # Draw boss name
-        try:
-            font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 14)
-        except:
-            font = pygame.font.SysFont(None, 24)
-            
-        # Cache boss name surface for better performance
-        if not self._boss_name_surf:
-            self._boss_name_surf = font.render("CUBODEEZ THE ALMIGHTY CUBE", True, (255, 255, 255))
-        
-        text_rect = self._boss_name_surf.get_rect(center=(SCREEN_WIDTH // 2, y + bar_height // 2))
-        screen.blit(self._boss_name_surf, text_rect)
+        text_renderer.draw(screen, "CUBODEEZ THE ALMIGHTY CUBE", 14, (255, 255, 255),
+                           center=(SCREEN_WIDTH // 2, y + bar_height // 2))
     
     def _draw_help_text(self, screen):
         """Draw help text when boss is vulnerable"""
-        # Cache help text for better performance
-        if not self._help_text_surf:
-            try:
-                font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 16)
-            except:
-                font = pygame.font.SysFont(None, 24)
-                
-            help_text = "CUBODEEZ IS VULNERABLE! USE THE ROCKET LAUNCHERS!"
-            self._help_text_surf = font.render(help_text, True, (255, 255, 0))
-            self._help_text_shadow = font.render(help_text, True, (0, 0, 0))
-            
-        text_rect = self._help_text_surf.get_rect(center=(screen.get_width()//2, 80))
-        
+        help_text = "CUBODEEZ IS VULNERABLE! USE THE ROCKET LAUNCHERS!"
+        center = (screen.get_width() // 2, 80)
+
         # Draw with shadow for better visibility
-        shadow_rect = self._help_text_shadow.get_rect(center=(text_rect.centerx+2, text_rect.centery+2))
-        
-        screen.blit(self._help_text_shadow, shadow_rect)
-        screen.blit(self._help_text_surf, text_rect)
+        text_renderer.draw(screen, help_text, 16, (0, 0, 0), center=(center[0] + 2, center[1] + 2))
+        text_renderer.draw(screen, help_text, 16, (255, 255, 0), center=center)
     
     def _draw_intro_text(self, screen):
         """Draw boss introduction text"""
-        try:
-            font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 24)
-        except:
-            font = pygame.font.SysFont(None, 36)
-            
         # Create a semi-transparent overlay with fade-in effect
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, int(128 * self._intro_fade_in)))  # Fade in the overlay
@@ -2792,7 +3279,7 @@ class BossArena(SpaceLevel):
             
             # Draw boss name with dramatic effect
             # Introduce the boss with a scaling effect based on timer
-            boss_text = font.render("CUBODEEZ THE ALMIGHTY CUBE", True, (255, 50, 50))
+            boss_text = text_renderer.render("CUBODEEZ THE ALMIGHTY CUBE", 24, (255, 50, 50))
             
             # Scale text for dramatic effect
             scaled_width = int(boss_text.get_width() * self._intro_text_scale)
@@ -2818,27 +3305,20 @@ class BossArena(SpaceLevel):
             screen.blit(boss_text, text_rect)
             
             # Draw subtitle with fade-in
-            subtitle = font.render("PREPARE TO BE SQUISHED", True, (255, 200, 200))
+            subtitle = text_renderer.render("PREPARE TO BE SQUISHED", 24, (255, 200, 200)).copy()
             subtitle.set_alpha(text_alpha)
             subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, text_rect.bottom + 40))
             screen.blit(subtitle, subtitle_rect)
     
     def _draw_victory_text(self, screen):
         """Draw victory text after defeating the boss"""
-        try:
-            font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 36)
-        except:
-            font = pygame.font.SysFont(None, 48)
-            
         # Create a semi-transparent overlay
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
         # Draw victory text
-        victory_text = font.render("ENEMY FELLED", True, (200, 255, 200))
-        text_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        screen.blit(victory_text, text_rect)
+        text_renderer.draw(screen, "ENEMY FELLED", 36, (200, 255, 200), center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
     
     def _draw_game_over_screen(self, screen):
         """Draw game over screen when the player is defeated by Cubodeez"""
@@ -2854,22 +3334,19 @@ class BossArena(SpaceLevel):
             
             # Draw game over text - main text centered
             game_over_text = "You have been terminated"
-            text_surf = self._game_over_font.render(game_over_text, True, (255, 255, 255))
+            text_size = 28
             
             # Ensure text isn't too wide for screen
-            if text_surf.get_width() > SCREEN_WIDTH - 40:
+            if text_renderer.render(game_over_text, text_size, (255, 255, 255)).get_width() > SCREEN_WIDTH - 40:
                 # Recreate with smaller font
-                try:
-                    smaller_font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 22)
-                    text_surf = smaller_font.render(game_over_text, True, (255, 255, 255))
-                except:
-                    text_surf = pygame.font.SysFont(None, 28).render(game_over_text, True, (255, 255, 255))
+                text_size = 22
             
-            # Position in center
+            # Rendered text is shared, so copy it before applying alpha
+            text_surf = text_renderer.render(game_over_text, text_size, (255, 255, 255)).copy()
             text_rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
             
             # Draw text shadow for better visibility
-            shadow_surf = self._game_over_font.render(game_over_text, True, (0, 0, 0))
+            shadow_surf = text_renderer.render(game_over_text, text_size, (0, 0, 0)).copy()
             shadow_rect = shadow_surf.get_rect(center=(text_rect.centerx + 3, text_rect.centery + 3))
             
             # Apply alpha to text surfaces
@@ -2889,9 +3366,7 @@ class BossArena(SpaceLevel):
                 pygame.draw.rect(screen, (100, 0, 0), self._retry_button_rect, 3)
                 
                 retry_text = "RETRY"
-                retry_surf = self._button_font.render(retry_text, True, retry_color)
-                retry_text_rect = retry_surf.get_rect(center=self._retry_button_rect.center)
-                screen.blit(retry_surf, retry_text_rect)
+                text_renderer.draw(screen, retry_text, 24, retry_color, center=self._retry_button_rect.center)
                 
                 # Draw menu button with hover effect
                 menu_color = (220, 220, 0) if self._button_hover["menu"] else (200, 200, 200)
@@ -2899,9 +3374,7 @@ class BossArena(SpaceLevel):
                 pygame.draw.rect(screen, (100, 0, 0), self._menu_button_rect, 3)
                 
                 menu_text = "MENU"
-                menu_surf = self._button_font.render(menu_text, True, menu_color)
-                menu_text_rect = menu_surf.get_rect(center=self._menu_button_rect.center)
-                screen.blit(menu_surf, menu_text_rect)
+                text_renderer.draw(screen, menu_text, 24, menu_color, center=self._menu_button_rect.center)
     
     def handle_events(self, event):
         """Handle boss arena-specific events"""
@@ -3001,4 +3474,150 @@ class BossArena(SpaceLevel):
     
     @property
     def boss_defeated(self):
-        return self._boss_defeated
\ No newline at end of file
+        return self._boss_defeated
+
+def bake_level(tmx_map, tile_size=64):
+    """Parse a TMX file once and write its baked data to the level cache"""
+    # Only the TMX helpers of PymunkLevel are needed, not a playable level
+    level = PymunkLevel.__new__(PymunkLevel)
+    level._TILE_SIZE = tile_size
+    level._tmx_data = pytmx.load_pygame(tmx_map)
+    level._tile_info = {}
+    level_cache.save(tmx_map, tile_size, level.bake_level_data())
+
+
+def create_level(level_index, gamesave=None, play_music=True):
+    """Build the level for a level index with the level class it uses"""
+    tmx_map, spawn = levels[level_index], spawn_points[level_index]
+    if level_index in [2, 3]:
+        return CaveLevel(tmx_map=tmx_map, spawn=spawn, level_index=level_index, gamesave=gamesave, play_music=play_music)
+    elif level_index == 4:
+        return SpaceLevel(tmx_map=tmx_map, spawn=spawn, level_index=level_index, gamesave=gamesave, play_music=play_music)
+    elif level_index == 5:
+        return BossArena(tmx_map=tmx_map, spawn=spawn, play_music=play_music)
+    return PymunkLevel(tmx_map=tmx_map, spawn=spawn, level_index=level_index, gamesave=gamesave, play_music=play_music)
+
+class LevelPrefetcher:
+    """
+    Builds the levels the player is likely to pick next in a background thread, so starting
+    one of them only takes as long as the fade. Levels the player leaves are reset and kept
+    as well, so retrying or re-entering them is just as quick. At most max_levels built levels
+    are kept within the memory budget, dropping the least recently wanted one first.
+    """
+    def __init__(self, gamesave=None, max_levels=PREFETCH_MAX_LEVELS, memory_budget_mb=PREFETCH_MEMORY_BUDGET_MB):
+        self._gamesave = gamesave
+        self._max_levels = max_levels
+        self._memory_budget = memory_budget_mb * 1024 * 1024
+        self._levels = collections.OrderedDict()  # level index -> (level, estimated bytes)
+        self._wanted = None  # Level index to build next
+        self._building = None  # Level index being built right now
+        self._running = False
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def prebuilt_levels(self):
+        """Get the indices of the levels that are ready"""
+        with self._lock:
+            return list(self._levels)
+
+    def is_ready(self, level_index):
+        """Check whether a level has been built already"""
+        with self._lock:
+            return level_index in self._levels
+
+    def keeps(self, level):
+        """Check whether a level is one of the built levels kept here, which still need their assets"""
+        with self._lock:
+            return any(kept is level for kept, size in self._levels.values())
+
+    def prefetch(self, level_index):
+        """Start building a level in the background unless it is built or being built already"""
+        with self._lock:
+            if level_index in self._levels:
+                self._levels.move_to_end(level_index)
+                return
+            if level_index == self._building:
+                return
+
+            # Only the latest guess is worth building next
+            self._wanted = level_index
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(target=self._build_loop, daemon=True)
+                self._thread.start()
+
+    def take(self, level_index):
+        """Hand over a prebuilt level, waiting for the build in progress if there is one; None if it isn't there"""
+        with self._lock:
+            self._wanted = None  # The player has decided, other guesses can wait
+            entry = self._levels.pop(level_index, None)
+            thread = self._thread if entry is None and self._running else None
+
+        # Waiting also means two levels are never built at the same time
+        if thread is not None:
+            thread.join()
+            with self._lock:
+                entry = self._levels.pop(level_index, None)
+
+        return entry[0] if entry else None
+
+    def store(self, level_index, level):
+        """Reset a level the player has left and keep it for the next time it is picked"""
+        try:
+            level.reset()
+            size = level.estimate_memory()
+        except Exception as e:
+            print(f"Failed to keep level {level_index + 1}: {e}")
+            return
+
+        with self._lock:
+            replaced, size = self._levels.get(level_index, (None, 0))
+            if replaced is not None and replaced is not level:
+                replaced.release_assets()
+            self._levels[level_index] = (level, size)
+            self._levels.move_to_end(level_index)
+            self._trim()
+
+    def clear(self):
+        """Drop every prebuilt level along with the assets only it used"""
+        with self._lock:
+            self._wanted = None
+            for level, size in self._levels.values():
+                level.release_assets()
+            self._levels.clear()
+
+    def _build_loop(self):
+        """Build the wanted levels one at a time until nothing more is wanted"""
+        while True:
+            with self._lock:
+                level_index = self._wanted
+                self._wanted = None
+                self._building = level_index
+                if level_index is None:
+                    self._running = False
+                    return
+
+            try:
+                start_time = time.time()
+                # Prebuilt levels stay silent until they are played (see PymunkLevel.begin)
+                level = create_level(level_index, self._gamesave, play_music=False)
+                size = level.estimate_memory()
+                print(f"Prefetched level {level_index + 1} in {time.time() - start_time:.2f}s (~{size // (1024 * 1024)} MB)")
+            except Exception as e:
+                print(f"Failed to prefetch level {level_index + 1}: {e}")
+                level = None
+
+            with self._lock:
+                self._building = None
+                if level is not None:
+                    self._levels[level_index] = (level, size)
+                    self._trim()
+
+    def _trim(self):
+        """Drop the least recently wanted levels over the count or memory limits (lock held)"""
+        while self._levels and (len(self._levels) > self._max_levels or
+                                sum(size for level, size in self._levels.values()) > self._memory_budget):
+            level_index, (level, size) = self._levels.popitem(last=False)
+            level.release_assets()
+            print(f"Dropped built level {level_index + 1} to stay within the level cache limits")
@@ -1,6 +1,9 @@
 import pygame, os, math, random, pymunk
+import numpy as np
 
 from constants import *
+from utils import sprite_bakes, EntityPool
+from asset_cache import asset_cache
 
 class GameObject(pygame.sprite.Sprite):
     """Base class for all game objects"""
@@ -148,14 +151,40 @@ class AnimatedGameObject(GameObject):
         self._current_frame = int(self._frame) % len(self._images)
         self.image = self._images[self._current_frame]
 
-class Rocket(GameObject):
+class PooledGameObject(GameObject):
+    """Game object that can be handed out by an EntityPool, going back to it when killed"""
+    def __init__(self, x, y):
+        super().__init__(x, y)
+        self._pool = None
+
+    @property
+    def pool(self):
+        """Get the pool the object belongs to, None if it isn't pooled"""
+        return self._pool
+
+    @pool.setter
+    def pool(self, value):
+        """Set the pool the object belongs to"""
+        self._pool = value
+
+    def reset(self, x, y):
+        """Start the object over at a point, to be overridden by child classes"""
+        self.rect.center = (x, y)
+
+    def kill(self):
+        """Remove the object from its groups and put it back in its pool"""
+        super().kill()
+        if self._pool:
+            self._pool.release(self)
+
+class Rocket(PooledGameObject):
     """Tracking rocket that homes in on Cubodeez"""
-    def __init__(self, x, y, target):
+    def __init__(self, x=0, y=0, target=None, start=True):
         super().__init__(x, y)
         # Load rocket image
         try:
-            self._original_image = pygame.image.load(os.path.join('assets', "sprites", "gun", 'rocket.png')).convert_alpha()
-            self.image = self._original_image.copy()
+            self._original_image = asset_cache.image(os.path.join('assets', "sprites", "gun", 'rocket.png'))
+            self.image = self._original_image
         except:
             # Fallback if image can't be loaded
             self._create_fallback_image()
@@ -166,6 +195,7 @@ class Rocket(GameObject):
         
         # Physics properties
         self._position = pygame.math.Vector2(x, y)
+        self._previous_position = pygame.math.Vector2(x, y)  # Position before the last update
         self._velocity = pygame.math.Vector2(0, 0)
         self._acceleration = pygame.math.Vector2(0, 0)
         self._max_speed = 24
@@ -174,9 +204,27 @@ class Rocket(GameObject):
         # Tracking characteristics
         self._seek_weight = 1.0
         self._hit_distance = 50  # Distance at which the rocket explodes on the target
+        self._rocket_channel = None
         
         # Load sound effect
         self._load_sound()
+
+        # Pooled rockets are made idle and started by reset
+        if start:
+            self.reset(x, y, target)
+
+    def reset(self, x, y, target):
+        """Launch the rocket from a point towards a target, reusing it if it flew before"""
+        self._target = target
+        self._position.update(x, y)
+        self._previous_position.update(x, y)
+        self._velocity.update(0, 0)
+        self._acceleration.update(0, 0)
+        self.image = self._original_image
+        self.rect.size = self.image.get_size()
+        self.rect.center = (x, y)
+        if self._rocket_sound:
+            self._rocket_channel = self._rocket_sound.play()  # Loop the sound until explosion
     
     def _create_fallback_image(self):
         """Create a fallback image if the rocket image can't be loaded"""
@@ -188,9 +236,7 @@ class Rocket(GameObject):
     def _load_sound(self):
         """Load the rocket sound effect"""
         try:
-            self._rocket_sound = pygame.mixer.Sound(os.path.join('assets', 'sounds', 'rocket_sound.mp3'))
-            self._rocket_sound.set_volume(0.4)
-            self._rocket_sound.play()  # Loop the sound until explosion
+            self._rocket_sound = asset_cache.sound(os.path.join('assets', 'sounds', 'rocket_sound.mp3'), volume=0.4)
         except:
             self._rocket_sound = None
             print("Could not load rocket sound")
@@ -219,7 +265,16 @@ class Rocket(GameObject):
     def acceleration(self, value):
         self._acceleration = value
     
+    def save_position(self):
+        """Remember the position before an update"""
+        self._previous_position.update(self._position)
+
+    def interpolate(self, alpha):
+        """Place the sprite between the last two updates"""
+        self.rect.center = self._previous_position.lerp(self._position, alpha)
+
     def update(self):
+        """Steer towards the target, run once per physics step"""
         # Apply steering behaviors for tracking
         if self._target:
             # Get desired direction to target
@@ -269,24 +324,24 @@ class Rocket(GameObject):
         # Update rocket rotation to face movement direction
         if self._velocity.length() > 0:
             angle = math.degrees(math.atan2(self._velocity.y, self._velocity.x))
-            self.image = pygame.transform.rotate(self._original_image, -angle)
+            self.image = sprite_bakes.rotated(self._original_image, -angle, "rocket")  # Shared by every rocket
             self.rect = self.image.get_rect(center=self.rect.center)
         
         return False  # Rocket continues flying
     
     def kill(self):
-        # Stop sound when rocket is destroyed
-        if hasattr(self, '_rocket_sound') and self._rocket_sound:
-            self._rocket_sound.stop()
-        Explosion(self.rect.centerx, self.rect.centery)  # Create explosion at the rocket's position
-        super().kill()
+        # Stop sound when rocket is destroyed, only this rocket's since the sound is shared
+        if self._rocket_channel and self._rocket_channel.get_sound() == self._rocket_sound:
+            self._rocket_channel.stop()
+        self._rocket_channel = None
+        super().kill()  # The launcher shows the hit explosion
 
 class RocketLauncher(GameObject):
     """Class for the rocket launcher that targets Cubodeez"""
-    def __init__(self, x, y, target, explosion_group=None):
+    def __init__(self, x, y, target, explosion_pool=None, rocket_pool=None):
         super().__init__(x, y)
         try:
-            self.image = pygame.image.load(os.path.join('assets', "sprites", "gun", 'rocket launcher.png')).convert_alpha()
+            self.image = asset_cache.image(os.path.join('assets', "sprites", "gun", 'rocket launcher.png'))
         except:
             # Fallback image if file not found
             self._create_fallback_image()
@@ -298,7 +353,8 @@ class RocketLauncher(GameObject):
         self._uses_left = 2
         self.rect = self.image.get_rect(center=(x, y))
         self._target = target  # Reference to Cubodeez
-        self._explosion_group = explosion_group
+        self._explosion_pool = explosion_pool  # Launch flashes and hits, none without a pool
+        self._rocket_pool = rocket_pool if rocket_pool is not None else EntityPool(lambda: Rocket(start=False), 1, 1)
         self._rockets = pygame.sprite.Group()  # Group to track active rockets
         
         # Timing parameters
@@ -329,9 +385,9 @@ class RocketLauncher(GameObject):
     def _setup_ui(self):
         """Set up UI elements for the rocket launcher"""
         # Load E prompt font and create text
-        self._font = pygame.font.Font(None, 36)  # Default font if custom font fails
+        self._font = asset_cache.font(None, 36)  # Default font if custom font fails
         try:
-            self._font = pygame.font.Font(daFont, 18)
+            self._font = asset_cache.font(daFont, 18)
         except:
             print("Could not load custom font, using default")
         
@@ -342,8 +398,7 @@ class RocketLauncher(GameObject):
     def _load_sound(self):
         """Load the rocket launch sound"""
         try:
-            self._launch_sound = pygame.mixer.Sound(os.path.join('assets', 'sounds', 'rocket.mp3'))
-            self._launch_sound.set_volume(0.5)
+            self._launch_sound = asset_cache.sound(os.path.join('assets', 'sounds', 'rocket.mp3'), volume=0.5)
         except:
             self._launch_sound = None
             print("Could not load rocket launch sound")
@@ -372,6 +427,19 @@ class RocketLauncher(GameObject):
     @property
     def uses_left(self):
         return self._uses_left
+
+    def snapshot(self):
+        """Get the launcher's uses left, to put it back with restore_snapshot"""
+        return {"uses_left": self._uses_left}
+
+    def restore_snapshot(self, snapshot):
+        """Put the launcher back in a state taken with snapshot, with no rocket on the way"""
+        self._uses_left = snapshot["uses_left"]
+        self._active = False
+        self._firing_in_progress = False
+        self._firing_delay = 0
+        for rocket in list(self._rockets):
+            rocket.kill()
     
     def check_player_proximity(self, player):
         """Check if player is close enough to interact with launcher using world coordinates"""
@@ -449,14 +517,16 @@ class RocketLauncher(GameObject):
         # Update launch timer
         self._last_launch_time = current_time
         
-        # Create and return a new rocket
+        # Send off a rocket from the pool
         try:
-            # Create the rocket with proper parameters
-            rocket = Rocket(
+            rocket = self._rocket_pool.spawn(
                 self.rect.centerx,  # Start from the center of the launcher
                 self.rect.top,      # Start from the top of the launcher
                 self._target           # Target is the boss
             )
+            if rocket is None:
+                print("Cannot launch: too many rockets in flight")
+                return None
             
             # Add to the rockets group
             self._rockets.add(rocket)
@@ -467,10 +537,8 @@ class RocketLauncher(GameObject):
                 self._launch_sound.play()
                 
             # Create a small launch explosion effect
-            if self._explosion_group:
-                # Make sure Explosion class is available
-                launch_explosion = Explosion(self.rect.centerx, self.rect.top - 10)
-                self._explosion_group.add(launch_explosion)
+            if self._explosion_pool:
+                self._explosion_pool.spawn(self.rect.centerx, self.rect.top - 10)
                 print("Launch explosion created")
                 
             return rocket
@@ -510,9 +578,8 @@ class RocketLauncher(GameObject):
             if hit:
                 # Rocket hit the target, create explosion
                 try:
-                    if self._explosion_group:
-                        explosion = Explosion(rocket.rect.centerx, rocket.rect.centery)
-                        self._explosion_group.add(explosion)
+                    if self._explosion_pool:
+                        self._explosion_pool.spawn(rocket.rect.centerx, rocket.rect.centery)
                         print(f"Hit explosion created at {rocket.rect.center}")
                     
                     # Damage the boss if it's vulnerable
@@ -537,6 +604,16 @@ class RocketLauncher(GameObject):
             self._active = False
             print("Launcher reset to inactive state")
     
+    def save_positions(self):
+        """Remember where the rockets are before a physics step"""
+        for rocket in self._rockets:
+            rocket.save_position()
+
+    def interpolate(self, alpha):
+        """Place the rockets between their last two positions"""
+        for rocket in self._rockets:
+            rocket.interpolate(alpha)
+    
     def draw(self, surface, camera):
         """Draw the launcher and the E prompt with camera offsets applied"""
         # Get the camera-adjusted position for drawing
@@ -558,9 +635,9 @@ class RocketLauncher(GameObject):
             text_rect = self._prompt_text.get_rect(center=(prompt_x + 20, prompt_y + 20))
             surface.blit(self._prompt_text, text_rect)
 
-class Explosion(GameObject):
+class Explosion(PooledGameObject):
     """Explosion animation class"""
-    def __init__(self, x, y):
+    def __init__(self, x=0, y=0, start=True, volume=0.7):
         super().__init__(x, y)
         # Load explosion frames
         self._explosion_frames = []
@@ -569,14 +646,28 @@ class Explosion(GameObject):
         self._frame_index = 0
         self._animation_speed = 0.2
         self._animation_timer = 0
-        self._load_sound()
+        self._explosion_channel = None
+        self._load_sound(volume)
+
+        # Pooled explosions are made idle and started by reset
+        if start:
+            self.reset(x, y)
+
+    def reset(self, x, y):
+        """Start the explosion at a point, reusing it if it went off before"""
+        self._frame_index = 0
+        self._animation_timer = 0
+        self.image = self._explosion_frames[0]
+        self.rect.size = self.image.get_size()
+        self.rect.center = (x, y)
+        if self._explosion_sound:
+            self._explosion_channel = self._explosion_sound.play()
     
     def _load_frames(self):
         """Load explosion animation frames"""
         try:
             for i in range(1, 8):  # Assuming 7 frames for explosion animation
-                frame = pygame.image.load(os.path.join('assets', 'sprites', 'kaboom', f'frame{i}.png')).convert_alpha()
-                frame = pygame.transform.scale(frame, (frame.get_width() * 2, frame.get_height() * 2))
+                frame = asset_cache.image(os.path.join('assets', 'sprites', 'kaboom', f'frame{i}.png'), scale=2)
                 self._explosion_frames.append(frame)
             self.image = self._explosion_frames[0]
         except Exception as e:
@@ -590,12 +681,10 @@ class Explosion(GameObject):
         pygame.draw.circle(self.image, (255, 100, 0), (50, 50), 50)
         self._explosion_frames = [self.image] * 7
     
-    def _load_sound(self):
+    def _load_sound(self, volume):
         """Load explosion sound effect"""
         try:
-            self._explosion_sound = pygame.mixer.Sound(os.path.join('assets', 'sounds', 'explosion.mp3'))
-            self._explosion_sound.set_volume(0.7)
-            self._explosion_sound.play()
+            self._explosion_sound = asset_cache.sound(os.path.join('assets', 'sounds', 'explosion.mp3'), volume=volume)
         except:
             self._explosion_sound = None
             print("Could not load explosion sound")
@@ -615,6 +704,11 @@ class Explosion(GameObject):
     @property
     def explosion_sound(self):
         return self._explosion_sound
+
+    @property
+    def explosion_channel(self):
+        """Get the channel the explosion sound plays on"""
+        return self._explosion_channel
     
     def update(self, dt=1/60):
         # Update animation timer
@@ -631,8 +725,10 @@ class Explosion(GameObject):
                 return
             
             # Update image to current frame
+            center = self.rect.center
             self.image = self._explosion_frames[self._frame_index]
-            self.rect = self.image.get_rect(center=self.rect.center)
+            self.rect.size = self.image.get_size()
+            self.rect.center = center
 
 class Credits:
     """
@@ -658,7 +754,7 @@ class Credits:
         
         # Try to load the actual credits image (after fallback is ready)
         try:
-            loaded_image = pygame.image.load(os.path.join("assets", "credits.png")).convert_alpha()
+            loaded_image = asset_cache.image(os.path.join("assets", "credits.png"))
             self._credits_image = loaded_image
             self._has_loaded_image = True
             print("Successfully loaded credits.png")
@@ -689,9 +785,9 @@ class Credits:
         
         # Try to use the game's font
         try:
-            font_large = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 36)
-            font_medium = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 24)
-            font_small = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 18)
+            font_large = asset_cache.font(os.path.join("assets", "Daydream.ttf"), 36)
+            font_medium = asset_cache.font(os.path.join("assets", "Daydream.ttf"), 24)
+            font_small = asset_cache.font(os.path.join("assets", "Daydream.ttf"), 18)
             print("Using game fonts for credits")
         except Exception as e:
             print(f"Using system fonts for credits: {e}")
@@ -802,56 +898,125 @@ class Credits:
             # Simple indicator in the corner to show credits are active
             pygame.draw.circle(self._screen, (255, 0, 0), (20, 20), 5)
 
-class Coin(pygame.sprite.Sprite):
-    """Collectible coin that follows the same pattern as NPCs"""
-    
-    def __init__(self, physics, x, y, coin_type='gold', value=10):
-        super().__init__()
-        self._physics = physics
-        self.coin_type = coin_type.lower()
-        self.value = value
-        self.collected = False
-        
-        # Animation properties
-        self.animation_time = 0
-        self.bob_speed = 3.0  # Speed of bobbing animation
-        self.bob_height = 5   # Height of bobbing in pixels
-        self.rotation_speed = 2.0  # Speed of rotation
-        self.current_rotation = 0
-        self.collect_sound = pygame.mixer.Sound(os.path.join('assets', 'sounds', 'ring.mp3'))
-        self.collect_sound.set_volume(0.5)
-        self.collect_sound_played = False
-        
-        # Create coin surface based on type
-        self.original_image = self._create_coin_image()
-        self.image = self.original_image.copy()
-        self.rect = self.image.get_rect()
-        
-        # Position
-        self.start_x = x
-        self.start_y = y
-        self.rect.centerx = x
-        self.rect.centery = y
-        
-        # Collection animation
-        self.collection_animation_time = 0
-        self.collection_duration = 0.5  # seconds
-        self.is_being_collected = False
-        
-    def _create_coin_image(self):
+class CoinField:
+    """
+    Every coin of a level, kept in NumPy arrays instead of one sprite per coin.
+    Coins of a type share one spin strip baked up front and one collect sound, bobbing
+    is worked out for a whole batch of coins at once, collection only looks at the coins
+    in the grid cells under the ball and only coins on screen are drawn.
+    """
+    IDLE, COLLECTING, COLLECTED = 0, 1, 2
+
+    # Coin look, timing matches the old sprite coins
+    BOB_SPEED = 3.0  # Speed of bobbing animation
+    BOB_HEIGHT = 5  # Height of bobbing in pixels
+    ROTATION_SPEED = 2.0  # Speed of rotation
+    COLLECTION_DURATION = 0.5  # seconds
+    RISE_DISTANCE = 30  # How far a coin flies up while it's being collected
+
+    def __init__(self, cell_size=COIN_CELL_SIZE, spin_frames=COIN_SPIN_FRAMES, fade_steps=COIN_FADE_STEPS):
+        """
+        Initialize an empty coin field.
+
+        Args:
+            cell_size: Size of the grid cells coins are sorted into
+            spin_frames: Number of frames in the spin strip of each coin type, over half a turn
+            fade_steps: Number of alpha steps a collected coin fades out in
+        """
+        self._cell_size = cell_size
+        self._spin_frames = spin_frames
+        self._fade_steps = fade_steps
+        self._time = 0.0
+
+        self._type_names = []  # Type index -> coin type name
+        self._spin_strips = []  # Type index -> [(frame, half width, half height)]
+        self._fade_strips = []
+        self._sizes = np.zeros(0, dtype=np.float32)  # Type index -> coin size
+
+        self._added = []  # (x, y, type index, value) of coins added since the arrays were built
+        self._x = np.zeros(0, dtype=np.float32)
+        self._base_y = np.zeros(0, dtype=np.float32)  # Resting height the coin bobs around
+        self._type = np.zeros(0, dtype=np.int8)
+        self._value = np.zeros(0, dtype=np.int32)
+        self._phase = np.zeros(0, dtype=np.float32)  # Offset of each coin's animation clock
+        self._state = np.zeros(0, dtype=np.int8)
+        self._collect_start = np.zeros(0, dtype=np.float32)
+        self._collecting = set()  # Indices of coins playing the collection animation
+        self._cells = {}  # (cell x, cell y) -> array of coin indices
+
+        self._collect_sound = asset_cache.sound(os.path.join('assets', 'sounds', 'ring.mp3'), volume=0.5)
+
+    @property
+    def count(self):
+        """Get the number of coins in the field"""
+        return len(self._x) + len(self._added)
+
+    @property
+    def remaining(self):
+        """Get the number of coins nobody has collected yet"""
+        self._build()
+        return int(np.count_nonzero(self._state == self.IDLE))
+
+    @property
+    def cell_count(self):
+        """Get the number of grid cells holding coins"""
+        self._build()
+        return len(self._cells)
+
+    def add(self, x, y, coin_type='gold', value=10):
+        """Add a coin centered on a point"""
+        coin_type = coin_type.lower()
+        if coin_type not in self._type_names:
+            self._bake_type(coin_type)
+        self._added.append((x, y, self._type_names.index(coin_type), value))
+
+    def _bake_type(self, coin_type):
+        """Bake the spin strip and fade strip of a coin type"""
+        image = sprite_bakes.frame(("coin", coin_type), lambda: self._create_coin_image(coin_type))
+        width, height = image.get_size()
+
+        spin_strip = []
+        for step in range(self._spin_frames):
+            # Simulate 3D rotation by scaling horizontally, very thin coins are 1 pixel wide
+            scale_factor = abs(math.cos(step * math.pi / self._spin_frames))
+            frame_width = max(1, int(width * scale_factor)) if scale_factor > 0.1 else 1
+            frame = sprite_bakes.frame(("coin", coin_type, "spin", frame_width),
+                                       lambda: pygame.transform.scale(image, (frame_width, height)))
+            spin_strip.append((frame, frame_width / 2, height / 2))
+
+        fade_strip = []
+        for step in range(self._fade_steps):
+            alpha = int(255 * (1 - step / self._fade_steps))
+            frame = sprite_bakes.frame(("coin", coin_type, "fade", alpha), lambda: self._faded(image, alpha))
+            fade_strip.append((frame, width / 2, height / 2))
+
+        self._type_names.append(coin_type)
+        self._spin_strips.append(spin_strip)
+        self._fade_strips.append(fade_strip)
+        self._sizes = np.append(self._sizes, np.float32(max(width, height)))
+
+    @staticmethod
+    def _faded(image, alpha):
+        """Copy an image with an alpha"""
+        faded = image.copy()
+        faded.set_alpha(alpha)
+        return faded
+
+    @staticmethod
+    def _create_coin_image(coin_type):
         """Create the coin image based on coin type"""
-        size = 50 if self.coin_type == 'gold' else 30
+        size = 50 if coin_type == 'gold' else 30
         
         # Create surface with transparency
         surface = pygame.Surface((size, size), pygame.SRCALPHA)
         
-        if self.coin_type == 'gold':
+        if coin_type == 'gold':
             # Gold coin - yellow with darker border
             pygame.draw.circle(surface, (255, 215, 0), (size//2, size//2), size//2)
             pygame.draw.circle(surface, (218, 165, 32), (size//2, size//2), size//2, 2)
             # Add inner circle for detail
             pygame.draw.circle(surface, (255, 255, 0), (size//2, size//2), size//3, 1)
-        elif self.coin_type == 'silver':
+        elif coin_type == 'silver':
             # Silver coin - light gray with darker border
             pygame.draw.circle(surface, (192, 192, 192), (size//2, size//2), size//2)
             pygame.draw.circle(surface, (128, 128, 128), (size//2, size//2), size//2, 2)
@@ -863,98 +1028,167 @@ class Coin(pygame.sprite.Sprite):
             pygame.draw.circle(surface, (205, 127, 50), (size//2, size//2), size//3, 1)
         
         return surface
-    
-    def update(self, dt):
-        """Update coin logic and animation state"""
-        if self.collected:
-            return
-            
-        if self.is_being_collected:
-            self._update_collection_animation(dt)
-            if not self.collect_sound_played:
-                self.collect_sound.play()
-                self.collect_sound_played = True
-        else:
-            self._update_idle_animation(dt)
-        
-        # Update the visual image for sprite group drawing
-        self._update_visual()
-    
-    def _update_idle_animation(self, dt):
-        """Update the floating/bobbing animation"""
-        self.animation_time += dt
-        
-        # Bobbing motion
-        bob_offset = math.sin(self.animation_time * self.bob_speed) * self.bob_height
-        self.rect.centery = self.start_y + bob_offset
-        
-        # Rotation effect (simulate 3D rotation by scaling horizontally)
-        self.current_rotation += self.rotation_speed * dt
-    
-    def _update_collection_animation(self, dt):
-        """Update the collection animation (coin flies up and fades)"""
-        self.collection_animation_time += dt
-        
-        progress = self.collection_animation_time / self.collection_duration
-        
-        if progress >= 1.0:
-            self.collected = True
+
+    def _build(self):
+        """Move coins added since the last build into the arrays and sort them into grid cells"""
+        if not self._added:
             return
-        
-        # Move up during collection
-        rise_distance = 30
-        self.rect.centery = self.start_y - (rise_distance * progress)
-    
-    def _update_visual(self):
-        """Update the visual appearance of the coin"""
-        if self.is_being_collected:
-            # Collection animation - fade out
-            progress = self.collection_animation_time / self.collection_duration
-            alpha = int(255 * (1 - progress))
-            self.image = self.original_image.copy()
-            self.image.set_alpha(alpha)
-        else:
-            # Idle animation - rotation effect
-            scale_factor = abs(math.cos(self.current_rotation))
-            
-            if scale_factor > 0.1:  # Avoid division by very small numbers
-                original_width = self.original_image.get_width()
-                new_width = max(1, int(original_width * scale_factor))
-                self.image = pygame.transform.scale(self.original_image, 
-                                                  (new_width, self.original_image.get_height()))
-                
-                # Keep the coin centered
-                old_center = self.rect.center
-                self.rect = self.image.get_rect()
-                self.rect.center = old_center
-            else:
-                # Very thin, just use a 1-pixel wide version
-                self.image = pygame.transform.scale(self.original_image, (1, self.original_image.get_height()))
-                old_center = self.rect.center
-                self.rect = self.image.get_rect()
-                self.rect.center = old_center
-    
-    def draw(self, screen):
-        """Draw the coin to the screen"""
-        if not self.collected:
-            screen.blit(self.image, self.rect)
-    
-    def collect(self):
-        """Start the collection animation"""
-        if not self.collected and not self.is_being_collected:
-            self.is_being_collected = True
-            return self.value
-        return 0
-    
-    def align_to_ground(self, level):
-        """Align coin to ground level, similar to NPCs"""
-        if hasattr(level, 'collision_tiles'):
-            # Find the ground below the coin
-            test_rect = pygame.Rect(self.rect.centerx - 5, self.rect.bottom, 10, 200)
-            
-            for tile in level.collision_tiles:
-                if test_rect.colliderect(tile.rect):
-                    # Position coin slightly above the ground
-                    self.start_y = tile.rect.top - self.rect.height // 2 - 5
-                    self.rect.centery = self.start_y
-                    break
\ No newline at end of file
+
+        x, y, coin_type, value = zip(*self._added)
+        added = len(self._added)
+        self._added = []
+        self._x = np.append(self._x, np.array(x, dtype=np.float32))
+        self._base_y = np.append(self._base_y, np.array(y, dtype=np.float32))
+        self._type = np.append(self._type, np.array(coin_type, dtype=np.int8))
+        self._value = np.append(self._value, np.array(value, dtype=np.int32))
+        self._phase = np.append(self._phase, np.full(added, -self._time, dtype=np.float32))
+        self._state = np.append(self._state, np.zeros(added, dtype=np.int8))
+        self._collect_start = np.append(self._collect_start, np.zeros(added, dtype=np.float32))
+        self._build_cells()
+
+    def _build_cells(self):
+        """Sort every coin into the grid cell its resting position falls in"""
+        cells = {}
+        cell_x = (self._x // self._cell_size).astype(np.int32)
+        cell_y = (self._base_y // self._cell_size).astype(np.int32)
+        for index, cell in enumerate(zip(cell_x.tolist(), cell_y.tolist())):
+            cells.setdefault(cell, []).append(index)
+        self._cells = {cell: np.array(indices, dtype=np.int32) for cell, indices in cells.items()}
+
+    def _indices_in(self, rect, cells=None):
+        """Get the indices of coins whose cells overlap a world rectangle, widened by the largest coin"""
+        cells = self._cells if cells is None else cells
+        margin = (float(self._sizes.max()) / 2 if len(self._sizes) else 0) + self.BOB_HEIGHT + self.RISE_DISTANCE
+        left = int((rect.left - margin) // self._cell_size)
+        right = int((rect.right + margin) // self._cell_size)
+        top = int((rect.top - margin) // self._cell_size)
+        bottom = int((rect.bottom + margin) // self._cell_size)
+
+        found = [cells[(cx, cy)] for cx in range(left, right + 1) for cy in range(top, bottom + 1)
+                 if (cx, cy) in cells]
+        if not found:
+            return np.zeros(0, dtype=np.int32)
+        return np.concatenate(found) if len(found) > 1 else found[0]
+
+    def _bob_positions(self, indices):
+        """Get the centers of idle coins, bobbing worked out for all of them in one pass"""
+        clock = self._time + self._phase[indices]
+        return self._x[indices], self._base_y[indices] + np.sin(clock * self.BOB_SPEED) * self.BOB_HEIGHT
+
+    def align_to_ground(self, physics):
+        """Align every coin to the ground below it, slightly above the ground like NPCs"""
+        self._build()
+        half_sizes = self._sizes[self._type] / 2
+        for index in range(len(self._x)):
+            ground_y = physics.ground_below(float(self._x[index]), float(self._base_y[index] + half_sizes[index]), 200)
+            if ground_y is not None:
+                self._base_y[index] = ground_y - int(half_sizes[index]) - 5
+        self._build_cells()
+
+    def update(self, dt):
+        """Advance the coin animations; only coins being collected need any work"""
+        self._build()
+        self._time += dt
+
+        for index in list(self._collecting):
+            if self._time - self._collect_start[index] >= self.COLLECTION_DURATION:
+                self._state[index] = self.COLLECTED
+                self._collecting.discard(index)
+
+    def collect(self, rect):
+        """
+        Collect the coins touching a rectangle.
+
+        Args:
+            rect (pygame.Rect): World rectangle of the collector, usually the ball
+
+        Returns:
+            list: (coin type, value) of each coin collected
+        """
+        self._build()
+        indices = self._indices_in(rect)
+        indices = indices[self._state[indices] == self.IDLE]
+        if not len(indices):
+            return []
+
+        x, y = self._bob_positions(indices)
+        half_sizes = self._sizes[self._type[indices]] / 2
+        touching = ((x - half_sizes < rect.right) & (x + half_sizes > rect.left) &
+                    (y - half_sizes < rect.bottom) & (y + half_sizes > rect.top))
+
+        collected = []
+        for index in indices[touching].tolist():
+            self._state[index] = self.COLLECTING
+            self._collect_start[index] = self._time
+            self._collecting.add(index)
+            self._collect_sound.play()
+            collected.append((self._type_names[self._type[index]], int(self._value[index])))
+        return collected
+
+    def capture(self):
+        """
+        Get a snapshot of what drawing the coins reads. The arrays changed in place are copied,
+        the others are replaced rather than changed, so the snapshot can be drawn from another
+        thread while the coins keep changing.
+        """
+        self._build()
+        return (self._time, self._x, self._base_y.copy(), self._type, self._phase.copy(), self._state.copy(),
+                self._collect_start.copy(), self._cells, tuple(self._collecting))
+
+    def draw(self, screen, camera, snapshot=None):
+        """Draw the coins inside the camera's view, from a snapshot made by capture if one is given"""
+        if snapshot is None:
+            # Coins added since the last update are drawn once an update builds them
+            snapshot = (self._time, self._x, self._base_y, self._type, self._phase, self._state,
+                        self._collect_start, self._cells, tuple(self._collecting))
+        time, coin_x, base_y, coin_types, phase, state, collect_start, cells, collecting = snapshot
+
+        view = pygame.Rect(-camera.offset_x, -camera.offset_y, camera.width, camera.height)
+        indices = self._indices_in(view, cells)
+        indices = indices[state[indices] == self.IDLE]
+        blits = []
+
+        if len(indices):
+            # The cells around the view hold some coins just off screen
+            clock = time + phase[indices]
+            x, y = coin_x[indices], base_y[indices] + np.sin(clock * self.BOB_SPEED) * self.BOB_HEIGHT
+            half_sizes = self._sizes[coin_types[indices]] / 2
+            on_screen = ((x + half_sizes > view.left) & (x - half_sizes < view.right) &
+                         (y + half_sizes > view.top) & (y - half_sizes < view.bottom))
+            indices, x, y, clock = indices[on_screen], x[on_screen], y[on_screen], clock[on_screen]
+            steps = (clock * self.ROTATION_SPEED * self._spin_frames / math.pi).astype(np.int32) % self._spin_frames
+            for coin_type, x, y, step in zip(coin_types[indices].tolist(), x.tolist(), y.tolist(), steps.tolist()):
+                frame, half_width, half_height = self._spin_strips[coin_type][step]
+                blits.append((frame, (x - half_width + camera.offset_x, y - half_height + camera.offset_y)))
+
+        # Coins being collected fly up and fade out
+        for index in collecting:
+            # Plain floats, Surface.blits doesn't take NumPy scalars as coordinates
+            progress = (time - float(collect_start[index])) / self.COLLECTION_DURATION
+            step = max(0, min(self._fade_steps - 1, int(progress * self._fade_steps)))
+            frame, half_width, half_height = self._fade_strips[coin_types[index]][step]
+            x = float(coin_x[index])
+            y = float(base_y[index]) - self.RISE_DISTANCE * progress
+            blits.append((frame, (x - half_width + camera.offset_x, y - half_height + camera.offset_y)))
+
+        if blits:
+            screen.blits(blits, doreturn=False)
+
+    def taken(self):
+        """Get a copy of which coins have been collected or are being collected, for restore"""
+        self._build()
+        return self._state != self.IDLE
+
+    def restore(self, taken):
+        """Put back the coins taken since a copy from taken was made"""
+        self._build()
+        self.reset(np.flatnonzero(~taken[:len(self._state)] & (self._state != self.IDLE)))
+
+    def reset(self, indices=None):
+        """Put coins back where they started with their animations from the start, all of them by default"""
+        self._build()
+        if indices is None:
+            indices = np.arange(len(self._state))
+        self._state[indices] = self.IDLE
+        self._phase[indices] = -self._time
+        self._collecting.difference_update(np.asarray(indices).tolist())
@@ -1,5 +1,6 @@
-import pygame, os, pymunk, pygame_gui, random, math, time, threading, queue, json, base64
+import pygame, os, pymunk, pygame_gui, random, math, time, threading, queue, json, base64, hashlib, pickle, zlib, re, collections, bisect
 from constants import *
+from asset_cache import asset_cache
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -331,9 +332,22 @@ class SceneManager:
 class PhysicsManager:
     """Physics manager with improved collision detection for switches and squares"""
 
-    def __init__(self):
-        # Create the Pymunk space
-        self._space = pymunk.Space()
+    # "on", "off" or "auto", set from the game settings
+    threading_mode = PHYSICS_THREADING
+
+    def __init__(self, threading=None, expected_bodies=0):
+        """
+        Args:
+            threading (str): "on", "off" or "auto", defaults to PhysicsManager.threading_mode
+            expected_bodies (int): Dynamic bodies the space will hold at once, for the auto mode
+        """
+        # Create the Pymunk space, threaded if asked for or busy enough to benefit.
+        # Pymunk quietly falls back to a plain space where threads aren't available (Windows)
+        threading = threading or PhysicsManager.threading_mode
+        threaded = threading == "on" or (threading == "auto" and expected_bodies >= PHYSICS_THREADED_MIN_BODIES)
+        self._space = pymunk.Space(threaded=threaded)
+        if self._space.threaded:
+            self._space.threads = PHYSICS_THREADS
         self._space.gravity = (0, 980)  # Gravity
 
         # Expanded collision types
@@ -344,37 +358,38 @@ class PhysicsManager:
             "square": 4
         }
 
-        # Ground detection - we'll use a separate collision handler for this
-        self._player_grounded = False
+        self._handler_keys = set()  # Collision type pairs with a handler in this space
+        self._heightfields = {}  # Collision layer -> GroundHeightfield, for ground queries
         
         # Level dimensions for boundaries
         self._level_width = None
         self._level_height = None
 
-        # Set up collision handler for ground detection using new Pymunk 7.1 API
-        self._space.on_collision(
-            self._collision_types["ball"], 
-            self._collision_types["ground"],
-            begin=self._on_ground_begin,
-            separate=self._on_ground_separate,
-            pre_solve=self._on_ground_pre_solve
-        )
-        
-        # Set up collision handler for switches using new Pymunk 7.1 API
-        self._space.on_collision(
+        # Both collision layers stay in the space with their own filter category;
+        # shapes that follow the active layer simply stop colliding with the other one
+        self._layer_categories = {
+            "F": 0b10,
+            "B": 0b100
+        }
+        self._active_layer = "F"
+        self._layer_followers = []
+
+        # Substeps are picked per step from the speed of the fastest body
+        self._min_substeps = PHYSICS_MIN_SUBSTEPS
+        self._max_substeps = PHYSICS_MAX_SUBSTEPS
+        self._max_substep_travel = PHYSICS_FEATURE_SIZE * PHYSICS_SUBSTEP_TRAVEL
+        self._last_substeps = 0
+        self._substep_count = 0  # Substeps run since the counter was last taken
+
+        # Spatial index of the space, the default bounding box tree until configure_spatial_index says otherwise
+        self._spatial_index = "tree"
+
+        # Switches are the only contacts whose response changes, the ball passes through them.
+        # Nothing reacts to ground and square contacts, so they have no callbacks in the solver
+        self.on_collision(
             self._collision_types["ball"], 
             self._collision_types["switch"],
-            begin=self._on_switch_begin,
-            separate=self._on_switch_separate
-        )
-        
-        # Set up collision handler for squares using new Pymunk 7.1 API
-        self._space.on_collision(
-            self._collision_types["ball"], 
-            self._collision_types["square"],
-            begin=self._on_square_begin,
-            separate=self._on_square_separate,
-            pre_solve=self._on_square_pre_solve
+            begin=self._on_switch_begin
         )
 
     @property
@@ -388,10 +403,31 @@ class PhysicsManager:
         return self._collision_types
         
     @property
-    def player_grounded(self):
-        """Get whether the player is grounded"""
-        return self._player_grounded
-        
+    def handler_count(self):
+        """Get the number of collision handlers registered in the space"""
+        return len(self._handler_keys)
+
+    def on_collision(self, collision_type_a, collision_type_b, **callbacks):
+        """
+        Register collision callbacks for a pair of collision types, once per space. Objects that
+        are created again, like a respawned ball or a new boss, keep the handler already there.
+
+        Args:
+            collision_type_a (int): Collision type of the first shape
+            collision_type_b (int): Collision type of the second shape
+            **callbacks: begin, pre_solve, post_solve and separate callbacks as for Space.on_collision
+
+        Returns:
+            bool: Whether the handler was registered now
+        """
+        key = (collision_type_a, collision_type_b)
+        if key in self._handler_keys:
+            return False
+
+        self._space.on_collision(collision_type_a, collision_type_b, **callbacks)
+        self._handler_keys.add(key)
+        return True
+
     @property
     def level_width(self):
         """Get the level width"""
@@ -412,60 +448,45 @@ class PhysicsManager:
         """Set the level height"""
         self._level_height = value
 
-    def _on_ground_begin(self, arbiter, space, data):
-        """Simple ground detection - just sets a flag"""
-        # Check if contact is more vertical than horizontal
-        n = arbiter.contact_point_set.normal
-        if n.y < -0.7:  # If normal is pointing mostly upward
-            self._player_grounded = True
-        # In Pymunk 7.1, we don't return a bool to control processing
-        # Instead we use arbiter.process_collision property if needed
-        # For normal collision processing, we just don't set it to False
-
-    def _on_ground_pre_solve(self, arbiter, space, data):
-        """Keep updating grounded status during continuous contact"""
-        n = arbiter.contact_point_set.normal
-        if n.y < -0.7:  # If normal is pointing mostly upward
-            self._player_grounded = True
-        # No return value needed in Pymunk 7.1
+    @property
+    def active_layer(self):
+        """Get the collision layer ("F" or "B") that followers collide with"""
+        return self._active_layer
+
+    def layer_filter(self, layer):
+        """Get the shape filter for static shapes that belong to a collision layer"""
+        return pymunk.ShapeFilter(categories=self._layer_categories[layer])
+
+    def active_layer_filter(self):
+        """Get a filter that collides with everything except the inactive collision layer"""
+        inactive = 0
+        for layer, category in self._layer_categories.items():
+            if layer != self._active_layer:
+                inactive |= category
+        return pymunk.ShapeFilter(mask=pymunk.ShapeFilter.ALL_MASKS() ^ inactive)
+
+    def follow_active_layer(self, shape):
+        """Make a dynamic shape collide only with the active collision layer, now and after switches"""
+        self._layer_followers = [follower for follower in self._layer_followers if follower.space is not None]
+        shape.filter = self.active_layer_filter()
+        if shape not in self._layer_followers:
+            self._layer_followers.append(shape)
+
+    def set_active_layer(self, layer):
+        """Switch the collision layer by swapping the followers' filter masks"""
+        self._active_layer = layer
+        self._layer_followers = [follower for follower in self._layer_followers if follower.space is not None]
+
+        layer_filter = self.active_layer_filter()
+        for follower in self._layer_followers:
+            follower.filter = layer_filter
 
-    def _on_ground_separate(self, arbiter, space, data):
-        """Simple ground detection - just clears a flag"""
-        self._player_grounded = False
-        # No return value needed in Pymunk 7.1
-        
     def _on_switch_begin(self, arbiter, space, data):
         """Handle collision with switch - no physical collision effect"""
         # Prevent physical collision by setting process_collision to False
         arbiter.process_collision = False
         # No return value needed in Pymunk 7.1
-        
-    def _on_switch_separate(self, arbiter, space, data):
-        """Handle separation from switch"""
-        # No return value needed in Pymunk 7.1
-        pass
-        
-    def _on_square_begin(self, arbiter, space, data):
-        """Handle collision with square - normal physical collision"""
-        # Allow normal collision processing (this is the default)
-        # arbiter.process_collision = True  # This is the default, so we don't need to set it
-        # No return value needed in Pymunk 7.1
-        
-    def _on_square_pre_solve(self, arbiter, space, data):
-        """Handle pre-solve for square collision"""
-        # This can be used for custom collision response if needed
-        # No return value needed in Pymunk 7.1
-        pass
-        
-    def _on_square_separate(self, arbiter, space, data):
-        """Handle separation from square"""
-        # No return value needed in Pymunk 7.1
-        pass
 
-    def is_grounded(self):
-        """Return whether the player is on the ground"""
-        return self._player_grounded
-        
     def check_collision(self, shape1, shape2):
         """Check if two shapes are colliding"""
         # Create a contact set to test collision
@@ -476,12 +497,15 @@ class PhysicsManager:
                         return self._space.shape_query(s1, pymunk.Transform.identity())
         return False
 
-    def create_box(self, x, y, width, height, friction=0.9, is_static=True, collision_type=None):
-        """Create a box with customizable properties"""
-        body = pymunk.Body(body_type=pymunk.Body.STATIC if is_static else pymunk.Body.DYNAMIC)
-        body.position = (x + width / 2, y + height / 2)
-
-        shape = pymunk.Poly.create_box(body, (width, height))
+    def create_box(self, x, y, width, height, friction=0.9, is_static=True, collision_type=None, add_to_space=True):
+        """Create a box with customizable properties, static boxes going on the shared static body"""
+        if is_static:
+            body = self._space.static_body
+            shape = pymunk.Poly(body, [(x, y), (x + width, y), (x + width, y + height), (x, y + height)])
+        else:
+            body = pymunk.Body(body_type=pymunk.Body.DYNAMIC)
+            body.position = (x + width / 2, y + height / 2)
+            shape = pymunk.Poly.create_box(body, (width, height))
         shape.elasticity = 0.0
         shape.friction = friction
         
@@ -494,76 +518,910 @@ class PhysicsManager:
             # Default to ground
             shape.collision_type = self._collision_types["ground"]
 
-        self._space.add(body, shape)
-        return body, shape
+        if add_to_space:
+            if is_static:
+                self._space.add(shape)
+            else:
+                self._space.add(body, shape)
+        return body, shape
+
+    def create_poly(self, vertices, friction=0.9, collision_type="ground", add_to_space=True):
+        """Create a static polygon with high friction on the shared static body"""
+        if len(vertices) < 3:
+            print(f"Error: Cannot create polygon with less than 3 vertices")
+            return None, None
+
+        # The static body sits at the origin, so the vertices stay in world coordinates
+        body = self._space.static_body
+        shape = pymunk.Poly(body, vertices)
+        shape.elasticity = 0.0
+        shape.friction = friction
+        
+        # Set collision type based on parameter
+        if collision_type in self._collision_types:
+            shape.collision_type = self._collision_types[collision_type]
+        else:
+            shape.collision_type = self._collision_types["ground"]
+
+        if add_to_space:
+            self._space.add(shape)
+        return body, shape
+
+    def create_segment(self, p1, p2, thickness=1, friction=0.9, collision_type="ground"):
+        """Create a static line segment with high friction on the shared static body"""
+        body = self._space.static_body
+        shape = pymunk.Segment(body, p1, p2, thickness)
+        shape.elasticity = 0.0
+        shape.friction = friction
+        
+        # Set collision type based on parameter
+        if collision_type in self._collision_types:
+            shape.collision_type = self._collision_types[collision_type]
+        else:
+            shape.collision_type = self._collision_types["ground"]
+
+        self._space.add(shape)
+        return body, shape
+
+    def create_chain(self, points, thickness=1, friction=0.9, collision_type="ground", body=None, add_to_space=True):
+        """Create a chain of connected static segments, on the shared static body unless given another one"""
+        if len(points) < 2:
+            return body, []
+
+        if body is None:
+            body = self._space.static_body
+
+        shapes = []
+        for p1, p2 in zip(points, points[1:]):
+            shape = pymunk.Segment(body, p1, p2, thickness)
+            shape.elasticity = 0.0
+            shape.friction = friction
+            shape.collision_type = self._collision_types.get(collision_type, self._collision_types["ground"])
+            shapes.append(shape)
+
+        # Tell each segment about its neighbours so the ball doesn't catch on the joints
+        for i, shape in enumerate(shapes):
+            prev_point = points[i - 1] if i > 0 else points[i]
+            next_point = points[i + 2] if i + 2 < len(points) else points[i + 1]
+            shape.set_neighbors(prev_point, next_point)
+
+        if add_to_space:
+            self._space.add(*shapes)
+        return body, shapes
+
+    @property
+    def threaded(self):
+        """Get whether the space steps with more than one thread"""
+        return self._space.threaded and self._space.threads > 1
+
+    @property
+    def static_body(self):
+        """Get the static body all level geometry is attached to"""
+        return self._space.static_body
+
+    @property
+    def spatial_index(self):
+        """Get the spatial index the space uses ("tree" or "hash")"""
+        return self._spatial_index
+
+    def configure_spatial_index(self, width, height, tile_count, tile_size=64, strategy=None):
+        """
+        Pick the spatial index for a level. Big levels are uniform grids of static shapes,
+        which a spatial hash with tile sized cells handles better than the bounding box tree.
+
+        Args:
+            width (int): Level width in pixels
+            height (int): Level height in pixels
+            tile_count (int): Number of tiles in the level
+            tile_size (int): Size of a tile in pixels
+            strategy (str): "tree", "hash" or "auto", defaults to PHYSICS_SPATIAL_INDEX
+
+        Returns:
+            str: The spatial index in use
+        """
+        strategy = strategy or PHYSICS_SPATIAL_INDEX
+        if strategy == "auto":
+            strategy = "hash" if tile_count >= PHYSICS_SPATIAL_HASH_MIN_TILES else "tree"
+
+        # Pymunk can't go back to the tree once it hashes
+        if strategy == "hash" and self._spatial_index != "hash":
+            # One hash cell per tile of the grid
+            cells = (width // tile_size + 1) * (height // tile_size + 1)
+            self._space.use_spatial_hash(tile_size, max(1000, cells))
+            self._spatial_index = "hash"
+
+        print(f"Spatial index: {self._spatial_index} ({tile_count} tiles)")
+        return self._spatial_index
+
+    def set_heightfield(self, layer, heightfield):
+        """Set the ground heightfield of a collision layer, None to drop it"""
+        if heightfield is None:
+            self._heightfields.pop(layer, None)
+        else:
+            self._heightfields[layer] = heightfield
+
+    def ground_below(self, x, y, max_distance=1000, layer=None):
+        """
+        Find the first ground surface at or below a point, for placing things on the ground.
+        The layer's heightfield answers without touching the space; a ray down through the
+        level geometry covers what it doesn't, like levels loaded without one.
+
+        Args:
+            x (float): X position in pixels
+            y (float): Y position to look down from
+            max_distance (float): Furthest to look below y
+            layer (str): Collision layer ("F" or "B"), defaults to the active one
+
+        Returns:
+            float: Y of the ground surface, or None if there is none in range
+        """
+        layer = layer or self._active_layer
+        heightfield = self._heightfields.get(layer)
+        if heightfield:
+            ground_y = heightfield.ground_below(x, y, max_distance)
+            if ground_y is not None:
+                return ground_y
+
+        # Only the level geometry on the static body counts, not NPCs, signs or triggers
+        query_filter = pymunk.ShapeFilter(mask=self._layer_categories[layer])
+        ground_y = None
+        for hit in self._space.segment_query((x, y), (x, y + max_distance), 0, query_filter):
+            if hit.shape.body is self._space.static_body and not hit.shape.sensor:
+                if ground_y is None or hit.point.y < ground_y:
+                    ground_y = hit.point.y
+        return ground_y
+
+    @property
+    def last_substeps(self):
+        """Get the number of substeps the last step was split into"""
+        return self._last_substeps
+
+    def take_substep_count(self):
+        """Get the number of substeps run since the last call and start counting again, for profiling"""
+        count = self._substep_count
+        self._substep_count = 0
+        return count
+
+    def substeps_for(self, dt):
+        """
+        Work out how many substeps a step needs so no body moves more than the allowed
+        fraction of the thinnest collision feature in one substep.
+
+        Args:
+            dt (float): Length of the step in seconds
+
+        Returns:
+            int: Number of substeps, between the floor and the ceiling
+        """
+        max_speed = 0.0
+        for body in self._space.bodies:
+            if body.body_type != pymunk.Body.STATIC and not body.is_sleeping:
+                max_speed = max(max_speed, body.velocity.length)
+
+        # Gravity can add to the speed during the step
+        travel = (max_speed + self._space.gravity.length * dt) * dt
+        substeps = math.ceil(travel / self._max_substep_travel)
+        return max(self._min_substeps, min(self._max_substeps, substeps))
+
+    def step(self, dt=PHYSICS_TIMESTEP):
+        """Advance the physics simulation by dt seconds, in substeps for better collision detection"""
+        # More substeps only when something moves fast enough to tunnel through thin geometry
+        substeps = self.substeps_for(dt)
+        sub_dt = dt / substeps
+        
+        for i in range(substeps):
+            self._space.step(sub_dt)
+
+        self._last_substeps = substeps
+        self._substep_count += substeps
+
+    def clear(self):
+        """Remove all physics objects"""
+        # In Pymunk 7.1, we need to convert to list since space.bodies/shapes now return KeysView
+        for body in list(self._space.bodies):
+            self._space.remove(body)
+
+        for shape in list(self._space.shapes):
+            self._space.remove(shape)
+
+class FixedTimestep:
+    """
+    Turns the variable time between frames into a whole number of fixed physics steps,
+    so the game runs at the same speed whatever the framerate. The time left over is
+    kept for the next frame, and alpha says how far the render is between two steps.
+    """
+    def __init__(self, step=PHYSICS_TIMESTEP, max_steps=PHYSICS_MAX_STEPS):
+        """
+        Args:
+            step (float): Seconds of simulation per step
+            max_steps (int): Most steps to run in one frame
+        """
+        self._step = step
+        self._max_steps = max_steps
+        self._accumulator = 0.0
+
+    @property
+    def step(self):
+        """Get the length of a step in seconds"""
+        return self._step
+
+    @property
+    def alpha(self):
+        """Get how far the current time is between the last step and the next one, from 0 to 1"""
+        return self._accumulator / self._step
+
+    def advance(self, dt):
+        """
+        Add the time of a frame and take out the steps it covers.
+
+        Args:
+            dt (float): Seconds since the last frame
+
+        Returns:
+            int: Number of steps to run this frame
+        """
+        # After a hitch, drop the time we can't catch up on instead of falling further behind
+        self._accumulator = min(self._accumulator + dt, self._step * self._max_steps)
+        steps = int(self._accumulator / self._step)
+        self._accumulator -= steps * self._step
+        return steps
+
+    def reset(self):
+        """Forget any time left over"""
+        self._accumulator = 0.0
+
+class SimulationThread:
+    """
+    Runs a simulation callback at a fixed rate on its own thread, so slow frames don't hold back
+    physics and heavy physics steps don't hold back presenting. After each batch of steps it
+    publishes an immutable render snapshot; the renderer interpolates between the last two.
+    A step runs with the lock held, anything else that changes the simulated world takes it too.
+    Drawing doesn't: it only takes the published snapshots, which have a lock of their own.
+    """
+    def __init__(self, step_callback, snapshot_callback, step=PHYSICS_TIMESTEP, max_steps=PHYSICS_MAX_STEPS):
+        """
+        Args:
+            step_callback: Called with the step length to advance the simulation by one step
+            snapshot_callback: Called after the steps to get the render snapshot to publish
+            step (float): Seconds of simulation per step
+            max_steps (int): Most steps to run to catch up after a hitch
+        """
+        self._step_callback = step_callback
+        self._snapshot_callback = snapshot_callback
+        self._step = step
+        self._max_steps = max_steps
+        self._lock = threading.RLock()
+        self._snapshot_lock = threading.Lock()  # Only held to publish or read the snapshots, never during a step
+        self._running = False
+        self._thread = None
+        self._snapshots = (None, None)  # (previous, latest), replaced as a pair so readers never see half of it
+        self._snapshot_time = 0.0
+        self._steps_run = 0
+        self._error = None
+
+    @property
+    def lock(self):
+        """Get the lock held while the simulation steps"""
+        return self._lock
+
+    @property
+    def running(self):
+        """Get whether the simulation thread is running"""
+        return self._running
+
+    @property
+    def snapshots(self):
+        """Get the previous and the latest render snapshot"""
+        with self._snapshot_lock:
+            return self._snapshots
+
+    @property
+    def alpha(self):
+        """Get how far the current time is past the latest snapshot, in steps from 0 to 1"""
+        with self._snapshot_lock:
+            return min(1.0, (time.perf_counter() - self._snapshot_time) / self._step)
+
+    def read_snapshots(self):
+        """
+        Get the published snapshots for drawing, without waiting for a step in progress.
+
+        Returns:
+            tuple: The previous and latest render snapshot and how far past the latest one
+                the current time is, in steps from 0 to 1
+        """
+        with self._snapshot_lock:
+            alpha = min(1.0, (time.perf_counter() - self._snapshot_time) / self._step)
+            return self._snapshots[0], self._snapshots[1], alpha
+
+    @property
+    def steps_run(self):
+        """Get the number of steps run so far"""
+        return self._steps_run
+
+    @property
+    def error(self):
+        """Get the exception that stopped the simulation, if any"""
+        return self._error
+
+    def start(self):
+        """Start stepping on a new thread"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop stepping and wait for the thread to leave, so nothing steps the world after this returns.
+        The wait doesn't take the lock: while the caller holds it the thread can't be mid-step, and a
+        thread waiting for the lock gives up on its own once it sees it was stopped.
+        """
+        self._running = False
+        thread = self._thread
+        if thread and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+
+    def _run(self):
+        """Step the simulation whenever a step is due and publish the snapshots"""
+        next_step = time.perf_counter()
+        while self._running:
+            now = time.perf_counter()
+            if now < next_step:
+                time.sleep(next_step - now)  # Sleeping lets the render thread have the GIL
+                continue
+
+            # After a hitch, drop the steps we can't catch up on instead of falling further behind
+            due = int((now - next_step) / self._step) + 1
+            steps = min(due, self._max_steps)
+            next_step += due * self._step
+
+            # Waiting in short slices so a stop while the main thread holds the lock is noticed
+            while not self._lock.acquire(timeout=0.05):
+                if not self._running:
+                    return
+            try:
+                if not self._running:
+                    break
+                for i in range(steps):
+                    self._step_callback(self._step)
+                snapshot = self._snapshot_callback()
+            except Exception as e:
+                self._error = e
+                self._running = False
+                break
+            finally:
+                self._lock.release()
+
+            with self._snapshot_lock:
+                self._snapshots = (self._snapshots[1], snapshot)
+                self._snapshot_time = time.perf_counter()
+            self._steps_run += steps
+
+class GroundHeightfield:
+    """
+    The surfaces of a collision layer sampled in narrow columns, so the ground below a point
+    is a binary search in one column instead of a scan through the physics shapes. Each
+    column keeps the heights of every edge crossing it, which covers levels with floors
+    above one another.
+    """
+    def __init__(self, width, column_width=PHYSICS_GROUND_COLUMN):
+        """
+        Args:
+            width (int): Level width in pixels
+            column_width (int): Width of a column in pixels
+        """
+        self._column_width = column_width
+        self._columns = [[] for i in range(int(width // column_width) + 1)]
+        self._sorted = True
+
+    @property
+    def column_width(self):
+        """Get the width of a column in pixels"""
+        return self._column_width
+
+    @property
+    def surface_count(self):
+        """Get the number of surface heights stored over all columns"""
+        return sum(len(column) for column in self._columns)
+
+    def add_segment(self, p1, p2):
+        """Add the heights of a line across the columns whose centres it spans"""
+        (x1, y1), (x2, y2) = sorted((tuple(p1), tuple(p2)))
+        if x2 - x1 <= 0:
+            return  # Walls have no top
+
+        first = max(0, math.ceil(x1 / self._column_width - 0.5))
+        last = min(len(self._columns) - 1, math.floor(x2 / self._column_width - 0.5))
+        slope = (y2 - y1) / (x2 - x1)
+        for column in range(first, last + 1):
+            centre = (column + 0.5) * self._column_width
+            self._columns[column].append(y1 + (centre - x1) * slope)
+        self._sorted = False
+
+    def add_box(self, x, y, width, height):
+        """Add the top and bottom of a box"""
+        self.add_segment((x, y), (x + width, y))
+        self.add_segment((x, y + height), (x + width, y + height))
+
+    def add_specs(self, specs):
+        """
+        Add the edges of the level's collision specs, as built by load_collision_layer.
+
+        Args:
+            specs (list): (kind, vertices, friction, x, y, width, height) tuples
+        """
+        for kind, vertices, friction, world_x, world_y, width, height in specs:
+            if vertices:
+                # Chains are open outlines, polygons close back to their first vertex
+                edges = list(zip(vertices, vertices[1:]))
+                if kind != "chain":
+                    edges.append((vertices[-1], vertices[0]))
+                for p1, p2 in edges:
+                    self.add_segment(p1, p2)
+            elif kind != "slope":
+                self.add_box(world_x, world_y, width, height)
+
+    def ground_below(self, x, y, max_distance=1000):
+        """
+        Find the first surface at or below a point.
+
+        Args:
+            x (float): X position in pixels
+            y (float): Y position to look down from
+            max_distance (float): Furthest to look below y
+
+        Returns:
+            float: Y of the surface, or None if there is none in range
+        """
+        if not self._sorted:
+            for column in self._columns:
+                column.sort()
+            self._sorted = True
+
+        column_index = int(x // self._column_width)
+        if not 0 <= column_index < len(self._columns):
+            return None
+
+        column = self._columns[column_index]
+        index = bisect.bisect_left(column, y)
+        if index < len(column) and column[index] - y <= max_distance:
+            return column[index]
+        return None
+
+class SpriteBakes:
+    """
+    Frames baked from source images so sprites don't transform every frame: rotations rounded
+    to a fixed number of angle buckets, and variants such as pulses and flashes. A frame is
+    made the first time it is asked for and shared by every sprite drawing the same source;
+    the least recently used frames go once the memory cap is reached.
+    """
+    def __init__(self, angle_buckets=SPRITE_BAKE_ANGLES, pulse_steps=SPRITE_BAKE_PULSE_STEPS,
+                 memory_cap_mb=SPRITE_BAKE_MEMORY_CAP_MB):
+        """
+        Args:
+            angle_buckets (int): Number of rotations baked over a full turn
+            pulse_steps (int): Number of steps pulse values from 0 to 1 are rounded to
+            memory_cap_mb (int): Most memory the baked frames may use
+        """
+        self._angle_buckets = angle_buckets
+        self._pulse_steps = pulse_steps
+        self._memory_cap = memory_cap_mb * 1024 * 1024
+        self._frames = collections.OrderedDict()  # Key -> frame, least recently used first
+        self._memory_used = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()  # The simulation thread bakes frames too
+
+    @property
+    def frame_count(self):
+        """Get the number of baked frames"""
+        return len(self._frames)
+
+    @property
+    def memory_used(self):
+        """Get the memory the baked frames use in bytes"""
+        return self._memory_used
+
+    @property
+    def hits(self):
+        """Get the number of lookups that found a baked frame"""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Get the number of lookups that had to bake a frame"""
+        return self._misses
+
+    def angle_bucket(self, angle):
+        """Get the bucket an angle in degrees falls in"""
+        return round(angle * self._angle_buckets / 360) % self._angle_buckets
+
+    def pulse_step(self, pulse):
+        """Round a pulse value from 0 to 1 to the steps frames are baked for"""
+        return round(max(0.0, min(1.0, pulse)) * self._pulse_steps) / self._pulse_steps
+
+    def frame(self, key, build):
+        """
+        Get a baked frame, baking it the first time.
+
+        Args:
+            key: Hashable key naming the frame, starting with its source
+            build: Called with no arguments to make the frame when it isn't baked
+
+        Returns:
+            pygame.Surface: The frame, shared so it must not be drawn on
+        """
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                self._hits += 1
+                return frame
+
+        frame = build()
+        with self._lock:
+            self._misses += 1
+            if key not in self._frames:
+                self._frames[key] = frame
+                self._memory_used += frame.get_width() * frame.get_height() * frame.get_bytesize()
+
+            # Drop the least recently used frames over the cap, never the one just made
+            while self._memory_used > self._memory_cap and len(self._frames) > 1:
+                old_key, old_frame = self._frames.popitem(last=False)
+                self._memory_used -= old_frame.get_width() * old_frame.get_height() * old_frame.get_bytesize()
+        return frame
+
+    def rotated(self, image, angle, source=None):
+        """
+        Get an image rotated by the angle bucket nearest an angle.
+
+        Args:
+            image (pygame.Surface): Image to rotate
+            angle (float): Counterclockwise angle in degrees, as for pygame.transform.rotate
+            source: Hashable name of the image so sprites with their own copy of it share frames, defaults to the image
+
+        Returns:
+            pygame.Surface: The rotated frame
+        """
+        bucket = self.angle_bucket(angle)
+        bucket_angle = bucket * 360 / self._angle_buckets
+        return self.frame((image if source is None else source, "rotate", bucket), lambda: pygame.transform.rotate(image, bucket_angle))
+
+    def clear(self):
+        """Drop every baked frame"""
+        with self._lock:
+            self._frames.clear()
+            self._memory_used = 0
+
+sprite_bakes = SpriteBakes()  # Shared by every sprite
+
+class EntityPool:
+    """
+    Pre-made entities that are handed out again instead of being created mid-game, so
+    spawning one costs no loading or allocation. Entities are made with factory, must have
+    a reset method taking the spawn arguments and a pool attribute, and go back to the pool
+    when they are killed. At most max_live are out at once; spawns past that are refused
+    and counted, and the pool grows when it runs dry below the cap.
+    """
+    def __init__(self, factory, size, max_live):
+        """
+        Args:
+            factory: Called with no arguments to make an idle entity
+            size (int): Number of entities made up front
+            max_live (int): Most entities out of the pool at once
+        """
+        self._factory = factory
+        self._max_live = max_live
+        self._free = []
+        self._in_use = set()
+        self._live = pygame.sprite.Group()  # Every entity out of the pool, for updating and drawing
+        self._created = 0
+        self._spawned = 0
+        self._exhausted = 0
+        self._peak_live = 0
+
+        for i in range(size):
+            self._free.append(self._create())
+
+    @property
+    def live(self):
+        """Get the group of entities out of the pool"""
+        return self._live
+
+    @property
+    def live_count(self):
+        """Get the number of entities out of the pool"""
+        return len(self._in_use)
+
+    @property
+    def free_count(self):
+        """Get the number of idle entities ready to spawn"""
+        return len(self._free)
+
+    @property
+    def created(self):
+        """Get the number of entities made, up front or when the pool ran dry"""
+        return self._created
+
+    @property
+    def spawned(self):
+        """Get the number of spawns handed an entity"""
+        return self._spawned
+
+    @property
+    def exhausted(self):
+        """Get the number of spawns refused because max_live entities were out"""
+        return self._exhausted
+
+    @property
+    def peak_live(self):
+        """Get the most entities that were out at once"""
+        return self._peak_live
+
+    def _create(self):
+        """Make an idle entity that belongs to this pool"""
+        entity = self._factory()
+        entity.pool = self
+        self._created += 1
+        return entity
+
+    def spawn(self, *args):
+        """
+        Hand out an entity, reset with the given arguments.
+
+        Returns:
+            The entity, or None if max_live entities are out already
+        """
+        if len(self._in_use) >= self._max_live:
+            self._exhausted += 1
+            return None
+
+        entity = self._free.pop() if self._free else self._create()
+        entity.reset(*args)
+        self._in_use.add(entity)
+        self._live.add(entity)
+        self._spawned += 1
+        self._peak_live = max(self._peak_live, len(self._in_use))
+        return entity
+
+    def release(self, entity):
+        """Take an entity back, called when it is killed"""
+        if entity in self._in_use:
+            self._in_use.discard(entity)
+            self._live.remove(entity)
+            self._free.append(entity)
+
+    def clear(self):
+        """Kill every entity out of the pool, which puts them back"""
+        for entity in list(self._in_use):
+            entity.kill()
+
+class TextRenderer:
+    """
+    Shared text drawing for the HUD and menus. Fonts come from the asset cache, one per face
+    and size, and rendered text is kept in a least recently used cache by text, face, size,
+    colour and outline, so text that doesn't change is rendered once. Outlines are grown from
+    the text's mask in one pass instead of rendering the text again at every offset. Text that
+    changes every frame goes through a GlyphAtlas from glyphs() instead.
+    """
+    def __init__(self, max_entries=TEXT_CACHE_ENTRIES, face=daFont):
+        """
+        Args:
+            max_entries (int): Most rendered texts kept
+            face (str): Font file used when no other face is given
+        """
+        self._max_entries = max_entries
+        self._face = face
+        self._surfaces = collections.OrderedDict()  # Key -> rendered text, least recently used first
+        self._atlases = collections.OrderedDict()  # Key -> GlyphAtlas, least recently used first
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def entry_count(self):
+        """Get the number of rendered texts kept"""
+        return len(self._surfaces)
+
+    @property
+    def hits(self):
+        """Get the number of texts that were already rendered"""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Get the number of texts that had to be rendered"""
+        return self._misses
+
+    def font(self, size, face=None):
+        """Get the font for a face and size, pygame's default font if the face can't be loaded"""
+        try:
+            return asset_cache.font(face or self._face, size)
+        except (pygame.error, OSError):
+            return asset_cache.font(None, size)
+
+    def render(self, text, size, color, outline_color=None, outline_width=1, face=None):
+        """
+        Get rendered text, rendering it the first time.
+
+        Args:
+            text (str): Text to render
+            size (int): Font size
+            color (tuple): Text colour
+            outline_color (tuple): Outline colour, None for no outline
+            outline_width (int): Outline thickness in pixels
+            face (str): Font file, defaults to the Daydream font
+
+        Returns:
+            pygame.Surface: The text, padded by outline_width on every side when outlined.
+                Shared, so copy it before changing its alpha
+        """
+        key = (text, face, size, tuple(pygame.Color(color)),
+               outline_color and tuple(pygame.Color(outline_color)), outline_width)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self._hits += 1
+            return surface
+
+        self._misses += 1
+        surface = self.font(size, face).render(text, True, color)
+        if outline_color is not None:
+            surface = self._outline(surface, outline_color, outline_width)
+        self._surfaces[key] = surface
+        while len(self._surfaces) > self._max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def _outline(surface, outline_color, outline_width):
+        """Put text on its mask grown by outline_width, which pads it by that much on every side"""
+        kernel = pygame.Mask((outline_width * 2 + 1, outline_width * 2 + 1), fill=True)
+        grown = pygame.mask.from_surface(surface).convolve(kernel)
+        outlined = grown.to_surface(setcolor=outline_color, unsetcolor=(0, 0, 0, 0))
+        outlined.blit(surface, (outline_width, outline_width))
+        return outlined
+
+    def glyphs(self, size, color, outline_color=None, outline_width=1, face=None):
+        """
+        Get the glyph atlas for a font size, colour and outline, building it the first time.
+
+        Args:
+            size (int): Font size
+            color (tuple): Text colour
+            outline_color (tuple): Outline colour, None for no outline
+            outline_width (int): Outline thickness in pixels
+            face (str): Font file, defaults to the Daydream font
+
+        Returns:
+            GlyphAtlas: Glyphs for composing text that changes every frame
+        """
+        key = (face, size, tuple(pygame.Color(color)),
+               outline_color and tuple(pygame.Color(outline_color)), outline_width)
+        atlas = self._atlases.get(key)
+        if atlas is not None:
+            self._atlases.move_to_end(key)
+            return atlas
+
+        atlas = self._atlases[key] = GlyphAtlas(self.font(size, face), color, outline_color, outline_width)
+        while len(self._atlases) > GLYPH_ATLAS_ENTRIES:
+            self._atlases.popitem(last=False)
+        return atlas
+
+    def draw(self, screen, text, size, color, outline_color=None, outline_width=1, face=None, **anchor):
+        """
+        Draw text, placing the text itself (not its outline) like pygame.Surface.get_rect.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on
+            anchor: One rect position such as topleft=(x, y) or center=(x, y), topleft at 0, 0 by default
+
+        Returns:
+            pygame.Rect: Where the text went, without its outline
+        """
+        surface = self.render(text, size, color, outline_color, outline_width, face)
+        padding = outline_width if outline_color is not None else 0
+        rect = pygame.Rect(0, 0, surface.get_width() - padding * 2, surface.get_height() - padding * 2)
+        for name, value in anchor.items():
+            setattr(rect, name, value)
+        screen.blit(surface, (rect.x - padding, rect.y - padding))
+        return rect
+
+    def clear(self):
+        """Drop every rendered text and glyph atlas"""
+        self._surfaces.clear()
+        self._atlases.clear()
+
+class GlyphAtlas:
+    """
+    Characters of one font, colour and outline rendered once, for text that changes every
+    frame such as the level timer. A string cache can't help there, so strings are put
+    together from the glyphs with one Surface.blits call instead of going through FreeType.
+    Outlines are drawn under every fill so a glyph's outline never covers its neighbour.
+    """
+    def __init__(self, font, color, outline_color=None, outline_width=1, characters=GLYPH_ATLAS_CHARACTERS):
+        """
+        Args:
+            font (pygame.font.Font): Font to render the glyphs with
+            color (tuple): Text colour
+            outline_color (tuple): Outline colour, None for no outline
+            outline_width (int): Outline thickness in pixels
+            characters (str): Glyphs rendered up front, others are added the first time they're used
+        """
+        self._font = font
+        self._color = color
+        self._outline_color = outline_color
+        self._padding = outline_width if outline_color is not None else 0
+        self._height = font.render("0", True, color).get_height()  # Rendered lines can be taller than get_height
+        self._glyphs = {}  # Character -> (outline, fill, advance)
 
-    def create_poly(self, vertices, friction=0.9, collision_type="ground"):
-        """Create a static polygon with high friction"""
-        if len(vertices) < 3:
-            print(f"Error: Cannot create polygon with less than 3 vertices")
-            return None, None
+        for char in characters:
+            self._glyph(char)
 
-        body = pymunk.Body(body_type=pymunk.Body.STATIC)
+    @property
+    def glyph_count(self):
+        """Get the number of rendered glyphs"""
+        return len(self._glyphs)
 
-        # Calculate center for body position
-        avg_x = sum(v[0] for v in vertices) / len(vertices)
-        avg_y = sum(v[1] for v in vertices) / len(vertices)
-        body.position = (avg_x, avg_y)
+    @property
+    def height(self):
+        """Get the line height, without the outline"""
+        return self._height
 
-        # Convert to local coordinates
-        local_verts = [(v[0] - avg_x, v[1] - avg_y) for v in vertices]
+    def _glyph(self, char):
+        """Get a character's outline and fill surfaces and its advance, rendering them the first time"""
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            fill = self._font.render(char, True, self._color)
+            outline = None
+            if self._outline_color is not None and fill.get_width() > 0:
+                outline = TextRenderer._outline(fill, self._outline_color, self._padding)
+            glyph = self._glyphs[char] = (outline, fill, self._font.size(char)[0])
+        return glyph
 
-        shape = pymunk.Poly(body, local_verts)
-        shape.elasticity = 0.0
-        shape.friction = friction
-        
-        # Set collision type based on parameter
-        if collision_type in self._collision_types:
-            shape.collision_type = self._collision_types[collision_type]
-        else:
-            shape.collision_type = self._collision_types["ground"]
+    def size(self, text):
+        """Get the width and height of text, without the outline"""
+        return sum(self._glyph(char)[2] for char in text), self._height
 
-        self._space.add(body, shape)
-        return body, shape
+    def _blits(self, text, x, y):
+        """Get the blit sequence drawing text with its top left corner at x, y"""
+        outlines = []
+        fills = []
+        for char in text:
+            outline, fill, advance = self._glyph(char)
+            if outline is not None:
+                outlines.append((outline, (x - self._padding, y - self._padding)))
+            fills.append((fill, (x, y)))
+            x += advance
+        return outlines + fills
 
-    def create_segment(self, p1, p2, thickness=1, friction=0.9, collision_type="ground"):
-        """Create a static line segment with high friction"""
-        body = pymunk.Body(body_type=pymunk.Body.STATIC)
-        shape = pymunk.Segment(body, p1, p2, thickness)
-        shape.elasticity = 0.0
-        shape.friction = friction
-        
-        # Set collision type based on parameter
-        if collision_type in self._collision_types:
-            shape.collision_type = self._collision_types[collision_type]
-        else:
-            shape.collision_type = self._collision_types["ground"]
+    def draw(self, screen, text, **anchor):
+        """
+        Draw text, placing the text itself (not its outline) like pygame.Surface.get_rect.
 
-        self._space.add(body, shape)
-        return body, shape
+        Args:
+            screen (pygame.Surface): Surface to draw on
+            text (str): Text to draw
+            anchor: One rect position such as topleft=(x, y) or center=(x, y), topleft at 0, 0 by default
 
-    def step(self, dt=0):
-        """Update physics simulation with substeps for better collision detection"""
-        clock = pygame.time.Clock()
-        if clock.get_fps() > 0:
-            dt = 1.0 / clock.get_fps()
-        else:
-            dt = 1.0/60.0
-        # Using multiple substeps to catch fast collisions
-        substeps = 4  # Increase for better accuracy but worse performance
-        sub_dt = dt / substeps
-        
-        for i in range(substeps):
-            self._space.step(sub_dt)
+        Returns:
+            pygame.Rect: Where the text went, without its outline
+        """
+        rect = pygame.Rect((0, 0), self.size(text))
+        for name, value in anchor.items():
+            setattr(rect, name, value)
+        screen.blits(self._blits(text, rect.x, rect.y), doreturn=False)
+        return rect
 
-    def clear(self):
-        """Remove all physics objects"""
-        # In Pymunk 7.1, we need to convert to list since space.bodies/shapes now return KeysView
-        for body in list(self._space.bodies):
-            self._space.remove(body)
+    def render(self, text):
+        """Get text on a new surface, padded by the outline like TextRenderer.render, for fading"""
+        width, height = self.size(text)
+        surface = pygame.Surface((width + self._padding * 2, height + self._padding * 2), pygame.SRCALPHA)
+        surface.blits(self._blits(text, self._padding, self._padding), doreturn=False)
+        return surface
 
-        for shape in list(self._space.shapes):
-            self._space.remove(shape)
+text_renderer = TextRenderer()  # Shared by the HUD and menus
 
 class ParallaxBackground:
     """Class that manages multiple background layers with parallax effect"""
@@ -588,7 +1446,7 @@ class ParallaxBackground:
         """Get the background layers"""
         return self._layers
         
-    def add_layer(self, image_path, parallax_factor):
+    def add_layer(self, image_path, parallax_factor, scope=None):
         """Add a background layer with a specific parallax factor
         
         Args:
@@ -597,10 +1455,11 @@ class ParallaxBackground:
                              0 = stationary
                              1 = moves at the same speed as the camera
                              Values in between create the parallax effect
+            scope: AssetCache scope the scaled image belongs to, None to keep it for the whole game
         """
         try:
             # Load and prepare the image
-            image = pygame.image.load(image_path).convert_alpha()
+            image = asset_cache.image(image_path, scope=scope)
             
             # Scale the image to be slightly larger than the screen to allow movement
             scale_factor = max(
@@ -611,7 +1470,7 @@ class ParallaxBackground:
             scaled_width = int(image.get_width() * scale_factor)
             scaled_height = int(image.get_height() * scale_factor)
             
-            scaled_image = pygame.transform.scale(image, (scaled_width, scaled_height))
+            scaled_image = asset_cache.image(image_path, size=(scaled_width, scaled_height), scope=scope)
             
             # Add to layers list
             self._layers.append({
@@ -722,8 +1581,8 @@ def load_button_images(button_name, unpressed_folder, pressed_folder):
     pressed_path = os.path.join(pressed_folder, f"P{button_name}.png") # add 'P' to pressed button name.
 
     try:
-        unpressed_image = pygame.image.load(unpressed_path).convert_alpha()
-        pressed_image = pygame.image.load(pressed_path).convert_alpha()
+        unpressed_image = asset_cache.image(unpressed_path)
+        pressed_image = asset_cache.image(pressed_path)
         return unpressed_image, pressed_image
     except FileNotFoundError:
         print(f"Error: Could not find images for {button_name}")
@@ -866,6 +1725,689 @@ class SpatialGrid:
         cell_key = self._get_cell_coords(x, y)
         return self._grid.get(cell_key, [])
 
+class TriggerVolume:
+    """An area of the level that runs a callback when the ball enters or leaves it"""
+    def __init__(self, rect, on_enter=None, on_exit=None, data=None):
+        """
+        Args:
+            rect (pygame.Rect): Area of the trigger in world coordinates
+            on_enter: Called with the trigger when the ball enters it
+            on_exit: Called with the trigger when the ball leaves it
+            data: Anything the callbacks need, like a checkpoint position
+        """
+        self.rect = pygame.Rect(rect)
+        self.on_enter = on_enter
+        self.on_exit = on_exit
+        self.data = data
+
+class TriggerVolumes:
+    """
+    Trigger volumes registered once at load and bucketed by grid cell. Each frame only the
+    few cells under the ball are looked at, and nothing at all happens while the ball stays
+    in cells without triggers, so the cost doesn't grow with the number of triggers.
+    """
+    def __init__(self, cell_size=TRIGGER_CELL_SIZE):
+        """
+        Args:
+            cell_size (int): Size of a grid cell in pixels
+        """
+        self._cell_size = cell_size
+        self._grid = {}  # (cell x, cell y) -> triggers overlapping the cell
+        self._triggers = []
+        self._inside = set()  # Triggers the ball is in
+        self._cells = None  # Cells the ball covered last update
+
+    @property
+    def triggers(self):
+        """Get every registered trigger"""
+        return self._triggers
+
+    @property
+    def inside(self):
+        """Get the triggers the ball is in"""
+        return self._inside
+
+    def _cell_range(self, rect):
+        """Get the range of cells a rect covers as (min x, min y, max x, max y)"""
+        return (rect.left // self._cell_size, rect.top // self._cell_size,
+                (rect.right - 1) // self._cell_size, (rect.bottom - 1) // self._cell_size)
+
+    def add(self, rect, on_enter=None, on_exit=None, data=None):
+        """
+        Register a trigger volume.
+
+        Args:
+            rect (pygame.Rect): Area of the trigger in world coordinates
+            on_enter: Called with the trigger when the ball enters it
+            on_exit: Called with the trigger when the ball leaves it
+            data: Anything the callbacks need
+
+        Returns:
+            TriggerVolume: The new trigger
+        """
+        trigger = TriggerVolume(rect, on_enter, on_exit, data)
+        min_x, min_y, max_x, max_y = self._cell_range(trigger.rect)
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                self._grid.setdefault((cell_x, cell_y), []).append(trigger)
+        self._triggers.append(trigger)
+        self._cells = None  # Look again even if the ball doesn't move
+        return trigger
+
+    def update(self, rect):
+        """
+        Fire the enter and exit callbacks for the ball's rect.
+
+        Args:
+            rect (pygame.Rect): The ball's rect in world coordinates
+        """
+        cells = self._cell_range(rect)
+        min_x, min_y, max_x, max_y = cells
+        candidates = set()
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                candidates.update(self._grid.get((cell_x, cell_y), ()))
+
+        # Same cells and no triggers in them, nothing can have changed
+        if cells == self._cells and not candidates and not self._inside:
+            return
+        self._cells = cells
+
+        inside = {trigger for trigger in candidates if trigger.rect.colliderect(rect)}
+        exited = self._inside - inside
+        entered = inside - self._inside
+        self._inside = inside
+
+        for trigger in exited:
+            if trigger.on_exit:
+                trigger.on_exit(trigger)
+        for trigger in entered:
+            if trigger.on_enter:
+                trigger.on_enter(trigger)
+
+    def reset(self):
+        """Forget which triggers the ball is in without firing anything, for a level played again"""
+        self._inside = set()
+        self._cells = None
+
+    def clear(self):
+        """Remove every trigger"""
+        self._grid = {}
+        self._triggers = []
+        self.reset()
+
+class LevelCache:
+    """
+    On-disk cache of baked level data so levels can start without parsing TMX files.
+    Each artifact is keyed by a content hash of the TMX file and everything it references.
+    """
+    CACHE_VERSION = 3
+    _SOURCE_PATTERN = re.compile(rb'source="([^"]+)"')
+
+    def __init__(self, cache_dir=None):
+        """
+        Initialize the level cache.
+
+        Args:
+            cache_dir: Folder the baked levels are written to
+        """
+        self._cache_dir = cache_dir or os.path.join("assets", "world building", "Baked Levels")
+
+    @property
+    def cache_dir(self):
+        """Get the cache directory"""
+        return self._cache_dir
+
+    def cache_path(self, tmx_path):
+        """Get the baked file path for a TMX file"""
+        name = os.path.splitext(os.path.basename(tmx_path))[0]
+        return os.path.join(self._cache_dir, name + ".lvl")
+
+    def content_hash(self, tmx_path, tile_size):
+        """
+        Hash the TMX file together with the tilesets and images it references.
+
+        Args:
+            tmx_path: Path to the TMX file
+            tile_size: Tile size the level is baked at
+
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.sha1()
+        digest.update(f"{self.CACHE_VERSION}:{tile_size}".encode())
+
+        pending = [tmx_path]
+        seen = set()
+        while pending:
+            path = os.path.normpath(pending.pop(0))
+            if path in seen:
+                continue
+            seen.add(path)
+
+            with open(path, "rb") as f:
+                data = f.read()
+            digest.update(path.replace("\\", "/").encode())
+            digest.update(data)
+
+            # Follow tileset (.tsx) and image references
+            if path.endswith((".tmx", ".tsx")):
+                folder = os.path.dirname(path)
+                for source in self._SOURCE_PATTERN.findall(data):
+                    pending.append(os.path.join(folder, source.decode("utf-8")))
+
+        return digest.hexdigest()
+
+    def load(self, tmx_path, tile_size):
+        """
+        Load baked level data if it exists and matches the current TMX content.
+
+        Args:
+            tmx_path: Path to the TMX file
+            tile_size: Tile size the level is loaded at
+
+        Returns:
+            Level data dictionary, or None if the cache is missing or stale
+        """
+        path = self.cache_path(tmx_path)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            content_hash = self.content_hash(tmx_path, tile_size)
+            with open(path, "rb") as f:
+                data = pickle.loads(zlib.decompress(f.read()))
+        except Exception as e:
+            print(f"Could not read baked level {path}: {e}")
+            return None
+
+        if data.get("version") != self.CACHE_VERSION or data.get("hash") != content_hash:
+            print(f"Baked level {path} is out of date")
+            return None
+
+        return data
+
+    def save(self, tmx_path, tile_size, data):
+        """
+        Write baked level data to disk.
+
+        Args:
+            tmx_path: Path to the TMX file the data was baked from
+            tile_size: Tile size the level was baked at
+            data: Level data dictionary
+        """
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            data = dict(data, version=self.CACHE_VERSION, hash=self.content_hash(tmx_path, tile_size))
+            blob = zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+            # Write to a temporary file first so a crash never leaves a half-written cache
+            path = self.cache_path(tmx_path)
+            temp_path = path + ".tmp"
+            with open(temp_path, "wb") as f:
+                f.write(blob)
+            os.replace(temp_path, path)
+            print(f"Baked {tmx_path} -> {path} ({len(blob) // 1024} KB)")
+        except Exception as e:
+            print(f"Could not write baked level for {tmx_path}: {e}")
+
+    @staticmethod
+    def pack_atlas(surfaces, tile_size):
+        """
+        Pack equally sized tile surfaces into a single RGBA atlas.
+
+        Args:
+            surfaces: List of tile surfaces already scaled to tile_size
+            tile_size: Width and height of each tile
+
+        Returns:
+            Dictionary with the atlas layout and raw pixel bytes
+        """
+        count = len(surfaces)
+        columns = max(1, math.ceil(math.sqrt(count)))
+        rows = max(1, math.ceil(count / columns))
+
+        atlas = pygame.Surface((columns * tile_size, rows * tile_size), pygame.SRCALPHA)
+        atlas.fill((0, 0, 0, 0))
+        for index, surface in enumerate(surfaces):
+            atlas.blit(surface, ((index % columns) * tile_size, (index // columns) * tile_size))
+
+        return {
+            "columns": columns,
+            "count": count,
+            "tile_size": tile_size,
+            "size": atlas.get_size(),
+            "pixels": pygame.image.tobytes(atlas, "RGBA")
+        }
+
+    @staticmethod
+    def unpack_atlas(atlas_data):
+        """
+        Rebuild tile surfaces from a packed atlas.
+
+        Args:
+            atlas_data: Dictionary produced by pack_atlas
+
+        Returns:
+            List of tile surfaces (subsurfaces of one shared atlas surface)
+        """
+        atlas = pygame.image.frombytes(atlas_data["pixels"], atlas_data["size"], "RGBA")
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+
+        tile_size = atlas_data["tile_size"]
+        columns = atlas_data["columns"]
+        tiles = []
+        for index in range(atlas_data["count"]):
+            rect = pygame.Rect((index % columns) * tile_size, (index // columns) * tile_size, tile_size, tile_size)
+            tiles.append(atlas.subsurface(rect))
+        return tiles
+
+class ChunkRenderer:
+    """
+    Composites static tile layers into large chunk surfaces so a frame blits a handful
+    of chunks instead of hundreds of tiles. Chunks are built in a background thread,
+    prefetched in the direction the camera is moving, and kept in a size-capped LRU.
+    """
+    def __init__(self, spatial_grid, width, height, passes, layer_order=None, hidden_layers=(),
+                 chunk_size=CHUNK_SIZE, memory_cap_mb=CHUNK_MEMORY_CAP_MB):
+        """
+        Initialize the chunk renderer.
+
+        Args:
+            spatial_grid: SpatialGrid holding the tile sprites
+            width, height: Level size in pixels
+            passes: List of layer name lists, each composited into its own chunks
+                    (e.g. layers behind the ball and layers in front of it).
+                    None stands for every layer not named by another pass
+            layer_order: Dictionary of layer name -> draw order within a pass
+            hidden_layers: Layer names that are not drawn (see set_hidden_layers)
+            chunk_size: Width and height of each chunk in pixels
+            memory_cap_mb: Maximum memory the cached chunk surfaces may use
+        """
+        self._spatial_grid = spatial_grid
+        self._width = width
+        self._height = height
+        self._passes = [set(layer_names) if layer_names is not None else None for layer_names in passes]
+        self._named_layers = set().union(*[layer_names for layer_names in self._passes if layer_names])
+        self._layer_order = layer_order or {}
+        self._hidden_layers = frozenset(hidden_layers)
+        self._chunk_size = chunk_size
+        self._memory_cap = memory_cap_mb * 1024 * 1024
+
+        self._chunks = collections.OrderedDict()  # (pass, cx, cy, hidden layers) -> Surface, or None for empty chunks
+        self._memory_used = 0
+        self._lock = threading.Lock()
+        self._requests = queue.Queue()
+        self._pending = set()
+        self._failures = {}  # Key -> failed builds, a chunk is drawn tile by tile until it builds
+        self._generation = 0  # Bumped on invalidate so stale builds are thrown away
+        self._worker = None
+
+        self._last_offset = None
+        self._direction = (0, 0)
+        self._chunks_drawn = 0
+
+    @property
+    def chunk_size(self):
+        """Get the chunk size"""
+        return self._chunk_size
+
+    @property
+    def memory_used(self):
+        """Get the memory used by cached chunks in bytes"""
+        return self._memory_used
+
+    @property
+    def cached_chunks(self):
+        """Get the number of cached chunks"""
+        return len(self._chunks)
+
+    @property
+    def chunks_drawn(self):
+        """Get the number of chunks blitted in the last draw call"""
+        return self._chunks_drawn
+
+    @property
+    def hidden_layers(self):
+        """Get the layer names that are not drawn"""
+        return self._hidden_layers
+
+    def set_hidden_layers(self, hidden_layers):
+        """
+        Change which layers are hidden. Chunks are cached per set of hidden layers,
+        so toggling back and forth reuses the chunks built for each set.
+        """
+        self._hidden_layers = frozenset(hidden_layers)
+
+    def invalidate(self):
+        """Throw away every cached chunk, e.g. after tiles are added or removed"""
+        with self._lock:
+            self._generation += 1
+            self._chunks.clear()
+            self._pending.clear()
+            self._failures.clear()
+            self._memory_used = 0
+
+    def invalidate_rect(self, rect):
+        """Throw away the cached chunks overlapping a world rectangle, e.g. after a region is streamed in or out"""
+        with self._lock:
+            # Builds in flight may have seen the old tiles, so they are discarded too
+            self._generation += 1
+            self._pending.clear()
+            self._failures.clear()
+            for key in [key for key in self._chunks if self._chunk_rect(key[1], key[2]).colliderect(rect)]:
+                chunk = self._chunks.pop(key)
+                if chunk is not None:
+                    self._memory_used -= chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+
+    def draw(self, screen, camera, pass_index=0):
+        """
+        Draw one pass of the tile layers.
+
+        Args:
+            screen: Surface to draw to
+            camera: Camera providing the current offset
+            pass_index: Index into the passes given to the constructor
+        """
+        offset_x, offset_y = camera.offset_x, camera.offset_y
+        if pass_index == 0:
+            self._track_direction(offset_x, offset_y)
+            self._chunks_drawn = 0
+
+        view = pygame.Rect(-offset_x, -offset_y, screen.get_width(), screen.get_height())
+        for cx, cy in self._chunks_in_rect(view):
+            key = (pass_index, cx, cy, self._hidden_layers)
+            with self._lock:
+                ready = key in self._chunks
+                if ready:
+                    chunk = self._chunks[key]
+                    self._chunks.move_to_end(key)
+
+            if ready:
+                if chunk is not None:
+                    screen.blit(chunk, (cx * self._chunk_size + offset_x, cy * self._chunk_size + offset_y))
+                    self._chunks_drawn += 1
+            else:
+                # Not built yet - draw its tiles directly this frame and queue the build
+                self._request(key)
+                self._draw_tiles(screen, camera, key, self._chunk_rect(cx, cy).clip(view))
+
+        if pass_index == len(self._passes) - 1:
+            self._prefetch(view)
+
+    def _track_direction(self, offset_x, offset_y):
+        """Remember which way the camera is moving for prefetching"""
+        if self._last_offset is not None:
+            dx = self._last_offset[0] - offset_x
+            dy = self._last_offset[1] - offset_y
+            if dx or dy:
+                self._direction = ((dx > 0) - (dx < 0), (dy > 0) - (dy < 0))
+        self._last_offset = (offset_x, offset_y)
+
+    def _prefetch(self, view):
+        """Queue the chunks one chunk ahead of the camera in its direction of travel"""
+        dir_x, dir_y = self._direction
+        if not dir_x and not dir_y:
+            return
+
+        ahead = view.move(dir_x * self._chunk_size, dir_y * self._chunk_size)
+        for cx, cy in self._chunks_in_rect(ahead):
+            for pass_index in range(len(self._passes)):
+                self._request((pass_index, cx, cy, self._hidden_layers))
+
+    def _chunks_in_rect(self, rect):
+        """Get the chunk coordinates overlapping a world rectangle, clamped to the level"""
+        max_cx = max(0, (self._width - 1) // self._chunk_size)
+        max_cy = max(0, (self._height - 1) // self._chunk_size)
+        min_x = max(0, rect.left // self._chunk_size)
+        min_y = max(0, rect.top // self._chunk_size)
+        max_x = min(max_cx, (rect.right - 1) // self._chunk_size)
+        max_y = min(max_cy, (rect.bottom - 1) // self._chunk_size)
+        return [(cx, cy) for cy in range(min_y, max_y + 1) for cx in range(min_x, max_x + 1)]
+
+    def _chunk_rect(self, cx, cy):
+        """Get the world rectangle covered by a chunk"""
+        return pygame.Rect(cx * self._chunk_size, cy * self._chunk_size, self._chunk_size, self._chunk_size)
+
+    def _tiles_for(self, key, rect):
+        """Get the visible tiles of a chunk key's pass inside a world rectangle, in layer order"""
+        pass_index, hidden_layers = key[0], key[3]
+        layer_names = self._passes[pass_index]
+        tiles = []
+        for tile in self._spatial_grid.query_rect(rect):
+            if not rect.colliderect(tile.rect):
+                continue
+            layer_name = getattr(tile, 'layer_name', None)
+            if layer_name in hidden_layers:
+                continue
+            if layer_names is None:
+                if layer_name not in self._named_layers:
+                    tiles.append(tile)
+            elif layer_name in layer_names:
+                tiles.append(tile)
+        tiles.sort(key=lambda tile: self._layer_order.get(getattr(tile, 'layer_name', None), 999))
+        return tiles
+
+    def _draw_tiles(self, screen, camera, key, rect):
+        """Fallback that blits tiles one by one for a chunk that is not ready yet"""
+        for tile in self._tiles_for(key, rect):
+            screen.blit(tile.image, camera.apply(tile))
+
+    def _request(self, key):
+        """Queue a chunk for building if it is not cached or queued already and hasn't failed too often"""
+        with self._lock:
+            queued = (key not in self._chunks and key not in self._pending and
+                      self._failures.get(key, 0) < CHUNK_BUILD_ATTEMPTS)
+            if queued:
+                self._pending.add(key)
+                generation = self._generation
+
+        if queued:
+            self._requests.put((key, generation))
+
+        # The worker shuts itself down when idle, so restart it on demand
+        if self._pending and (self._worker is None or not self._worker.is_alive()):
+            self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+            self._worker.start()
+
+    def _worker_loop(self):
+        """Build queued chunks until the queue stays empty for a while"""
+        while True:
+            try:
+                key, generation = self._requests.get(timeout=1.0)
+            except queue.Empty:
+                return
+
+            with self._lock:
+                if generation != self._generation or key not in self._pending:
+                    continue
+
+            try:
+                chunk = self._build_chunk(key)
+            except Exception as e:
+                # Not stored, so the chunk stays drawn tile by tile and the next draw asks for it again
+                print(f"Failed to build tile chunk {key}: {e}")
+                with self._lock:
+                    self._pending.discard(key)
+                    self._failures[key] = self._failures.get(key, 0) + 1
+                continue
+
+            with self._lock:
+                if generation != self._generation:
+                    continue
+                self._pending.discard(key)
+                self._store(key, chunk)
+
+    def _build_chunk(self, key):
+        """Composite the tiles of one chunk into a surface, or None if it has no tiles"""
+        pass_index, cx, cy, hidden_layers = key
+        chunk_rect = self._chunk_rect(cx, cy)
+        tiles = self._tiles_for(key, chunk_rect)
+        if not tiles:
+            return None
+
+        chunk = pygame.Surface(chunk_rect.size, pygame.SRCALPHA)
+        chunk.fill((0, 0, 0, 0))
+        chunk.blits([(tile.image, (tile.rect.x - chunk_rect.x, tile.rect.y - chunk_rect.y)) for tile in tiles],
+                    doreturn=False)
+        return chunk
+
+    def _store(self, key, chunk):
+        """Add a built chunk to the LRU and evict the oldest chunks over the memory cap (lock held)"""
+        self._chunks[key] = chunk
+        if chunk is not None:
+            self._memory_used += chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+
+        while self._memory_used > self._memory_cap and len(self._chunks) > 1:
+            old_key, old_chunk = self._chunks.popitem(last=False)
+            if old_chunk is not None:
+                self._memory_used -= old_chunk.get_width() * old_chunk.get_height() * old_chunk.get_bytesize()
+
+class RegionStreamer:
+    """
+    Keeps the level content around a point loaded in square regions. Regions within the load
+    radius are prepared in a background thread and applied in one batch on the main thread;
+    loaded regions are only dropped once they are past the larger unload radius.
+    """
+    def __init__(self, width, height, prepare_region, load_region, unload_region,
+                 region_size=STREAM_REGION_SIZE, load_radius=STREAM_LOAD_RADIUS, unload_radius=STREAM_UNLOAD_RADIUS):
+        """
+        Initialize the region streamer.
+
+        Args:
+            width, height: Level size in pixels
+            prepare_region: Callable (region) -> batch, run in the background thread.
+                            It must not touch the physics space or the spatial grid
+            load_region: Callable (region, batch) that adds a prepared batch to the level
+            unload_region: Callable (region, batch) that removes a loaded batch again
+            region_size: Width and height of each region in pixels
+            load_radius: Regions within this many regions of the point are loaded
+            unload_radius: Regions further away than this are unloaded
+        """
+        self._width = width
+        self._height = height
+        self._prepare_region = prepare_region
+        self._load_region = load_region
+        self._unload_region = unload_region
+        self._region_size = region_size
+        self._load_radius = load_radius
+        self._unload_radius = max(unload_radius, load_radius)
+
+        self._columns = max(1, math.ceil(width / region_size))
+        self._rows = max(1, math.ceil(height / region_size))
+
+        self._loaded = {}  # (rx, ry) -> batch
+        self._pending = set()
+        self._requests = queue.Queue()
+        self._ready = queue.Queue()
+        self._generation = 0  # Bumped on clear so batches prepared before it are thrown away
+        self._worker = None
+
+    @property
+    def region_size(self):
+        """Get the region size"""
+        return self._region_size
+
+    @property
+    def region_count(self):
+        """Get the number of regions the level is split into"""
+        return self._columns * self._rows
+
+    @property
+    def loaded_regions(self):
+        """Get the regions that are currently loaded"""
+        return list(self._loaded)
+
+    def region_at(self, x, y):
+        """Get the region containing a world position, clamped to the level"""
+        rx = min(max(int(x // self._region_size), 0), self._columns - 1)
+        ry = min(max(int(y // self._region_size), 0), self._rows - 1)
+        return rx, ry
+
+    def region_rect(self, region):
+        """Get the world rectangle covered by a region"""
+        rx, ry = region
+        return pygame.Rect(rx * self._region_size, ry * self._region_size, self._region_size, self._region_size)
+
+    def _regions_around(self, region, radius):
+        """Get the regions within a radius of a region, clamped to the level"""
+        rx, ry = region
+        return [(x, y)
+                for y in range(max(0, ry - radius), min(self._rows, ry + radius + 1))
+                for x in range(max(0, rx - radius), min(self._columns, rx + radius + 1))]
+
+    def preload(self, x, y):
+        """Load every region within the load radius of a position right away, e.g. at spawn"""
+        for region in self._regions_around(self.region_at(x, y), self._load_radius):
+            if region not in self._loaded:
+                self._apply(region, self._prepare_region(region))
+
+    def update(self, x, y):
+        """Stream regions in and out around a position, call once per frame"""
+        center = self.region_at(x, y)
+
+        # Apply the batches the background thread has finished
+        while True:
+            try:
+                region, generation, batch = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.discard(region)
+            if generation == self._generation and batch is not None and region not in self._loaded:
+                self._apply(region, batch)
+
+        # The region under the position can't wait for the background thread
+        if center not in self._loaded:
+            self._apply(center, self._prepare_region(center))
+
+        for region in self._regions_around(center, self._load_radius):
+            if region not in self._loaded and region not in self._pending:
+                self._pending.add(region)
+                self._requests.put((region, self._generation))
+
+        # Unload only past the unload radius so moving back and forth over a border keeps regions loaded
+        cx, cy = center
+        for region in list(self._loaded):
+            if max(abs(region[0] - cx), abs(region[1] - cy)) > self._unload_radius:
+                self._unload_region(region, self._loaded.pop(region))
+
+        # The worker shuts itself down when idle, so restart it on demand
+        if self._pending and (self._worker is None or not self._worker.is_alive()):
+            self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+            self._worker.start()
+
+    def clear(self):
+        """Unload every region and forget about batches still being prepared"""
+        self._generation += 1
+        self._pending.clear()
+        for region in list(self._loaded):
+            self._unload_region(region, self._loaded.pop(region))
+
+    def _apply(self, region, batch):
+        """Add a prepared batch to the level and remember it for unloading"""
+        self._loaded[region] = batch
+        self._load_region(region, batch)
+
+    def _worker_loop(self):
+        """Prepare requested regions until the queue stays empty for a while"""
+        while True:
+            try:
+                region, generation = self._requests.get(timeout=1.0)
+            except queue.Empty:
+                return
+
+            if generation != self._generation:
+                continue
+
+            try:
+                batch = self._prepare_region(region)
+            except Exception as e:
+                print(f"Failed to prepare level region {region}: {e}")
+                batch = None
+
+            self._ready.put((region, generation, batch))
+
 class MapSystem:
     """Interactive map system that can be opened/closed with a key for any level."""
     
@@ -920,7 +2462,8 @@ class MapSystem:
     def _load_scroll_asset(self):
         """Load the scroll background asset"""
         try:
-            self._scroll_image = pygame.image.load(os.path.join("assets", "sprites", "map", "scroll.png")).convert_alpha()
+            scroll_path = os.path.join("assets", "sprites", "map", "scroll.png")
+            self._scroll_image = asset_cache.image(scroll_path)
             
             # Scale scroll to fill the entire screen while maintaining aspect ratio of 62:30
             aspect_ratio = 62 / 30
@@ -936,7 +2479,7 @@ class MapSystem:
                 scroll_height = scroll_width / aspect_ratio
                 
             # Scale scroll to calculated dimensions
-            self._scroll_image = pygame.transform.scale(self._scroll_image, (int(scroll_width), int(scroll_height)))
+            self._scroll_image = asset_cache.image(scroll_path, size=(scroll_width, scroll_height))
             
             # Position the scroll in the center of the screen
             self._scroll_rect = self._scroll_image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
@@ -1016,8 +2559,8 @@ class MapSystem:
     def _load_fonts(self):
         """Load fonts for the map system"""
         try:
-            self._font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 10)
-            self._message_font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 24)
+            self._font = asset_cache.font(os.path.join("assets", "Daydream.ttf"), 10)
+            self._message_font = asset_cache.font(os.path.join("assets", "Daydream.ttf"), 24)
         except:
             self._font = pygame.font.SysFont(None, 16)
             self._message_font = pygame.font.SysFont(None, 30)
@@ -1095,7 +2638,7 @@ class MapSystem:
             try:
                 if os.path.exists(path):
                     print(f"Attempting to load map from: {path}")
-                    self._map_image = pygame.image.load(path).convert_alpha()
+                    self._map_image = asset_cache.image(path)
                     self._current_map_path = path
                     
                     # Verify the image is valid
@@ -1530,20 +3073,9 @@ class MapSystem:
         overlay.fill((0, 0, 0, 100))
         screen.blit(overlay, (0, 0))
         
-        # Draw the "No map available" message
-        # Add a black outline effect
-        outline_offsets = [(-2, -2), (-2, 0), (-2, 2), (0, -2), (0, 2), (2, -2), (2, 0), (2, 2)]
-        # Render the outline in black
-        outline_color = (0, 0, 0)  # Black color (Red=0, Green=0, Blue=0)
-        outline_text = self._message_font.render("No map available!", True, outline_color)
-
-        # Draw the black outline
-        for offset in outline_offsets:
-            offset_pos = (self._no_map_text_rect.x + offset[0], self._no_map_text_rect.y + offset[1])
-            screen.blit(outline_text, offset_pos)
-
-        # Draw the white text on top of the outline
-        screen.blit(self._no_map_text, self._no_map_text_rect)
+        # Draw the "No map available" message with a black outline
+        text_renderer.draw(screen, "No map available!", 24, (255, 0, 0), (0, 0, 0), 2,
+                           center=self._no_map_text_rect.center)
     
     def _draw_map_content(self, screen):
         """Draw the actual map content and player position"""
@@ -1697,8 +3229,8 @@ class DialogueSystem:
         
         # Try to load a font for dialogue
         try:
-            self.font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 16)
-            self.name_font = pygame.font.Font(os.path.join("assets", "Daydream.ttf"), 24)
+            self.font = asset_cache.font(os.path.join("assets", "Daydream.ttf"), 16)
+            self.name_font = asset_cache.font(os.path.join("assets", "Daydream.ttf"), 24)
         except pygame.error:
             self.font = pygame.font.SysFont(None, 20)
             self.name_font = pygame.font.SysFont(None, 26)
@@ -1706,8 +3238,7 @@ class DialogueSystem:
         
         # Sound effect for text
         try:
-            self.text_sound = pygame.mixer.Sound(os.path.join("assets", "sounds", "text_blip.mp3"))
-            self.text_sound.set_volume(0.3)
+            self.text_sound = asset_cache.sound(os.path.join("assets", "sounds", "text_blip.mp3"), volume=0.3)
         except:
             self.text_sound = None
             print("Failed to load text sound effect")
@@ -1780,8 +3311,7 @@ class DialogueSystem:
         
         # Create "continue" indicator
         try:
-            self.continue_icon = pygame.image.load(os.path.join("assets", "sprites", "continue_arrow.png"))
-            self.continue_icon = pygame.transform.scale(self.continue_icon, (32, 32))
+            self.continue_icon = asset_cache.image(os.path.join("assets", "sprites", "continue_arrow.png"), size=(32, 32))
         except:
             self.continue_icon = pygame.Surface((32, 32), pygame.SRCALPHA)
             pygame.draw.polygon(self.continue_icon, (255, 255, 255), [(16, 0), (32, 16), (16, 32), (0, 16)])
@@ -2523,11 +4053,11 @@ class ResultsScreen:
         self.game_save = game_save
         
         # Enhanced font system with consistent sizing
-        self.font_title = pygame.font.Font(daFont, 36)      # Title
-        self.font_large = pygame.font.Font(daFont, 28)      # Rank
-        self.font_medium = pygame.font.Font(daFont, 20)     # Stats labels/values
-        self.font_small = pygame.font.Font(daFont, 16)      # "New Best!" text
-        self.font_tiny = pygame.font.Font(daFont, 12)       # Small details
+        self.font_title = asset_cache.font(daFont, 36)      # Title
+        self.font_large = asset_cache.font(daFont, 28)      # Rank
+        self.font_medium = asset_cache.font(daFont, 20)     # Stats labels/values
+        self.font_small = asset_cache.font(daFont, 16)      # "New Best!" text
+        self.font_tiny = asset_cache.font(daFont, 12)       # Small details
         
         self.animation_time = 0
         self.show_time = 0
@@ -3284,20 +4814,20 @@ class ResultsScreen:
                 # Apply horizontal shift for "New Best!" stats
                 shift = stat_info["shift_offset"]
                 
-                # Draw stat label
-                label_surf = self.font_medium.render(stat_info["label"], True, (220, 220, 220))
+                # Draw stat label; rendered text is shared, so fade a copy
+                label_surf = text_renderer.render(stat_info["label"], 20, (220, 220, 220)).copy()
                 label_surf.set_alpha(stat_info["alpha"])
                 label_rect = label_surf.get_rect(center=(base_x - 120 + shift, y_pos))
                 screen.blit(label_surf, label_rect)
                 
                 # Draw stat value with enhanced styling
-                value_surf = self.font_medium.render(stat_info["value"], True, stat_info["color"])
+                value_surf = text_renderer.glyphs(20, stat_info["color"]).render(stat_info["value"])
                 value_surf.set_alpha(stat_info["alpha"])
                 value_rect = value_surf.get_rect(center=(base_x + 80 + shift, y_pos))
                 
                 # Add glow effect for improved stats
                 if stat_info["is_best"]:
-                    glow_surf = self.font_medium.render(stat_info["value"], True, (255, 255, 255))
+                    glow_surf = text_renderer.glyphs(20, (255, 255, 255)).render(stat_info["value"])
                     glow_surf.set_alpha(min(stat_info["alpha"] // 3, 80))
                     for glow_offset in [(1, 1), (-1, -1), (1, -1), (-1, 1)]:
                         glow_rect = value_rect.copy()
@@ -3310,7 +4840,7 @@ class ResultsScreen:
                 # Draw "New Best!" indicator for ANY stat that's a best
                 if stat_info["is_best"] and stat_info["best_alpha"] > 0:
                     best_text = "New Best!"
-                    best_surf = self.font_small.render(best_text, True, (255, 215, 0))  # Gold color
+                    best_surf = text_renderer.render(best_text, 16, (255, 215, 0)).copy()  # Gold color
                     best_surf.set_alpha(stat_info["best_alpha"])
                     best_rect = best_surf.get_rect(center=(base_x + 200, y_pos))
                     
@@ -3341,7 +4871,7 @@ class ResultsScreen:
         scaled_size = max(10, min(int(60 * self.rank_scale), 120))
         
         try:
-            rank_font = pygame.font.Font(daFont, scaled_size)
+            rank_font = asset_cache.font(daFont, scaled_size)
             rank_text = f"RANK: {rank}"
             
             # Apply rank-specific modifications to color and alpha